@@ -0,0 +1,6 @@
+'''
+Benchmarks for isotopylog, written for airspeed velocity (asv). From the
+repository root, run ``asv run`` to benchmark the current commit, or
+``asv continuous master HEAD`` to compare against master and flag
+regressions in time or peak memory.
+'''
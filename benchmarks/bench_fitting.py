@@ -0,0 +1,144 @@
+'''
+Benchmarks for fitting heating experiment data, regularized HH20 inversion
+(including direct vs. iterative solvers), and Arrhenius regression of
+kDistributions. Each benchmark records wall time (``time_``) and peak process
+memory (``peakmem_``) using synthetic heating experiments generated
+in-process. Kernel caches are cleared within each timed call.
+
+Can be run directly (from the repository root) for a quick check without
+asv::
+
+	python -m benchmarks.bench_fitting
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#import packages
+import isotopylog as ipl
+
+from isotopylog.ratedata_helper import(
+	calc_L_curve,
+	fit_HH20inv,
+	)
+
+from .common import(
+	clear_caches,
+	make_experiment,
+	make_kds,
+	run,
+	)
+
+#inverting experiments for each model
+class InvertExperiment(object):
+	'''
+	``ipl.kDistribution.invert_experiment`` for each model type.
+	'''
+
+	params = [['PH12', 'Hea14', 'HH20', 'SE15'], [10, 50]]
+	param_names = ['model', 'nt']
+
+	warmup_time = 0
+
+	def setup(self, model, nt):
+		self.he = make_experiment(nt = nt)
+		ipl.set_fit_cache(False)
+
+	def time_invert_experiment(self, model, nt):
+		clear_caches()
+		ipl.kDistribution.invert_experiment(self.he, model = model)
+
+	def peakmem_invert_experiment(self, model, nt):
+		clear_caches()
+		ipl.kDistribution.invert_experiment(self.he, model = model)
+
+#regularized HH20 inversion
+class HH20Inversion(object):
+	'''
+	Regularized HH20 inversion, including L-curve omega selection.
+	'''
+
+	params = [[100, 300], [50, 150]]
+	param_names = ['nnu', 'nom']
+
+	#A is cached, so clear caches within each timed call and skip warmup;
+	# the on-disk fit cache is also disabled
+	number = 1
+	repeat = 3
+	timeout = 300
+	warmup_time = 0
+
+	def setup(self, nnu, nom):
+		self.he = make_experiment()
+		ipl.set_fit_cache(False)
+
+	def time_calc_L_curve(self, nnu, nom):
+		clear_caches()
+		calc_L_curve(self.he, nnu = nnu, nom = nom)
+
+	def peakmem_calc_L_curve(self, nnu, nom):
+		clear_caches()
+		calc_L_curve(self.he, nnu = nnu, nom = nom)
+
+	def time_fit_HH20inv(self, nnu, nom):
+		clear_caches()
+		fit_HH20inv(self.he, nnu = nnu, nom = nom)
+
+	def peakmem_fit_HH20inv(self, nnu, nom):
+		clear_caches()
+		fit_HH20inv(self.he, nnu = nnu, nom = nom)
+
+#direct vs. iterative solvers for regularized HH20 inversion
+class HH20InversionSolver(object):
+	'''
+	Regularized HH20 inversion at a fixed omega using the direct
+	(normal-equation nnls) and iterative (accelerated projected gradient)
+	solvers, over increasingly fine nu grids.
+	'''
+
+	params = [['direct', 'apg'], [300, 1000, 2000], [0.1, 1.]]
+	param_names = ['solver', 'nnu', 'omega']
+
+	number = 1
+	repeat = 3
+	timeout = 300
+	warmup_time = 0
+
+	def setup(self, solver, nnu, omega):
+		self.he = make_experiment()
+		ipl.set_fit_cache(False)
+
+	def time_fit_HH20inv(self, solver, nnu, omega):
+		clear_caches()
+		fit_HH20inv(self.he, nnu = nnu, omega = omega, solver = solver)
+
+	def peakmem_fit_HH20inv(self, solver, nnu, omega):
+		clear_caches()
+		fit_HH20inv(self.he, nnu = nnu, omega = omega, solver = solver)
+
+#Arrhenius regression and summary
+class EDistributionSummary(object):
+	'''
+	``ipl.EDistribution`` construction and summary, including the Arrhenius
+	regression of all kDistributions.
+	'''
+
+	params = [['Hea14', 'HH20', 'SE15'], [3, 10, 30]]
+	param_names = ['model', 'nT']
+
+	def setup(self, model, nT):
+		self.kds = make_kds(model = model, nT = nT)
+
+	def time_summary(self, model, nT):
+		ipl.EDistribution(self.kds).summary
+
+	def peakmem_summary(self, model, nT):
+		ipl.EDistribution(self.kds).summary
+
+if __name__ == '__main__':
+
+	run(InvertExperiment, HH20Inversion, HH20InversionSolver,
+		EDistributionSummary)
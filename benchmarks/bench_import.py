@@ -0,0 +1,75 @@
+'''
+Benchmarks for the time required to import isotopylog. Plotting (matplotlib)
+and table (pandas) dependencies are only imported when needed, so importing
+the package should not load either.
+
+Can be run directly to print the import time and check that neither package
+is loaded::
+
+	python benchmarks/bench_import.py
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#import packages
+import subprocess
+import sys
+
+#define the code used for timing import in a fresh interpreter
+_import_code = 'import isotopylog'
+
+#define function for timing import in a fresh process; asv runs each
+# timeraw_ benchmark in a new interpreter
+def timeraw_import_isotopylog():
+	'''
+	Time to import isotopylog in a fresh interpreter.
+	'''
+	return _import_code
+
+#define function for measuring import time outside of asv
+def measure_import(nrep = 5):
+	'''
+	Measures import time and lazily imported modules in fresh interpreters.
+
+	Parameters
+	----------
+
+	nrep : int
+		The number of fresh interpreters to time. Defaults to ``5``.
+
+	Returns
+	-------
+
+	t : float
+		The minimum import time, in seconds.
+
+	loaded : list
+		List of lazily imported modules that were nonetheless loaded.
+	'''
+
+	code = (
+		'import sys, time\n'
+		't = time.perf_counter()\n'
+		'%s\n'
+		'print(time.perf_counter() - t)\n'
+		'print(",".join(m for m in ("matplotlib", "pandas", "scipy.signal")'
+		' if m in sys.modules))\n' % _import_code
+		)
+
+	ts = []
+	for i in range(nrep):
+		out = subprocess.check_output([sys.executable, '-c', code])
+		t, loaded = out.decode().split('\n')[:2]
+		ts.append(float(t))
+
+	return min(ts), [m for m in loaded.split(',') if m]
+
+if __name__ == '__main__':
+
+	t, loaded = measure_import()
+	print('import isotopylog: %.3f s' % t)
+	print('lazily imported modules loaded at import: %s' % (loaded or 'none'))
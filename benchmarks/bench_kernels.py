@@ -0,0 +1,212 @@
+'''
+Benchmarks for model kernels, Jacobians, and calibration inversion. Each
+benchmark records wall time (``time_``) and peak process memory (``peakmem_``)
+and is parameterized over problem size.
+
+Can be run directly (from the repository root) for a quick check without
+asv::
+
+	python -m benchmarks.bench_kernels
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#import packages
+import numpy as np
+
+import isotopylog as ipl
+
+from isotopylog.calc_funcs import(
+	_calc_A,
+	_fHH20,
+	_fSE15,
+	_ghHea14,
+	_ghHH20,
+	_ghPH12,
+	_ghSE15,
+	_Jacobian,
+	)
+
+from .common import(
+	clear_caches,
+	make_history,
+	run,
+	)
+
+#HH20 model function for isothermal kernels
+class HH20Forward(object):
+	'''
+	Isothermal HH20 forward model and its A matrix.
+	'''
+
+	params = [[100, 1000, 10000], [100, 400, 1000]]
+	param_names = ['nt', 'nnu']
+
+	#A is cached, so clear caches within each timed call and skip warmup
+	number = 1
+	repeat = 5
+	warmup_time = 0
+
+	def setup(self, nt, nnu):
+		self.t = np.linspace(0, 3600*50, nt)
+		self.nu = np.linspace(-50, 10, nnu)
+
+	def time_fHH20(self, nt, nnu):
+		clear_caches()
+		_fHH20(self.t, -12., 3., 10, -50, nnu)
+
+	def peakmem_fHH20(self, nt, nnu):
+		clear_caches()
+		_fHH20(self.t, -12., 3., 10, -50, nnu)
+
+	def time_calc_A(self, nt, nnu):
+		clear_caches()
+		_calc_A(self.t, self.nu)
+
+	def peakmem_calc_A(self, nt, nnu):
+		clear_caches()
+		_calc_A(self.t, self.nu)
+
+#SE15 model function for isothermal kernels
+class SE15Forward(object):
+	'''
+	Isothermal SE15 forward model.
+	'''
+
+	params = [100, 1000, 10000]
+	param_names = ['nt']
+
+	#stochastic ratios are cached, so clear caches within each timed call
+	warmup_time = 0
+
+	def setup(self, nt):
+		self.t = np.linspace(0, 3600*50, nt)
+		self.T = 723.15*np.ones(nt)
+		self.d0 = np.array([0.6, 2., -5.])
+
+	def time_fSE15(self, nt):
+		clear_caches()
+		_fSE15(self.t, -8.7, -10.8, 0.11, self.d0, self.T)
+
+	def peakmem_fSE15(self, nt):
+		clear_caches()
+		_fSE15(self.t, -8.7, -10.8, 0.11, self.d0, self.T)
+
+#geologic history kernels for each model
+class GeologicHistory(object):
+	'''
+	Geologic history kernels for each model type.
+	'''
+
+	params = [['PH12', 'Hea14', 'HH20', 'SE15'], [100, 1000, 10000]]
+	param_names = ['model', 'nt']
+
+	warmup_time = 0
+
+	def setup(self, model, nt):
+		self.t, self.T, self.Deq = make_history(nt)
+
+	def _gh(self, model):
+		t, T, Deq = self.t, self.T, self.Deq
+		clear_caches()
+
+		if model == 'PH12':
+			return _ghPH12(t, 200., -20., 0.6, Deq, T, 400.)
+
+		elif model == 'Hea14':
+			return _ghHea14(t, 200., -20., 180., -22., 190., -21., 0.6, Deq,
+				T, 400.)
+
+		elif model == 'HH20':
+			return _ghHH20(t, 220., 24., -22., 0., 0.6, Deq, T, np.inf)
+
+		return _ghSE15(t, 200., -20., 210., -21., 0.1, 0.1, 0.6, 2., -5., T,
+			400.)
+
+	def time_gh(self, model, nt):
+		self._gh(model)
+
+	def peakmem_gh(self, model, nt):
+		self._gh(model)
+
+#geologic history, including uncertainty propagation
+class GeologicHistoryFull(object):
+	'''
+	``ipl.geologic_history`` using literature EDistributions, including
+	Jacobian-based uncertainty propagation.
+	'''
+
+	params = [['PH12', 'Hea14', 'HH20', 'SE15'], [100, 1000, 5000]]
+	param_names = ['model', 'nt']
+
+	warmup_time = 0
+
+	def setup(self, model, nt):
+		self.t, self.T, _ = make_history(nt)
+		self.ed = ipl.EDistribution.from_literature(
+			mineral = 'calcite',
+			reference = model)
+
+	def time_geologic_history(self, model, nt):
+		clear_caches()
+		ipl.geologic_history(self.t, self.T, self.ed, [0.6, 2., -5.],
+			d0_std = [0.01, 0., 0.])
+
+	def peakmem_geologic_history(self, model, nt):
+		clear_caches()
+		ipl.geologic_history(self.t, self.T, self.ed, [0.6, 2., -5.],
+			d0_std = [0.01, 0., 0.])
+
+#finite-difference Jacobian
+class Jacobian(object):
+	'''
+	Finite-difference Jacobian of the HH20 isothermal model.
+	'''
+
+	params = [[100, 1000, 10000], [100, 400]]
+	param_names = ['nt', 'nnu']
+
+	warmup_time = 0
+
+	def setup(self, nt, nnu):
+		self.t = np.linspace(0, 3600*50, nt)
+		self.p = np.array([-12., 3.])
+		self.f = lambda t, mu, sig: _fHH20(t, mu, sig, 10, -50, nnu)
+
+	def time_Jacobian(self, nt, nnu):
+		clear_caches()
+		_Jacobian(self.f, self.t, self.p)
+
+	def peakmem_Jacobian(self, nt, nnu):
+		clear_caches()
+		_Jacobian(self.f, self.t, self.p)
+
+#calibration inversion
+class TFromDeq(object):
+	'''
+	Inverting D-T calibrations using each method.
+	'''
+
+	params = [[1, 1000, 100000], ['exact', 'table']]
+	param_names = ['n', 'method']
+
+	def setup(self, n, method):
+		self.D = np.linspace(0.3, 0.7, n)
+
+		#build any interpolation table before timing
+		ipl.T_from_Deq(self.D, method = method)
+
+	def time_T_from_Deq(self, n, method):
+		ipl.T_from_Deq(self.D, method = method)
+
+	def peakmem_T_from_Deq(self, n, method):
+		ipl.T_from_Deq(self.D, method = method)
+
+if __name__ == '__main__':
+
+	run(HH20Forward, SE15Forward, GeologicHistory, GeologicHistoryFull,
+		Jacobian, TFromDeq)
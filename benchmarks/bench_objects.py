@@ -0,0 +1,88 @@
+'''
+Benchmarks for constructing ``ipl.kDistribution`` objects. Records wall time
+(``time_``) and peak process memory (``peakmem_``) for constructing many
+instances, and the traced memory retained per instance (``track_``), such
+that savings from the slotted representation can be re-measured against
+earlier commits (e.g., ``asv continuous <commit> HEAD``).
+
+Can be run directly (from the repository root) for a quick check without
+asv::
+
+	python -m benchmarks.bench_objects
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#import packages
+import tracemalloc
+
+import numpy as np
+
+import isotopylog as ipl
+
+from .common import run
+
+#make the arguments used to construct each kDistribution
+def _kd_args(model):
+	'''
+	Returns (params, model, T, kwargs) for a typical fitted kDistribution;
+	HH20 instances include regularized inverse results on a 300-node grid.
+	Arrays are shared between instances, such that only per-instance
+	overhead is measured.
+	'''
+
+	if model == 'PH12':
+		return [-7., 0.5], 'PH12', 723.15, {'params_cov' : np.eye(2),
+			'rmse' : 0.01, 'npt' : 20}
+
+	nu = np.linspace(-50, 10, 300)
+	rho = np.exp(-0.5*((nu + 12)/3)**2)
+
+	return [-12., 3.], 'HH20', 723.15, {'params_cov' : np.eye(2),
+		'rmse' : 0.01, 'npt' : 20, 'nu' : nu, 'rho_nu' : rho,
+		'rho_nu_inv' : rho, 'omega' : 1., 'res_inv' : 0.01, 'rgh_inv' : 0.1}
+
+#constructing kDistributions
+class KDistributionConstruction(object):
+	'''
+	Constructing many ``ipl.kDistribution`` instances, as done when
+	inverting many experiments or lazily expanding an ``ipl.EDistribution``.
+	'''
+
+	params = [['PH12', 'HH20'], [1000, 10000]]
+	param_names = ['model', 'n']
+
+	def setup(self, model, n):
+		self.args = _kd_args(model)
+
+	def _construct(self, n):
+		p, m, T, kw = self.args
+
+		return [ipl.kDistribution(p, m, T, **kw) for _ in range(n)]
+
+	def time_construct(self, model, n):
+		self._construct(n)
+
+	def peakmem_construct(self, model, n):
+		self._construct(n)
+
+	def track_bytes_per_instance(self, model, n):
+		tracemalloc.start()
+		kds = self._construct(n)
+		size, _ = tracemalloc.get_traced_memory()
+		tracemalloc.stop()
+
+		#keep instances alive until memory is measured
+		del kds
+
+		return size/n
+
+	track_bytes_per_instance.unit = 'bytes'
+
+if __name__ == '__main__':
+
+	run(KDistributionConstruction)
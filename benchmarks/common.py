@@ -0,0 +1,173 @@
+'''
+Shared helpers for isotopylog benchmarks. Generates synthetic heating
+experiments and geologic t-T histories in-process, such that benchmarks do not
+depend on any data files, and provides a simple runner for use without asv.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#import packages
+import inspect
+import itertools
+import time
+import tracemalloc
+
+import numpy as np
+
+import isotopylog as ipl
+
+from isotopylog.calc_funcs import(
+	_calc_A,
+	_calc_stoch_ratios,
+	_fHH20,
+	)
+
+#define function for clearing memoized kernels
+def clear_caches():
+	'''
+	Clears all in-memory caches of kernel results (the HH20 A matrix and
+	SE15 stochastic ratios). Called at the start of every timed benchmark
+	body that can hit these caches, such that repeated samples and asv
+	warmup time the kernels rather than cache lookups.
+	'''
+
+	_calc_A.cache_clear()
+	_calc_stoch_ratios.cache_clear()
+
+#define function for generating a synthetic heating experiment
+def make_experiment(nt = 20, T = 723.15, mu = -12., sig = 3., seed = 0):
+	'''
+	Generates a synthetic ``ipl.HeatingExperiment`` by forward-modeling a
+	lognormal rate distribution and adding Gaussian noise.
+
+	Parameters
+	----------
+
+	nt : int
+		The number of experimental time points. Defaults to ``20``.
+
+	T : float
+		The experimental temperature, in Kelvin. Defaults to ``723.15``.
+
+	mu : float
+		The mean of the lognormal rate distribution. Defaults to ``-12``.
+
+	sig : float
+		The standard deviation of the lognormal rate distribution. Defaults
+		to ``3``.
+
+	seed : int
+		Seed for the random number generator. Defaults to ``0``.
+
+	Returns
+	-------
+
+	he : isotopylog.HeatingExperiment
+		The synthetic heating experiment.
+	'''
+
+	rng = np.random.default_rng(seed)
+
+	#forward model D47 and add noise; d13C and d18O are used by SE15
+	tex = np.linspace(0, 3600*50, nt)
+	G = _fHH20(tex, mu, sig, 10, -50, 300)
+	Deq = ipl.Deq_from_T(T)
+
+	dex = np.column_stack([
+		G*(0.6 - Deq) + Deq + rng.normal(0, 0.005, nt),
+		rng.normal(2, 0.1, nt),
+		rng.normal(-5, 0.1, nt),
+		])
+	dex[0,0] = 0.6
+
+	dex_std = 0.01*np.ones([nt, 3])
+
+	return ipl.HeatingExperiment(dex, float(T), tex, dex_std = dex_std)
+
+#define function for generating kDistributions at several temperatures
+def make_kds(model = 'HH20', nT = 6):
+	'''
+	Generates a list of ``ipl.kDistribution`` instances, one for each of `nT`
+	synthetic heating experiments spanning 650--800 K, with rates increasing
+	with temperature.
+	'''
+
+	Ts = np.linspace(650, 800, nT)
+
+	return [ipl.kDistribution.invert_experiment(
+		make_experiment(T = T, mu = -12 + (T - 700)/20, seed = i),
+		model = model) for i, T in enumerate(Ts)]
+
+#define function for generating a geologic t-T history
+def make_history(nt = 1000):
+	'''
+	Generates a 20 Myr geologic t-T history (in seconds and Kelvin) with
+	oscillating temperatures, along with the corresponding Deq values.
+	'''
+
+	t = np.linspace(0, 20e6*365*24*3600, nt)
+	T = 373 + 100*np.sin(np.linspace(0, 3, nt))
+	Deq = ipl.Deq_from_T(T)
+
+	return t, T, Deq
+
+#define function for running benchmarks outside of asv
+def run(*classes):
+	'''
+	Runs each ``time_`` and ``peakmem_`` benchmark once for every parameter
+	combination and prints wall time and peak traced memory, along with the
+	value returned by each ``track_`` benchmark. Intended for
+	quick checks when asv is not installed; asv should be used for tracking
+	regressions.
+
+	Parameters
+	----------
+
+	classes : classes
+		The asv-style benchmark classes to run.
+	'''
+
+	for cls in classes:
+		params = getattr(cls, 'params', [])
+		names = getattr(cls, 'param_names', [])
+
+		#asv allows a single parameter list without nesting
+		if params and not isinstance(params[0], (list, tuple)):
+			params = [params]
+
+		methods = [n for n, _ in inspect.getmembers(cls, inspect.isfunction)
+			if n.startswith(('time_', 'peakmem_', 'track_'))]
+
+		for p in itertools.product(*params):
+			bench = cls()
+
+			if hasattr(bench, 'setup'):
+				bench.setup(*p)
+
+			pstr = ', '.join('%s=%s' % kv for kv in zip(names, p))
+
+			for n in methods:
+
+				#track benchmarks report their own value
+				if n.startswith('track_'):
+					v = getattr(bench, n)(*p)
+					unit = getattr(getattr(cls, n), 'unit', '')
+
+					print('%s.%s(%s): %.4g %s' % (cls.__name__, n, pstr, v,
+						unit))
+
+					continue
+
+				tracemalloc.start()
+				t0 = time.perf_counter()
+				getattr(bench, n)(*p)
+				dt = time.perf_counter() - t0
+				_, peak = tracemalloc.get_traced_memory()
+				tracemalloc.stop()
+
+				print('%s.%s(%s): %.4f s, %.1f MB' %
+					(cls.__name__, n, pstr, dt, peak/1e6))
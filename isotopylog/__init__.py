@@ -42,16 +42,47 @@ from .ratedata import(
 	)
 
 #import package-level functions:
+from .backends import(
+	get_backend,
+	set_backend,
+	)
+
 from .calc_funcs import(
+	dDeq_dT,
 	Deq_from_T,
 	T_from_Deq,
 	)
 
+from .dictionaries import(
+	register_calibration,
+	)
+
+from .fit_cache import(
+	clear_fit_cache,
+	fit_cache_info,
+	get_fit_cache,
+	set_fit_cache,
+	)
+
+from .instrumentation import(
+	get_instrumentation,
+	get_stats,
+	instrument,
+	reset_stats,
+	set_instrumentation,
+	stats_to_json,
+	)
+
 from .core_functions import(
 	derivatize,
 	geologic_history,
 	)
 
+from .serialization import(
+	load,
+	save,
+	)
+
 from .ratedata_helper import(
 	calc_L_curve,
 	fit_Arrhenius,
@@ -0,0 +1,345 @@
+'''
+This module contains the backends used for sequential time-stepping loops
+(geologic history recursions and backward Euler solutions) that cannot be
+vectorized for time-varying inputs. If numba is installed, loops are compiled
+to native code; otherwise, they are run using NumPy.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#set magic attributes
+__docformat__ = 'restructuredtext en'
+__all__ = ['backward_euler',
+		   'get_backend',
+		   'gh_recursion',
+		   'set_backend',
+		  ]
+
+#import packages
+import importlib.util
+import numpy as np
+
+#define loop functions; these are written using scalar operations only such
+# that numba can compile them directly
+
+#function for solving the geologic history recursion
+def _loop_gh_recursion(D0, Deq, K):
+	'''
+	Solves D[i] = (D[i-1] - Deq[i])*K[i] + Deq[i] one element at a time.
+	'''
+
+	nb, nt = K.shape
+	D = np.empty((nb, nt))
+
+	for j in range(nb):
+		D[j,0] = D0[j]
+
+		for i in range(1, nt):
+			D[j,i] = (D[j,i-1] - Deq[i])*K[j,i] + Deq[i]
+
+	return D
+
+#function for solving 2x2 linear systems using backward Euler
+def _loop_backward_euler(x0, A, B, t):
+	'''
+	Solves dx/dt = A x + B using backward Euler, with each 2x2 system solved
+	explicitly.
+	'''
+
+	nt = len(t)
+	x = np.empty((nt, 2))
+	x[0,0] = x0[0]
+	x[0,1] = x0[1]
+
+	for i in range(nt-1):
+		dt = t[i+1] - t[i]
+
+		#I - dt*A and right-hand side
+		m00 = 1 - dt*A[i,0]
+		m01 = -dt*A[i,1]
+		m10 = -dt*A[i,2]
+		m11 = 1 - dt*A[i,3]
+
+		r0 = x[i,0] + dt*B[i,0]
+		r1 = x[i,1] + dt*B[i,1]
+
+		det = m00*m11 - m01*m10
+
+		x[i+1,0] = (m11*r0 - m01*r1)/det
+		x[i+1,1] = (m00*r1 - m10*r0)/det
+
+	return x
+
+#NumPy versions of loop functions; since numpy element access is slow, these
+# either loop over python floats or vectorize over parameter sets
+
+#function for solving the geologic history recursion
+def _np_gh_recursion(D0, Deq, K):
+	'''
+	Solves D[i] = (D[i-1] - Deq[i])*K[i] + Deq[i] for each parameter set.
+	'''
+
+	nb, nt = K.shape
+
+	#for many parameter sets, vectorize over sets and loop over time
+	if nb >= 10:
+		D = np.zeros([nb, nt])
+		D[:,0] = D0
+
+		for i in range(1, nt):
+			D[:,i] = (D[:,i-1] - Deq[i])*K[:,i] + Deq[i]
+
+		return D
+
+	#otherwise, loop over python floats for each set
+	D = np.empty((nb, nt))
+	Deql = Deq.tolist()
+
+	for j in range(nb):
+		Dj = [float(D0[j])]
+		d = Dj[0]
+
+		for Ki, Deqi in zip(K[j,1:].tolist(), Deql[1:]):
+			d = (d - Deqi)*Ki + Deqi
+			Dj.append(d)
+
+		D[j] = Dj
+
+	return D
+
+#function for solving 2x2 linear systems using backward Euler
+def _np_backward_euler(x0, A, B, t):
+	'''
+	Solves dx/dt = A x + B using backward Euler, looping over python floats.
+	'''
+
+	x0i, x1i = x0.tolist()
+	x = [(x0i, x1i)]
+
+	for dt, Ai, Bi in zip(np.diff(t).tolist(), A.tolist(), B.tolist()):
+
+		#I - dt*A and right-hand side
+		m00 = 1 - dt*Ai[0]
+		m01 = -dt*Ai[1]
+		m10 = -dt*Ai[2]
+		m11 = 1 - dt*Ai[3]
+
+		r0 = x0i + dt*Bi[0]
+		r1 = x1i + dt*Bi[1]
+
+		det = m00*m11 - m01*m10
+
+		x0i = (m11*r0 - m01*r1)/det
+		x1i = (m00*r1 - m10*r0)/det
+
+		x.append((x0i, x1i))
+
+	return np.array(x)
+
+#store backend functions; numba functions are compiled on first use
+_funcs = {'numpy' : {'gh_recursion' : _np_gh_recursion,
+					 'backward_euler' : _np_backward_euler},
+		  'numba' : None,
+		 }
+
+#store currently selected backend
+_state = {'name' : None}
+
+#function to check for numba without importing it
+def _has_numba():
+	'''
+	Returns ``True`` if numba is installed.
+	'''
+	return importlib.util.find_spec('numba') is not None
+
+#function to get (and compile, if necessary) the current backend functions
+def _get_funcs():
+	'''
+	Returns the dictionary of loop functions for the current backend.
+	'''
+
+	if _state['name'] is None:
+		set_backend('auto')
+
+	name = _state['name']
+
+	if _funcs[name] is None:
+		import numba
+
+		_funcs[name] = {
+			'gh_recursion' : numba.njit(cache = True)(_loop_gh_recursion),
+			'backward_euler' : numba.njit(cache = True)(_loop_backward_euler),
+			}
+
+	return _funcs[name]
+
+#function to select the backend
+def set_backend(name = 'auto'):
+	'''
+	Selects the backend used for sequential time-stepping loops.
+
+	Parameters
+	----------
+
+	name : string
+		The backend to use. Options are: \n
+			``'auto'``: use numba if installed, otherwise NumPy \n
+			``'numba'``: compile loops to native code using numba \n
+			``'numpy'``: run loops using NumPy \n
+		Defaults to ``'auto'``.
+
+	Raises
+	------
+
+	ImportError
+		If ``name = 'numba'`` but numba is not installed.
+
+	TypeError
+		If `name` is not a string.
+
+	ValueError
+		If `name` is not an acceptable string.
+
+	See Also
+	--------
+
+	isotopylog.get_backend
+		Function to get the name of the current backend.
+
+	Notes
+	-----
+
+	Both backends give identical results to within floating-point rounding.
+	numba-compiled loops are compiled on first use and cached to disk.
+
+	Examples
+	--------
+
+	Forcing the NumPy backend, e.g., for debugging::
+
+		#import modules
+		import isotopylog as ipl
+
+		ipl.set_backend('numpy')
+	'''
+
+	if not isinstance(name, str):
+		nt = type(name).__name__
+
+		raise TypeError(
+			'unexpected backend of type %s. Must be string.' % nt)
+
+	if name == 'auto':
+		name = 'numba' if _has_numba() else 'numpy'
+
+	elif name == 'numba' and not _has_numba():
+		raise ImportError(
+			'numba backend requested but numba is not installed.')
+
+	elif name not in _funcs:
+		raise ValueError(
+			'unexpected backend %s. Must be "auto", "numba", or "numpy".'
+			% name)
+
+	_state['name'] = name
+
+#function to get the current backend
+def get_backend():
+	'''
+	Returns the name of the backend used for sequential time-stepping loops;
+	either ``'numba'`` or ``'numpy'``.
+
+	See Also
+	--------
+
+	isotopylog.set_backend
+		Function to select the backend.
+	'''
+
+	if _state['name'] is None:
+		set_backend('auto')
+
+	return _state['name']
+
+#function for solving the geologic history recursion
+def gh_recursion(D0, Deq, K):
+	'''
+	Solves D[i] = (D[i-1] - Deq[i])*K[i] + Deq[i], with D[0] = D0, for one
+	or many parameter sets using the current backend.
+
+	Parameters
+	----------
+
+	D0 : float or np.array
+		Starting D47 value(s). Length ``nb``, if array.
+
+	Deq : np.array
+		Equilibrium D47 value at each time point. Length ``nt``.
+
+	K : np.array
+		Fraction of disequilibrium remaining after each time step. Length
+		``nt``, or of shape [``nb`` x ``nt``].
+
+	Returns
+	-------
+
+	D : np.array
+		Resulting D47 values, of the same shape as `K`.
+	'''
+
+	K = np.asarray(K, dtype = float)
+	Deq = np.ascontiguousarray(Deq, dtype = float)
+
+	if K.ndim == 1:
+		D0 = np.array([D0], dtype = float)
+		return _get_funcs()['gh_recursion'](D0, Deq, K[None,:])[0]
+
+	D0 = np.ascontiguousarray(D0, dtype = float)
+
+	return _get_funcs()['gh_recursion'](D0, Deq, np.ascontiguousarray(K))
+
+#function for solving 2x2 linear systems using backward Euler
+def backward_euler(x0, A, B, t):
+	'''
+	Solves the linear system dx/dt = A(t) x + B(t), with x of length 2, using
+	the backward Euler method and the current backend.
+
+	Parameters
+	----------
+
+	x0 : array-like
+		Initial conditions. Length 2.
+
+	A : np.array
+		Flattened 2x2 matrix at each time point, in row-major order. Shape
+		[``nt`` x 4].
+
+	B : np.array
+		Forcing vector at each time point. Shape [``nt`` x 2].
+
+	t : np.array
+		Array of time points. Length ``nt``.
+
+	Returns
+	-------
+
+	x : np.array
+		Solution at each time point. Shape [``nt`` x 2].
+
+	Notes
+	-----
+
+	At each step, x[i+1] = (I - dt A[i])^-1 (x[i] + dt B[i]), with dt =
+	t[i+1] - t[i]; each 2x2 system is solved explicitly.
+	'''
+
+	return _get_funcs()['backward_euler'](
+		np.ascontiguousarray(x0, dtype = float),
+		np.ascontiguousarray(A, dtype = float),
+		np.ascontiguousarray(B, dtype = float),
+		np.ascontiguousarray(t, dtype = float),
+		)
@@ -11,11 +11,14 @@ from __future__ import(
 #set magic attributes
 __docformat__ = 'restructuredtext en'
 __all__ = ['_calc_A',
+		   '_calc_apg',
 		   '_calc_k',
+		   '_calc_normal_factor',
 		   '_calc_R',
 		   '_calc_R_stoch',
 		   '_calc_rmse',
 		   '_calc_Rpr',
+		   '_calc_stoch_ratios',
 		   '_fHea14',
 		   '_fHH20',
 		   '_fPH12',
@@ -29,28 +32,181 @@ __all__ = ['_calc_A',
 		  ]
 
 #import packages
+import hashlib
+import json
 import numpy as np
+import os
+import tempfile
+import threading
+import warnings
+
+#import containers for caching
+from collections import(
+	namedtuple,
+	OrderedDict,
+	)
+
+from functools import wraps
 
 #import linear algebra functions
-from numpy import eye
 from numpy.linalg import (
-	inv,
+	LinAlgError,
 	norm,
 	)
 
-#import optimization functions
-from scipy.optimize import(
-	minimize
+from scipy.linalg import(
+	cholesky,
+	eigh,
+	solve_triangular,
+	)
+
+#import sparse matrix functions
+from scipy.sparse import diags
+
+#import normal cdf for analytic Gaussian mass
+from scipy.special import ndtr
+
+#import backend functions for sequential loops
+from .backends import(
+	backward_euler,
+	gh_recursion,
 	)
 
 #import necessary isotopylog dictionaries
 from .dictionaries import(
-	caleqs,
+	_horner,
+	calibration_coeffs,
 	d47_isoparams,
 	)
 
+#import decorator for recording hot-path statistics
+from .instrumentation import instrumented
+
+#store calibration polynomial coefficients and branches once calculated, as
+# well as inverse tables once made or loaded
+_cal_branches = {}
+_inv_tables = {}
+
+#set named tuple for reporting cache statistics
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+#define function for generating hashable keys from array-like inputs
+def _array_key(*args, **kwargs):
+	'''
+	Generates a hashable key for a set of function inputs, replacing any
+	array-like inputs by a hash of their contents.
+
+	Parameters
+	----------
+
+	args : tuple
+		Positional arguments. Arrays, lists, and tuples of numbers are hashed
+		by dtype, shape, and contents; all other entries must be hashable.
+
+	kwargs : dict
+		Keyword arguments, treated identically to ``args``.
+
+	Returns
+	-------
+
+	key : tuple
+		Hashable key uniquely identifying the inputs.
+	'''
+
+	key = []
+
+	for a in args + tuple(v for _, v in sorted(kwargs.items())):
+
+		if isinstance(a, (np.ndarray, list, tuple)):
+			a = np.ascontiguousarray(a)
+			h = hashlib.sha1(a.view(np.uint8)).hexdigest()
+			key.append((a.dtype.str, a.shape, h))
+
+		else:
+			key.append(a)
+
+	return tuple(key + sorted(kwargs))
+
+#define decorator for bounded LRU caching of array-valued functions
+def _array_lru_cache(maxsize = 32):
+	'''
+	Decorator for bounded least-recently-used caching of functions whose
+	inputs include numpy arrays. Mirrors ``functools.lru_cache``, including
+	the ``cache_info()`` and ``cache_clear()`` function attributes, but keys
+	on a hash of array contents. Cached arrays are returned as read-only.
+
+	Parameters
+	----------
+
+	maxsize : int
+		The maximum number of results to store. Defaults to ``32``.
+
+	Returns
+	-------
+
+	decorator : function
+		The caching decorator.
+	'''
+
+	def decorator(func):
+
+		cache = OrderedDict()
+		stats = [0, 0] #hits, misses
+		lock = threading.Lock()
+
+		@wraps(func)
+		def wrapper(*args, **kwargs):
+
+			key = _array_key(*args, **kwargs)
+
+			with lock:
+				if key in cache:
+					cache.move_to_end(key)
+					stats[0] += 1
+					return cache[key]
+
+				stats[1] += 1
+
+			res = func(*args, **kwargs)
+
+			#make read-only so that callers cannot corrupt cached results
+			for r in (res if isinstance(res, tuple) else (res,)):
+				if isinstance(r, np.ndarray):
+					r.flags.writeable = False
+
+			with lock:
+				cache[key] = res
+
+				if len(cache) > maxsize:
+					cache.popitem(last = False)
+
+			return res
+
+		def cache_info():
+			'''
+			Reports cache hits, misses, maxsize, and current size.
+			'''
+			return CacheInfo(stats[0], stats[1], maxsize, len(cache))
+
+		def cache_clear():
+			'''
+			Clears the cache and resets statistics.
+			'''
+			with lock:
+				cache.clear()
+				stats[0] = stats[1] = 0
+
+		wrapper.cache_info = cache_info
+		wrapper.cache_clear = cache_clear
+
+		return wrapper
+
+	return decorator
+
 #define function for calculating HH20 inverse A matrix
-def _calc_A(t, nu):
+@instrumented
+@_array_lru_cache(maxsize = 32)
+def _calc_A(t, nu, dtype = np.float64):
 	'''
 	Function for calculating A matrix for HH20 data inversion.
 
@@ -63,11 +219,25 @@ def _calc_A(t, nu):
 	nu : array-like
 		Array of nu points, of length `nnu`.
 
+	dtype : np.dtype
+		The floating-point type of A; either ``np.float64`` or 
+		``np.float32``. Single-precision entries have absolute error below
+		1e-6 * dnu. Defaults to ``np.float64``.
+
 	Returns
 	-------
 
 	A : np.ndarray
-		2-D array A matrix, of shape [`n_t` x `n_nu`]
+		2-D array A matrix, of shape [`n_t` x `n_nu`]. Read-only.
+
+	Notes
+	-----
+
+	Results are stored in a bounded LRU cache keyed on a hash of `t` and `nu`,
+	so repeated inversions on the same time and nu grids (e.g., when sweeping
+	omega in ``calc_L_curve``) only calculate A once. Cache statistics are
+	available from ``_calc_A.cache_info()`` and the cache can be emptied
+	using ``_calc_A.cache_clear()``.
 
 	References
 	----------
@@ -77,18 +247,269 @@ def _calc_A(t, nu):
 	'''
 
 	#extract constants
-	nt = len(t)
-	nnu = len(nu)
+	dtype = np.dtype(dtype)
 	dnu = nu[1] - nu[0]
 
-	#define matrices
-	t_mat = np.outer(t, np.ones(nnu))
-	nu_mat = np.outer(np.ones(nt), nu)
+	#calculate by broadcasting, in the requested precision; k*t can overflow
+	# in single precision, in which case A correctly goes to zero
+	k = np.exp(np.asarray(nu, dtype = dtype))
 
-	A = np.exp(- np.exp(nu_mat) * t_mat) * dnu
+	with np.errstate(over = 'ignore'):
+		A = np.exp(-np.multiply.outer(np.asarray(t, dtype = dtype), k))
+
+	A *= dtype.type(dnu)
 	
 	return A
 
+#define function for solving HH20 inverse using projected gradients
+@instrumented
+def _calc_apg(
+	A,
+	g,
+	R,
+	omega,
+	dnu = None,
+	maxiter = 50000,
+	non_neg = True,
+	tol = 1e-8,
+	x0 = None,
+	):
+	'''
+	Solves the regularized HH20 inverse problem using an accelerated projected
+	gradient (FISTA) approach with adaptive restart. That is, minimizes:\n
+		0.5||A.p - g||^2 + 0.5 omega^2 ||R.p||^2 + 0.5 (dnu 1.p - 1)^2 \n
+	subject to p >= 0. Only matrix-vector products with A and R are required,
+	so memory scales as the size of A rather than [`nnu` x `nnu`].
+
+	Parameters
+	----------
+
+	A : np.ndarray
+		2-D array A matrix, of shape [`n_t` x `n_nu`].
+
+	g : np.ndarray
+		Array of G values to fit, of length `n_t`.
+
+	R : scipy.sparse matrix
+		2-D sparse Tikhonov regularization matrix, of shape [`n_nu+1` x `n_nu`].
+
+	omega : float
+		The Tikhonov regularization weighting factor.
+
+	dnu : None or float
+		The nu spacing used for the sum to unity constraint. If ``None``, no
+		sum to unity constraint is included. Defaults to ``None``.
+
+	maxiter : int
+		The maximum number of iterations. Defaults to ``50000``.
+
+	non_neg : boolean
+		Tells the function whether or not to project the solution onto the
+		non-negative orthant at each iteration. Defaults to ``True``.
+
+	tol : float
+		Relative tolerance for early stopping. Iterations stop once the norm
+		of the projected gradient (i.e., the KKT residual,
+		L||y - max(y - grad/L, 0)||) drops below `tol` times the norm of the
+		gradient at p = 0. Defaults to ``1e-8``.
+
+	x0 : None or np.ndarray
+		Initial guess, of length `n_nu`. If ``None``, starts from a flat
+		distribution. Defaults to ``None``.
+
+	Returns
+	-------
+
+	x : np.ndarray
+		The resulting solution, of length `n_nu`.
+
+	nit : int
+		The number of iterations performed.
+
+	Warns
+	-----
+
+	UserWarning
+		If `maxiter` iterations are reached before the projected gradient
+		drops below `tol`.
+
+	Notes
+	-----
+
+	The projected gradient bounds the distance to the true solution by
+	roughly pg/(omega^2 lambda_min(R'R)). For small omega, the problem is
+	therefore poorly conditioned and `tol` must be decreased (at the cost of
+	more iterations) to match the direct solution closely; residual and
+	roughness norms converge much faster than the solution itself. Each
+	backtracking check uses the exact quadratic curvature, d'.H.d, rather
+	than differences of objective values, which lose all precision near the
+	optimum.
+
+	References
+	----------
+
+	[1] Beck and Teboulle (2009) *SIAM J. Imaging Sci.*, **2**, 183--202.\n
+	[2] O'Donoghue and Candes (2015) *Found. Comput. Math.*, **15**, 715--732.
+	'''
+
+	#extract constants
+	nnu = A.shape[1]
+	w2 = omega**2
+
+	#define gradient and curvature using only matrix-vector products
+	def _grad(x):
+		gf = np.dot(A.T, np.dot(A, x) - g) + w2*R.T.dot(R.dot(x))
+
+		if dnu is not None:
+			gf += dnu*(dnu*np.sum(x) - 1)
+
+		return gf
+
+	#since the objective is quadratic, f(y + d) - f(y) - grad.d is exactly
+	# 0.5*d'.H.d; computing this directly avoids cancellation near the
+	# optimum, which would otherwise stall the backtracking line search
+	def _curv(d):
+		Ad = np.dot(A, d)
+		Rd = R.dot(d)
+		c = np.dot(Ad, Ad) + w2*np.dot(Rd, Rd)
+
+		if dnu is not None:
+			c += (dnu*np.sum(d))**2
+
+		return c
+
+	#estimate the Lipschitz constant of the gradient using power iteration
+	v = np.ones(nnu)/nnu**0.5
+	for _ in range(20):
+		v = np.dot(A.T, np.dot(A, v))
+		v = v/norm(v)
+
+	L = norm(np.dot(A, v))**2 + 4*w2
+	if dnu is not None:
+		L += nnu*dnu**2
+
+	#initialize
+	if x0 is None:
+		x = np.ones(nnu)/(nnu*(dnu or 1.))
+
+	else:
+		x = np.array(x0, dtype = float)
+
+	if non_neg is True:
+		x = np.clip(x, 0, None)
+
+	y = x.copy()
+	tk = 1.
+
+	#scale for the stopping criterion: gradient norm at p = 0, which is
+	# independent of the initial guess
+	gscale = norm(np.dot(A.T, g) + (dnu or 0.))
+	gscale = max(gscale, np.finfo(float).tiny)
+
+	#loop until converged
+	for nit in range(1, maxiter + 1):
+
+		gy = _grad(y)
+
+		#backtrack if the Lipschitz estimate is too small
+		while True:
+			xn = y - gy/L
+
+			if non_neg is True:
+				xn = np.clip(xn, 0, None)
+
+			d = xn - y
+
+			if _curv(d) <= L*np.dot(d, d):
+				break
+
+			L *= 2.
+
+		#Nesterov momentum with adaptive (gradient-mapping-based) restart
+		tn = 0.5*(1 + (1 + 4*tk**2)**0.5)
+		dx = xn - x
+
+		if np.dot(d, dx) < 0:
+			tn = 1.
+			y = xn.copy()
+
+		else:
+			y = xn + ((tk - 1)/tn)*dx
+
+		#check for convergence using the projected gradient at y, which is
+		# zero only if y satisfies the KKT conditions (a small step alone is
+		# not sufficient)
+		pg = L*norm(d)
+		x = xn
+		tk = tn
+
+		if pg <= tol*gscale:
+			break
+
+	#warn if not converged, since the returned solution may still be far
+	# from optimal
+	else:
+		warnings.warn(
+			'apg solver did not converge within %d iterations (relative'
+			' projected gradient %.1e > tol %.1e); the solution may differ'
+			' from the direct solution. Increase tol, increase omega, or use'
+			' solver = "direct".' % (maxiter, pg/gscale, tol), UserWarning)
+
+	return x, nit
+
+#define function for factoring regularized normal equations
+def _calc_normal_factor(K, b):
+	'''
+	Converts a set of normal equations, K.p = b, back into an equivalent
+	least-squares problem of size [`n` x `n`]. That is, finds M and y such
+	that minimizing ||M.p - y|| is identical to minimizing p'.K.p - 2b'.p.
+	This allows non-negative solvers such as ``scipy.optimize.nnls`` to be
+	used without ever materializing the stacked regularized matrix.
+
+	Parameters
+	----------
+
+	K : np.ndarray
+		2-D symmetric positive semi-definite array, of shape [`n` x `n`].
+
+	b : np.ndarray
+		Array of right-hand side values, of length `n`.
+
+	Returns
+	-------
+
+	M : np.ndarray
+		2-D array of the equivalent least-squares matrix, of shape [`n` x `n`].
+
+	y : np.ndarray
+		Array of the equivalent least-squares data, of length `n`.
+
+	Notes
+	-----
+
+	K is factored using a Cholesky decomposition, K = L.L'. If K is singular
+	(e.g., if no regularization is applied), this function instead uses the
+	eigenvalue decomposition of K and drops any null-space directions.
+	'''
+
+	try:
+		#K = L.L', so M = L' and y = L^-1.b
+		L = cholesky(K, lower = True)
+		M = L.T
+		y = solve_triangular(L, b, lower = True)
+
+	except LinAlgError:
+		#K is singular; use K = V.w.V' and keep only non-null directions
+		w, V = eigh(K)
+		s = np.sqrt(np.clip(w, 0, None))
+		M = s.reshape(-1,1) * V.T
+
+		y = np.zeros(len(b))
+		i = s > s.max()*len(b)*np.finfo(float).eps
+		y[i] = np.dot(V[:,i].T, b)/s[i]
+
+	return M, y
+
 #define function for calculating HH20 inverse R matrix
 def _calc_R(n):
 	'''
@@ -103,8 +524,16 @@ def _calc_R(n):
 	Returns
 	-------
 
-	R : np.ndarray
-		2-D array Tikhonov regularization matrix, of shape [`n+1` x `n`]
+	R : scipy.sparse.csr_matrix
+		2-D sparse Tikhonov regularization matrix, of shape [`n+1` x `n`]
+
+	Notes
+	-----
+
+	R is a first-derivative operator and is therefore stored in sparse banded
+	form, with ones on the main diagonal and negative ones on the first
+	sub-diagonal. The first and last rows ensure that pdf = 0 outside of the
+	E range specified.
 
 	References
 	----------
@@ -112,20 +541,14 @@ def _calc_R(n):
 	[1] Forney and Rothman (2012) *J. Royal Soc. Inter.*, **9**, 2255--2267.
 	'''
 
-	#pre-allocate matrix
-	R = np.zeros([n + 1, n])
-
-	#ensure pdf = 0 outside of E range specified
-	R[0, 0] = 1.0
-	R[-1, -1] = -1.0
-
-	#1st derivative operator
-	c = [-1, 1]
-
-	#populate matrix
-	for i, row in enumerate(R):
-		if i != 0 and i != n:
-			row[i - 1:i + 1] = c
+	#1st derivative operator, [-1, 1] on each interior row; the first and last
+	# rows (i.e., [1, 0, ...] and [..., 0, -1]) fall out of the same bands
+	R = diags(
+		[np.ones(n), -np.ones(n)],
+		[0, -1],
+		shape = (n + 1, n),
+		format = 'csr',
+		)
 
 	return R
 
@@ -133,16 +556,16 @@ def _calc_R(n):
 def _calc_R_stoch(d13C, d18O, iso_params):
 	'''
 	Calculates stochastic R45, R46, and R47 distributions for a given set of
-	d13C, d18O, and isotope parameters.
+	d13C, d18O, and isotope parameters. Vectorized over compositions.
 
 	Parameters
 	----------
 
-	d13C : float
+	d13C : float or array-like
 		13C composition, in permil VPDB.
 
-	d18O : float
-		18O composition, in permil VPDB.
+	d18O : float or array-like
+		18O composition, in permil VPDB. Must broadcast against `d13C`.
 
 	iso_params : string
 		String of the isotope parameters to use.
@@ -150,14 +573,14 @@ def _calc_R_stoch(d13C, d18O, iso_params):
 	Returns
 	-------
 
-	R45_stoch : float
-		Stochastic R45 value.
+	R45_stoch : float or np.ndarray
+		Stochastic R45 value(s), of the broadcast shape of `d13C` and `d18O`.
 
-	R46_stoch : float
-		Stochastic R46 value.
+	R46_stoch : float or np.ndarray
+		Stochastic R46 value(s).
 
-	R47_stoch : float
-		Stochastic R47 value.
+	R47_stoch : float or np.ndarray
+		Stochastic R47 value(s).
 
 	References
 	----------
@@ -169,8 +592,8 @@ def _calc_R_stoch(d13C, d18O, iso_params):
 	R13_vpdb, R18_vpdb, R17_vpdb, lam17 = d47_isoparams[iso_params]
 
 	#convert d13C and d18O into R13, R18
-	R13 = (d13C/1000 + 1)*R13_vpdb
-	R18 = (d18O/1000 + 1)*R18_vpdb
+	R13 = (np.asarray(d13C, dtype = float)/1000 + 1)*R13_vpdb
+	R18 = (np.asarray(d18O, dtype = float)/1000 + 1)*R18_vpdb
 
 	#calculate R17 using R18 and lam17
 	R17 = R17_vpdb * (R18 / R18_vpdb)**lam17
@@ -232,14 +655,14 @@ def _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z):
 	Parameters
 	----------
 
-	R45_stoch : float
-		Stochastic R45 value.
+	R45_stoch : float or array-like
+		Stochastic R45 value(s).
 
-	R46_stoch : float
-		Stochastic R46 value.
+	R46_stoch : float or array-like
+		Stochastic R46 value(s).
 
-	R47_stoch : float
-		Stochastic R47 value.
+	R47_stoch : float or array-like
+		Stochastic R47 value(s).
 
 	z : int
 		The mineral coordination number; z = 6 according to SE15.
@@ -247,8 +670,9 @@ def _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z):
 	Returns
 	-------
 
-	Rpr : float
-		The random (stochastic) pair concentration, normalied to [44].
+	Rpr : float or np.ndarray
+		The random (stochastic) pair concentration, normalied to [44]. Of the
+		broadcast shape of the inputted R values.
 
 	Notes
 	-----
@@ -263,6 +687,9 @@ def _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z):
 	'''
 
 	#calcualte f values
+	R45_stoch, R46_stoch, R47_stoch = (np.asarray(R, dtype = float) 
+		for R in (R45_stoch, R46_stoch, R47_stoch))
+
 	f44 = 1/(1 + R45_stoch + R46_stoch + R47_stoch)
 	f45 = R45_stoch*f44
 	f46 = R46_stoch*f44
@@ -278,7 +705,74 @@ def _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z):
 
 	return Rpr
 
+#function to calculate all stochastic ratios needed by SE15
+@_array_lru_cache(maxsize = 128)
+def _calc_stoch_ratios(d13C, d18O, iso_params, z):
+	'''
+	Calculates stochastic R45, R46, and R47 values and the random pair
+	concentration ratio for a set of bulk compositions. Vectorized over
+	compositions.
+
+	Parameters
+	----------
+
+	d13C : float or array-like
+		13C composition, in permil VPDB.
+
+	d18O : float or array-like
+		18O composition, in permil VPDB. Must broadcast against `d13C`.
+
+	iso_params : string
+		String of the isotope parameters to use.
+
+	z : int
+		The mineral coordination number; z = 6 according to SE15.
+
+	Returns
+	-------
+
+	R45_stoch : float or np.ndarray
+		Stochastic R45 value(s), of the broadcast shape of `d13C` and `d18O`.
+		Read-only if array.
+
+	R46_stoch : float or np.ndarray
+		Stochastic R46 value(s).
+
+	R47_stoch : float or np.ndarray
+		Stochastic R47 value(s).
+
+	Rpr : float or np.ndarray
+		The random (stochastic) pair concentration, normalized to [44].
+
+	Notes
+	-----
+
+	Results are stored in a bounded LRU cache keyed on (`d13C`, `d18O`,
+	`iso_params`, `z`), so repeated forward-model evaluations during SE15
+	fitting only calculate isotope ratios once per composition. Cache
+	statistics are available from ``_calc_stoch_ratios.cache_info()``.
+
+	See Also
+	--------
+
+	_calc_R_stoch
+		Function for calculating stochastic R values.
+
+	_calc_Rpr
+		Function for calculating the random pair concentration ratio.
+	'''
+
+	R45_stoch, R46_stoch, R47_stoch = _calc_R_stoch(d13C, d18O, iso_params)
+	Rpr = _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z)
+
+	#return scalars for scalar inputs
+	if Rpr.ndim == 0:
+		return float(R45_stoch), float(R46_stoch), float(R47_stoch), float(Rpr)
+
+	return R45_stoch, R46_stoch, R47_stoch, Rpr
+
 #function to fit Arrhenius plot
+@instrumented(kernel = True)
 def _fArrhenius(T, E, lnkref, Tref):
 	'''
 	Defines the Arrhenius plot that is linear in lnk vs. 1/T space and is
@@ -313,6 +807,7 @@ def _fArrhenius(T, E, lnkref, Tref):
 	return lnkref + (E/R)*(1/Tref - 1/T)
 
 #function to fit complete Hea14 model
+@instrumented(kernel = True)
 def _fHea14(t, lnkc, lnkd, lnk2, logG = True):
 	'''
 	Estimates G using the "transient defect/equilibrium defect" model of Henkes
@@ -364,7 +859,8 @@ def _fHea14(t, lnkc, lnkd, lnk2, logG = True):
 	return Ghat
 
 #function to fit data to lognormal decay k distribution for HH20  model
-def _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu):
+@instrumented(kernel = True)
+def _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu, dtype = np.float64):
 	'''
 	Function to calculate G as a function of time assuming a lognormal 
 	distribution of decay rates described by mu and sigma.
@@ -392,6 +888,12 @@ def _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu):
 	nnu : int
 		Number of nodes in nu array.
 
+	dtype : np.dtype
+		The floating-point type used for [``n_t`` x ``nnu``] temporaries;
+		either ``np.float64`` or ``np.float32``. In single precision, the
+		reacted fraction is accumulated in double precision and G has
+		absolute error below 1e-6. Defaults to ``np.float64``.
+
 	Returns
 	-------
 
@@ -410,6 +912,10 @@ def _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu):
 	dnu = nu[1] - nu[0]
 	rho = _Gaussian(nu, mu_nu, sig_nu)
 
+	#in single precision, accumulate the reacted fraction, 1 - e^(-k*t)
+	if np.dtype(dtype) != np.float64:
+		return _fHH20_single(t, nu, dnu, rho, dtype)
+
 	#make matrices
 	t_mat = np.outer(t, np.ones(nnu))
 	nu_mat = np.outer(np.ones(nt), nu)
@@ -421,7 +927,30 @@ def _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu):
 
 	return G
 
+#function to calculate HH20 G values using single-precision temporaries
+def _fHH20_single(t, nu, dnu, rho, dtype):
+	'''
+	Calculates G = integral(rho * e^(-k*t)) as integral(rho) minus the
+	reacted fraction, integral(rho * (1 - e^(-k*t))). Elementwise terms are
+	single precision and sums are double precision, such that G keeps full
+	relative precision when little has reacted.
+	'''
+
+	with np.errstate(over = 'ignore'):
+		y = np.multiply.outer(
+			np.asarray(t, dtype = dtype), 
+			np.exp(nu).astype(dtype)
+			)
+
+	#y = -(1 - e^(-k*t)) * rho, computed in place
+	np.negative(y, out = y)
+	np.expm1(y, out = y)
+	y *= rho.astype(dtype)
+
+	return np.sum(rho)*dnu + np.sum(y, axis = 1, dtype = np.float64)*dnu
+
 #function to fit complete PH12 model
+@instrumented(kernel = True)
 def _fPH12(t, lnk, intercept, logG = True):
 	'''
 	Defines the pseudo-first order model of Passey and Henkes (2012).
@@ -463,6 +992,7 @@ def _fPH12(t, lnk, intercept, logG = True):
 	return Ghat
 
 #function to fit SE15 model using backward Euler
+@instrumented(kernel = True)
 def _fSE15(
 	t, 
 	lnk1, 
@@ -568,7 +1098,8 @@ def _fSE15(
 	d13C = d0[1]
 	d18O = d0[2]
 
-	R45_stoch, R46_stoch, R47_stoch = _calc_R_stoch(d13C, d18O, iso_params) 
+	R45_stoch, R46_stoch, R47_stoch, Rp_r = _calc_stoch_ratios(
+		d13C, d18O, iso_params, z)
 
 	#function will solve for variables in the following format:
 	# x = R47
@@ -592,7 +1123,6 @@ def _fSE15(
 		)
 
 	R47_eq = (D47_eq/1000 + 1)*R47_stoch
-	Rp_r = _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z)
 
 	b = (a*R47_eq/Rp_r)*np.exp(-mp/T)
 
@@ -625,21 +1155,8 @@ def _fSE15(
 
 	Rp_0 = Rp_r*np.exp(mp/Teq_0)
 
-	x = np.zeros([nt, 2])
-	x[0,:] = [R47_0, Rp_0]
-
-	#loop through each time points and solve backward Euler problem
-	for i in range(nt-1):
-
-		#get A matrix and B array for that time point
-		Ai = A[i,:].reshape(2,2)
-		Bi = B[i,:]
-
-		#calculate inverted A
-		Ainv = inv(eye(2) - (t[i+1] - t[i])*Ai)
-
-		#calculate x at next time step
-		x[i+1,:] = np.dot(Ainv, (x[i,:] + (t[i+1] - t[i])*Bi))
+	#solve backward Euler problem through each time point
+	x = backward_euler([R47_0, Rp_0], A, B, t)
 
 	#convert back to meaningful units
 	D47 = (x[:,0]/R47_stoch - 1)*1000
@@ -695,6 +1212,7 @@ def _Gaussian(x, mu, sigma):
 	return y
 
 #function for calcualting geologic history with Hea14 model
+@instrumented(kernel = True)
 def _ghHea14(t, Ec, lnkcref, Ed, lnkdref, E2, lnk2ref, D0, Deq, T, Tref):
 	'''
 	Calculates the D47 value for a given geologic t-T history using the Hea14
@@ -754,7 +1272,6 @@ def _ghHea14(t, Ec, lnkcref, Ed, lnkdref, E2, lnk2ref, D0, Deq, T, Tref):
 	'''
 
 	#get constants
-	nt = len(t)
 	dt = np.gradient(t)
 	R = 8.314/1000 #in kJ/mol/K
 
@@ -764,20 +1281,29 @@ def _ghHea14(t, Ec, lnkcref, Ed, lnkdref, E2, lnk2ref, D0, Deq, T, Tref):
 	kappad = np.exp(lnkdref + (Ed/R)*(1/Tref - 1/T))
 	kappa2 = np.exp(lnk2ref + (E2/R)*(1/Tref - 1/T))
 
-	#pre-allocate D array
-	D = np.zeros(nt)
-	D[0] = D0
-
-	#loop through and solve for D at each time point
-	for i in range(1,nt):
+	#fraction of disequilibrium remaining after each time step
+	K = np.exp(-kappac*dt + (kappad/kappa2)*(np.exp(-kappa2*dt) - 1))
 
-		D[i] = (D[i-1] - Deq[i])*np.exp(-kappac[i]*dt[i] + \
-			(kappad[i]/kappa2[i])*(np.exp(-kappa2[i]*dt[i]) - 1)) + Deq[i]
+	#solve for D at each time point
+	D = gh_recursion(D0, Deq, K)
 
 	return D
 
 #function for calcualting geologic history with HH20 model
-def _ghHH20(t, Emu, lnkmuref, Esig, lnksigref, D0, Deq, T, Tref, nnu = 400):
+@instrumented(kernel = True)
+def _ghHH20(
+	t, 
+	Emu, 
+	lnkmuref, 
+	Esig, 
+	lnksigref, 
+	D0, 
+	Deq, 
+	T, 
+	Tref, 
+	nnu = 400, 
+	dtype = np.float64
+	):
 	'''
 	Calculates the D47 value for a given geologic t-T history using the HH20
 	model.
@@ -820,6 +1346,10 @@ def _ghHH20(t, Emu, lnkmuref, Esig, lnksigref, D0, Deq, T, Tref, nnu = 400):
 	nnu : int
 		The number of points to use in the nu array. Defaults to ``400``.
 
+	dtype : np.dtype
+		The floating-point type used for [``nnu`` x ``nt``] temporaries;
+		either ``np.float64`` or ``np.float32``. Defaults to ``np.float64``.
+
 	Returns
 	-------
 
@@ -827,6 +1357,18 @@ def _ghHH20(t, Emu, lnkmuref, Esig, lnksigref, D0, Deq, T, Tref, nnu = 400):
 		Array of resulting D47 values, referenced to the same reference frame
 		and D-T calibration used for D0 and Deq. Of length ``nt``.
 
+	Notes
+	-----
+
+	In single precision, the fraction remaining after each step, kappa, is
+	calculated as the (analytic) mass of the truncated nu distribution minus
+	the reacted fraction, integral(rho * (1 - e^(-k*dt))). The reacted
+	fraction is evaluated elementwise in single precision and summed in 
+	double precision, so kappa keeps full relative precision when k*dt is 
+	small and rounding errors do not accumulate over many time steps. D 
+	differs from double precision by less than 1e-6 permil, independent of
+	``nt``.
+
 	References
 	----------
 
@@ -834,7 +1376,6 @@ def _ghHH20(t, Emu, lnkmuref, Esig, lnksigref, D0, Deq, T, Tref, nnu = 400):
 	'''
 
 	#get constants
-	nt = len(t)
 	dt = np.gradient(t)
 	R = 8.314/1000 #in kJ/mol/K
 
@@ -854,25 +1395,62 @@ def _ghHH20(t, Emu, lnkmuref, Esig, lnksigref, D0, Deq, T, Tref, nnu = 400):
 	nu = np.linspace(nu_min, nu_max, nnu)
 	dnu = nu[1] - nu[0]
 
-	#then, make into matrix
-	rhonu = _Gaussian(nu, nu_mu, nu_sig)
+	#in single precision, calculate kappa from the reacted fraction
+	if np.dtype(dtype) != np.float64:
+		kappa = _calc_kappa_single(nu, dnu, nu_mu, nu_sig, dt, dtype)
 
-	#make array of kappa = integral(rho_nu * e^(-k*dt))
-	b = np.exp(-np.outer(np.exp(nu), dt))
-	kappa = np.sum(rhonu * b * dnu, axis = 0)
+	else:
 
-	#pre-allocate D array
-	D = np.zeros(nt)
-	D[0] = D0
+		#then, make into matrix
+		rhonu = _Gaussian(nu, nu_mu, nu_sig)
 
-	#loop through and solve for D at each time point
-	for i in range(1,nt):
+		#make array of kappa = integral(rho_nu * e^(-k*dt))
+		b = np.exp(-np.outer(np.exp(nu), dt))
+		kappa = np.sum(rhonu * b * dnu, axis = 0)
 
-		D[i] = (D[i-1] - Deq[i])*kappa[i] + Deq[i]
+	#solve for D at each time point
+	D = gh_recursion(D0, Deq, kappa)
 
 	return D
 
+#function to calculate HH20 kappa values using single-precision temporaries
+def _calc_kappa_single(nu, dnu, nu_mu, nu_sig, dt, dtype):
+	'''
+	Calculates kappa = integral(rho_nu * e^(-k*dt)) at each time point as the
+	mass of the Gaussian on the (truncated) nu grid minus the reacted 
+	fraction. Only [nnu x nt] temporaries are single precision; the mass is
+	calculated analytically and sums are double precision.
+	'''
+
+	dtype = np.dtype(dtype)
+
+	#unnormalized Gaussian, computed in place
+	x = np.subtract.outer(nu.astype(dtype), nu_mu.astype(dtype))
+	x /= nu_sig.astype(dtype)
+	x *= x
+	x *= dtype.type(-0.5)
+	np.exp(x, out = x)
+
+	#reacted fraction for each nu, -(1 - e^(-k*dt)), computed in place
+	with np.errstate(over = 'ignore'):
+		y = np.multiply.outer(np.exp(nu).astype(dtype), dt.astype(dtype))
+
+	np.negative(y, out = y)
+	np.expm1(y, out = y)
+
+	x *= y
+	q = -np.sum(x, axis = 0, dtype = np.float64)
+
+	#Gaussian normalization and mass within the nu grid, treating each node
+	# as spanning +/- dnu/2
+	s = dnu/(nu_sig*(2*np.pi)**0.5)
+	m = ndtr((nu[-1] + dnu/2 - nu_mu)/nu_sig) - \
+		ndtr((nu[0] - dnu/2 - nu_mu)/nu_sig)
+
+	return m - q*s
+
 #function for calcualting geologic history with PH12 model
+@instrumented(kernel = True)
 def _ghPH12(t, E, lnkref, D0, Deq, T, Tref):
 	'''
 	Calculates the D47 value for a given geologic t-T history using the PH12
@@ -920,7 +1498,6 @@ def _ghPH12(t, E, lnkref, D0, Deq, T, Tref):
 	'''
 
 	#get constants
-	nt = len(t)
 	dt = np.gradient(t)
 	R = 8.314/1000 #in kJ/mol/K
 
@@ -928,18 +1505,13 @@ def _ghPH12(t, E, lnkref, D0, Deq, T, Tref):
 	# This is the only part that is model-specific
 	kappa = np.exp(lnkref + (E/R)*(1/Tref - 1/T))
 
-	#pre-allocate D array
-	D = np.zeros(nt)
-	D[0] = D0
-
-	#loop through and solve for D at each time point
-	for i in range(1,nt):
-
-		D[i] = (D[i-1] - Deq[i])*np.exp(-kappa[i]*dt[i]) + Deq[i]
+	#solve for D at each time point
+	D = gh_recursion(D0, Deq, np.exp(-kappa*dt))
 
 	return D
 
 #function for calcualting geologic history with SE15 model
+@instrumented(kernel = True)
 def _ghSE15(
 	t, 
 	E1, 
@@ -1061,7 +1633,8 @@ def _ghSE15(
 	nt = len(t)
 	R = 8.314/1000 #in kJ/mol/K
 
-	R45_stoch, R46_stoch, R47_stoch = _calc_R_stoch(d13C, d18O, iso_params)
+	R45_stoch, R46_stoch, R47_stoch, Rp_r = _calc_stoch_ratios(
+		d13C, d18O, iso_params, z)
 
 	#get k values at each temperature
 	lnk1 = lnk1ref + (E1/R)*(1/Tref - 1/T)
@@ -1090,7 +1663,6 @@ def _ghSE15(
 		)
 
 	R47_eq = (D47_eq/1000 + 1)*R47_stoch
-	Rp_r = _calc_Rpr(R45_stoch, R46_stoch, R47_stoch, z)
 
 	b = (a*R47_eq/Rp_r)*np.exp(-mp/T)
 
@@ -1123,21 +1695,8 @@ def _ghSE15(
 
 	Rp_0 = Rp_r*np.exp(mp[0]/Teq_0)
 
-	x = np.zeros([nt, 2])
-	x[0,:] = [R47_0, Rp_0]
-
-	#loop through each time points and solve backward Euler problem
-	for i in range(nt-1):
-
-		#get A matrix and B array for that time point
-		Ai = A[i,:].reshape(2,2)
-		Bi = B[i,:]
-
-		#calculate inverted A
-		Ainv = inv(eye(2) - (t[i+1] - t[i])*Ai)
-
-		#calculate x at next time step
-		x[i+1,:] = np.dot(Ainv, (x[i,:] + (t[i+1] - t[i])*Bi))
+	#solve backward Euler problem through each time point
+	x = backward_euler([R47_0, Rp_0], A, B, t)
 
 	#convert back to meaningful units
 	D47 = (x[:,0]/R47_stoch - 1)*1000
@@ -1147,6 +1706,7 @@ def _ghSE15(
 	return D47, Dp
 
 #function for estimating Jacobian matrices for error propagation
+@instrumented
 def _Jacobian(f, t, p, eps = 1e-6):
 	'''
 	Estimates the Jacobian matrix of derivatives by perturbing each paramter
@@ -1177,7 +1737,7 @@ def _Jacobian(f, t, p, eps = 1e-6):
 	#extract constants and pre-allocate array
 	npar = len(p)
 	nt = len(t)
-	J = np.zeros([nt, npar], dtype = np.float)
+	J = np.zeros([nt, npar], dtype = float)
 
 	#loop through each parameter and estimate derivative when perturbed
 	for i in range(npar):
@@ -1195,7 +1755,320 @@ def _Jacobian(f, t, p, eps = 1e-6):
 
 	return J
 
+#function to extract the physical branch of a calibration equation
+def _calc_cal_branch(calibration, ref_frame, ngrid = 512):
+	'''
+	Determines the x range and a monotonic grid of the physical branch of a
+	calibration equation, written as a polynomial in x = 1/T, used for 
+	inversion. Results are stored for each calibration and reference frame.
+
+	Parameters
+	----------
+
+	calibration : string
+		The D-T calibration curve; a key in ``cal_coeffs``.
+
+	ref_frame : string
+		The reference frame.
+
+	ngrid : int
+		The number of grid points along the physical branch. Defaults to
+		``512``.
+
+	Returns
+	-------
+
+	c : np.ndarray
+		Polynomial coefficients in increasing order; that is, 
+		D = c[0] + c[1]*x + c[2]*x**2 + ...
+
+	xa : float
+		Lower x bound (i.e., highest T) of the physical branch.
+
+	xb : float
+		Upper x bound (i.e., lowest T) of the physical branch.
+
+	xg : np.ndarray
+		Grid of x values spanning the physical branch, in increasing order.
+
+	Dg : np.ndarray
+		Calibration D values at each grid point, in increasing order.
+
+	Notes
+	-----
+
+	The physical branch is the monotonic region of the
+	polynomial containing T = 350 K, bounded by the nearest real, positive
+	roots of the derivative. If no such root exists at low T, the branch is
+	capped at T = 10 K.
+	'''
+
+	c = calibration_coeffs(calibration, ref_frame)
+
+	#include coefficients in key such that re-registered calibrations are
+	# never matched to stale branches
+	key = (calibration, ref_frame, c.tobytes())
+
+	if key not in _cal_branches:
+
+		#find turning points bracketing T = 350 K
+		xr = 1/350.
+		cp = np.roots((c[1:]*np.arange(1, len(c)))[::-1])
+		cp = np.real(cp[np.isreal(cp) & (np.real(cp) > 0)])
+
+		xa = np.max(cp[cp < xr], initial = 0.)
+		xb = np.min(cp[cp > xr], initial = 0.1)
+
+		#make monotonic grid, with D increasing in x
+		xg = np.linspace(xa, xb, ngrid)
+		Dg = _horner(xg, c)
+
+		if Dg[0] > Dg[-1]:
+			xg, Dg = xg[::-1], Dg[::-1]
+
+		_cal_branches[key] = (c, xa, xb, xg, Dg)
+
+	return _cal_branches[key]
+
+#function to exactly solve calibration equations for T
+def _calc_T_exact(D, calibration, ref_frame):
+	'''
+	Solves a calibration equation for T at each inputted D value using 
+	batched Newton iterations in x = 1/T, bounded by the physical branch.
+
+	Parameters
+	----------
+
+	D : np.ndarray
+		1d array of clumped isotope values.
+
+	calibration : string
+		The D-T calibration curve; a key in ``cal_coeffs``.
+
+	ref_frame : string
+		The reference frame.
+
+	Returns
+	-------
+
+	T : np.ndarray
+		1d array of resulting temperatures, in Kelvin. Values outside of the
+		range spanned by the physical branch are ``np.nan``.
+
+	See Also
+	--------
+
+	_calc_cal_branch
+		Function for determining calibration polynomial coefficients and the
+		physical branch.
+	'''
+
+	#extract polynomial and physical branch
+	c, xa, xb, xg, Dg = _calc_cal_branch(calibration, ref_frame)
+
+	#set values outside of the branch range to nan
+	out = (D < Dg[0]) | (D > Dg[-1]) | np.isnan(D)
+	D = np.where(out, Dg[0], D)
+
+	#get bracketing grid points and initial guess by interpolating grid;
+	# Dg is increasing, so p(a) <= D <= p(b)
+	j = np.clip(np.searchsorted(Dg, D), 1, len(Dg) - 1)
+	a = xg[j-1]
+	b = xg[j]
+
+	x = np.interp(D, Dg, xg)
+
+	#polynomial derivative coefficients
+	dc = c[1:]*np.arange(1, len(c))
+
+	#batched Newton iterations, falling back to bisection for any step that
+	# leaves the bracket
+	for i in range(100):
+		r = _horner(x, c) - D
+		fp = _horner(x, dc)
+
+		#update bracket
+		a = np.where(r <= 0, x, a)
+		b = np.where(r <= 0, b, x)
+
+		with np.errstate(divide = 'ignore', invalid = 'ignore'):
+			xn = x - r/fp
+
+		inb = (xn - a)*(xn - b) <= 0
+		xn = np.where(inb, xn, (a + b)/2)
+
+		dx = np.abs(xn - x)
+		x = xn
+
+		if not (dx > 4*np.finfo(float).eps*x).any():
+			break
+
+	x[out] = np.nan
+
+	return 1/x
+
+#function to make monotone inverse tables for calibration equations
+def _calc_inv_table(
+	calibration,
+	ref_frame,
+	tol = 1e-3,
+	T_range = (250., 1500.),
+	):
+	'''
+	Makes (or loads) a high-resolution table of D and T values for linear
+	interpolation of a calibration equation inverse. Tables are made on first
+	use, saved to the isotopylog cache directory, and loaded as read-only
+	memory maps thereafter, such that worker processes share a single copy.
+
+	Parameters
+	----------
+
+	calibration : string
+		The D-T calibration curve; a key in ``cal_coeffs``.
+
+	ref_frame : string
+		The reference frame.
+
+	tol : float
+		The maximum allowed interpolation error, in Kelvin. Defaults to 
+		``1e-3``.
+
+	T_range : tuple
+		The (minimum, maximum) temperature covered by the table, in Kelvin.
+		Clipped to the physical branch of the calibration. Defaults to 
+		``(250, 1500)``.
+
+	Returns
+	-------
+
+	Dt : np.ndarray
+		Uniformly spaced, increasing D values.
+
+	Tt : np.ndarray
+		The exact temperature at each value in `Dt`, in Kelvin.
+
+	err : float
+		The measured maximum interpolation error, in Kelvin; always less than
+		`tol`.
+
+	Notes
+	-----
+
+	The number of table entries is first estimated from the linear 
+	interpolation error bound, h**2/8 max|d2T/dD2|, with d2T/dD2 calculated
+	analytically and sampled densely over the table range. Error is then
+	measured against the exact solution at the quarter, half, and 
+	three-quarter points of every interval, and the table is doubled in size
+	until the measured error is below `tol`.
+
+	Tables are stored in the directory given by the ``ISOTOPYLOG_CACHE_DIR``
+	environment variable (defaults to ``~/.cache/isotopylog``). File names
+	include a hash of the calibration coefficients, `tol`, and `T_range`, so 
+	changed inputs never reuse stale tables. If the directory cannot be 
+	written to, tables are kept in memory only.
+	'''
+
+	#extract polynomial and physical branch
+	c, xa, xb, xg, Dg = _calc_cal_branch(calibration, ref_frame)
+
+	#make file name from a hash of all inputs
+	h = hashlib.sha1(np.ascontiguousarray(c).tobytes())
+	h.update(np.array([tol, T_range[0], T_range[1]], dtype = float).tobytes())
+	name = 'invtab_%s_%s_%s' % (calibration, ref_frame, h.hexdigest()[:16])
+
+	if name in _inv_tables:
+		return _inv_tables[name]
+
+	#load from cache directory if it exists
+	path = os.path.join(_cache_dir(), name)
+
+	try:
+		with open(path + '.json') as f:
+			err = json.load(f)['err']
+
+		tab = np.load(path + '.npy', mmap_mode = 'r')
+		_inv_tables[name] = (tab[0], tab[1], err)
+
+		return _inv_tables[name]
+
+	except (OSError, ValueError, KeyError):
+		pass
+
+	#get x range, clipped to the physical branch
+	x0 = max(1/T_range[1], xa)
+	x1 = min(1/T_range[0], xb)
+
+	#calculate d2T/dD2 analytically on a dense grid
+	P = np.polynomial.Polynomial(c)
+	d1 = P.deriv(1)
+	d2 = P.deriv(2)
+
+	xd = np.linspace(x0, x1, 100000)
+	Tpp = (2/(xd**3*d1(xd)) + d2(xd)/(xd**2*d1(xd)**2))/d1(xd)
+
+	Dmin, Dmax = np.sort(P(np.array([x0, x1])))
+
+	#estimate number of points from error bound, then check and refine
+	h = np.sqrt(8*tol/np.max(np.abs(Tpp)))
+	n = int(np.ceil((Dmax - Dmin)/h)) + 1
+
+	while True:
+		Dt = np.linspace(Dmin, Dmax, n)
+		Tt = _calc_T_exact(Dt, calibration, ref_frame)
+
+		#measure error at points within each interval
+		f = np.array([0.25, 0.5, 0.75])
+		Dm = (Dt[:-1,None] + f*np.diff(Dt)[:,None]).ravel()
+		err = np.max(np.abs(
+			np.interp(Dm, Dt, Tt) - _calc_T_exact(Dm, calibration, ref_frame)))
+
+		if err < tol:
+			break
+
+		n = 2*n - 1
+
+	tab = np.stack([Dt, Tt])
+
+	#save to cache directory, writing to temporary files first such that
+	# other processes never read partial files
+	try:
+		os.makedirs(_cache_dir(), exist_ok = True)
+
+		with tempfile.NamedTemporaryFile(
+			dir = _cache_dir(), suffix = '.npy', delete = False) as f:
+			np.save(f, tab)
+
+		os.replace(f.name, path + '.npy')
+
+		with tempfile.NamedTemporaryFile(
+			'w', dir = _cache_dir(), suffix = '.json', delete = False) as f:
+			json.dump({'err' : err, 'n' : n, 'tol' : tol, 
+				'T_range' : list(T_range)}, f)
+
+		os.replace(f.name, path + '.json')
+
+	except OSError:
+		pass
+
+	_inv_tables[name] = (tab[0], tab[1], err)
+
+	return _inv_tables[name]
+
+#function to get the isotopylog cache directory
+def _cache_dir():
+	'''
+	Returns the directory used for caching results on disk. Set by the
+	``ISOTOPYLOG_CACHE_DIR`` environment variable; defaults to
+	``~/.cache/isotopylog``.
+	'''
+
+	return os.environ.get(
+		'ISOTOPYLOG_CACHE_DIR',
+		os.path.join(os.path.expanduser('~'), '.cache', 'isotopylog')
+		)
+
 #function for calculating T from D
+@instrumented
 def Deq_from_T(T, calibration = 'Bea17', clumps = 'CO47', ref_frame = 'CDES90'):
 	'''
 	Calculates equilibrium clumped isotope values at a given temperature for
@@ -1213,8 +2086,9 @@ def Deq_from_T(T, calibration = 'Bea17', clumps = 'CO47', ref_frame = 'CDES90'):
 			``'PH12'``: for Passey and Henkes (2012) Eq. 4 \n
 			``'SE15'``: for Stolper and Eiler (2015) Fig. 3 \n
 			``'Bea17'``: for Bonifacie et al. (2017) Eq. 2 \n
-		Note that literature equations will be adjusted to be consistent with 
-		any reference frame. Defaults to ``'Bea17'``.
+		Custom calibrations added using ``ipl.register_calibration`` are also
+		accepted. Note that all equations will be adjusted to be consistent 
+		with any reference frame. Defaults to ``'Bea17'``.
 
 	clumps : string
 		The clumped isotope system under consideration. Currently only
@@ -1285,9 +2159,10 @@ def Deq_from_T(T, calibration = 'Bea17', clumps = 'CO47', ref_frame = 'CDES90'):
 	[5] Bonifacie et al. (2017) *Geochim. Cosmochim. Ac.*, **200**, 255--279.
 	'''
 
-	#make sure clumps is CO47 and extract from dictionary
+	#make sure clumps is CO47 and evaluate calibration polynomial in 1/T
 	if clumps == 'CO47':
-		Deq = caleqs[calibration][ref_frame](T)
+		c = calibration_coeffs(calibration, ref_frame)
+		Deq = _horner(1/np.asarray(T, dtype = float), c)
 	
 	elif isinstance(clumps, str):
 		raise ValueError(
@@ -1301,8 +2176,103 @@ def Deq_from_T(T, calibration = 'Bea17', clumps = 'CO47', ref_frame = 'CDES90'):
 
 	return Deq
 
+#function for calculating the derivative of Deq with respect to T
+@instrumented
+def dDeq_dT(T, calibration = 'Bea17', clumps = 'CO47', ref_frame = 'CDES90'):
+	'''
+	Calculates the analytic derivative of equilibrium clumped isotope values
+	with respect to temperature for a given calibration and reference frame.
+	Useful for propagating temperature uncertainty into Deq uncertainty.
+
+	Parameters
+	----------
+
+	T : float or array-like
+		The temperature values at which to calculate the derivative, in
+		Kelvin. Can be a single temperature or an array of temperatures.
+
+	calibration : string
+		The D-T calibration curve to use; see ``ipl.Deq_from_T`` for 
+		options. Defaults to ``'Bea17'``.
+
+	clumps : string
+		The clumped isotope system under consideration. Currently only
+		accepts 'CO47' for D47 clumped isotopes. Defaults to ``'CO47'``.
+
+	ref_frame : string
+		The reference frame used to calculate clumped isotope data; see
+		``ipl.Deq_from_T`` for options. Defaults to ``'CDES90'``.
+
+	Returns
+	-------
+
+	dDdT : float or np.array
+		The resulting derivatives, in permil per Kelvin. If inputted T is
+		scalar, dDdT is scalar. If inputted T is an array, dDdT will be array
+		of length ``nT``.
+
+	Raises
+	------
+
+	TypeError
+		If inputted clumps is not a string.
+
+	ValueError
+		If inputted clumps is not an acceptable string.
+
+	See Also
+	--------
+
+	isotopylog.Deq_from_T
+		Related function to calculate Deq values.
+
+	Notes
+	-----
+
+	Calibrations are polynomials in x = 1/T, such that dDeq/dT = -x**2 dDeq/dx
+	is evaluated directly from the calibration coefficients.
+
+	Examples
+	--------
+
+	Propagating a 5 K temperature uncertainty into Deq::
+
+		#import packages
+		import isotopylog as ipl
+
+		T = 150 + 273.15 #in Kelvin
+		Deq_std = abs(ipl.dDeq_dT(T))*5
+	'''
+
+	#make sure clumps is CO47 and evaluate derivative polynomial in 1/T
+	if clumps == 'CO47':
+		c = calibration_coeffs(calibration, ref_frame)
+		dc = c[1:]*np.arange(1, len(c))
+
+		x = 1/np.asarray(T, dtype = float)
+		dDdT = -x**2*_horner(x, dc) if len(dc) > 0 else 0*x
+
+	elif isinstance(clumps, str):
+		raise ValueError(
+			'unexpected "clumps" string %s. Must be "CO47".' % clumps)
+
+	else:
+		ct = type(clumps).__name__
+
+		raise TypeError(
+			'unexpected "clumps" type %s. Must be string.' % ct)
+
+	return dDdT
+
 #function for calculating T from D
-def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'):
+@instrumented
+def T_from_Deq(
+	Deq, 
+	clumps = 'CO47', 
+	calibration = 'Bea17', 
+	ref_frame = 'CDES90',
+	method = 'exact'
+	):
 	'''
 	Calculates equilibrium temperature for a given clumped isotope value for
 	a given calibration and reference frame.
@@ -1312,7 +2282,8 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 
 	Deq : float or array-like
 		The clumped isotope values at which to calculate equilibrium T values,
-		in Kelvin. Can be a single clumped isotope value or an array of values.
+		in Kelvin. Can be a single clumped isotope value or an array of values
+		of any shape.
 
 	calibration : string
 		The D-T calibration curve to use, from the literature. Options are: \n
@@ -1339,13 +2310,22 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 			(2006) acidified at 90 C.\n
 		Defaults to ``'CDES90'``.
 
+	method : string
+		The inversion method. Options are: \n
+			``'exact'``: for vectorized Newton iterations (see Notes) \n
+			``'table'``: for linear interpolation of a precomputed table
+			covering 250 -- 1500 K, with interpolation error below 1e-3 K.
+			Values outside of the table range are solved exactly. \n
+		Defaults to ``'exact'``.
+
 	Returns
 	-------
 
 	T : float or np.array
 		The resulting equilibrium temperatures, in Kelvin. If inputted Deq is
-		scalar, T is scalar. If inputted Deq is an array, T will be array of
-		length ``nDeq``.
+		scalar, T is scalar. If inputted Deq is an array, T will be an array
+		of the same shape. Deq values outside of the range spanned by the
+		physical branch of the calibration (see Notes) return ``np.nan``.
 
 	Raises
 	------
@@ -1356,6 +2336,9 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 	TypeError
 		If inputted keyword arguments are not acceptable strings.
 
+	ValueError
+		If `method` is not ``'exact'`` or ``'table'``.
+
 	See Also
 	--------
 
@@ -1365,9 +2348,19 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 	Notes
 	-----
 
-	This function uses ``scipy.optimize.minimize`` with a tolerance of ``1e-7``
-	to find the root of the function ``(caleq(T) - Deq)**2`` for a given
-	calibration equation.
+	All calibration equations are quartic polynomials in 1/T (plus any
+	reference frame shift). This function therefore solves for all Deq values
+	at once using vectorized Newton iterations in 1/T space, starting from an
+	initial guess interpolated from a grid and keeping each iterate within
+	the physical branch of the calibration. The physical branch is the
+	monotonic region of the polynomial that contains T = 350 K; that is, it
+	is bounded by the nearest turning points of the polynomial (if any).
+	Results converge to machine precision.
+
+	Tables used by the ``'table'`` method are made once per calibration and
+	reference frame, then saved to (and memory-mapped from) the directory 
+	given by the ``ISOTOPYLOG_CACHE_DIR`` environment variable, which defaults
+	to ``~/.cache/isotopylog``.
 
 	Examples
 	--------
@@ -1398,9 +2391,9 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 	[5] Bonifacie et al. (2017) *Geochim. Cosmochim. Ac.*, **200**, 255--279.
 	'''
 
-	#make sure clumps is CO47 and extract function from dictionary
+	#make sure clumps is CO47
 	if clumps == 'CO47':
-		func = caleqs[calibration][ref_frame]
+		pass
 	
 	elif isinstance(clumps, str):
 		raise ValueError(
@@ -1412,26 +2405,32 @@ def T_from_Deq(Deq, clumps = 'CO47', calibration = 'Bea17', ref_frame = 'CDES90'
 		raise TypeError(
 			'unexpected "clumps" type %s. Must be string.' % ct)
 
-	#if Deq is array, loop through and solve
-	try:
-		nDeq = len(Deq)
-		T = np.zeros(nDeq)
+	#make Deq into float array, keeping track of scalar inputs
+	Deq = np.asarray(Deq, dtype = float)
+	D = Deq.ravel()
 
-		for i in range(nDeq):
-			#make lambda function to minimize squared error
-			lamfunc = lambda T : (func(T) - Deq[i])**2
+	#solve exactly or using the inverse table
+	if method == 'exact':
+		T = _calc_T_exact(D, calibration, ref_frame)
 
-			#solve, arbitrarily choose initial guess at 400
-			res = minimize(lamfunc, 350, tol = 1e-8)
-			T[i] = res.x[0]
+	elif method == 'table':
+		Dt, Tt, _ = _calc_inv_table(calibration, ref_frame)
 
-	#if inputted Deq is scalar, simply solve:
-	except TypeError:
-		#make lambda function to minimize squared error
-		lamfunc = lambda T : (func(T) - Deq)**2
+		#interpolate within table range, solving exactly elsewhere
+		T = np.interp(D, Dt, Tt)
+		out = ~((D >= Dt[0]) & (D <= Dt[-1]))
+
+		if out.any():
+			T[out] = _calc_T_exact(D[out], calibration, ref_frame)
+
+	else:
+		raise ValueError(
+			'unexpected method %s. Must be "exact" or "table".' % method)
+
+	T = T.reshape(Deq.shape)
 
-		#solve, arbitrarily choose initial guess at 400
-		res = minimize(lamfunc, 400, tol = 1e-8)
-		T = res.x[0]
+	#return scalar if Deq was scalar
+	if T.ndim == 0:
+		return float(T)
 
 	return T
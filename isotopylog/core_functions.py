@@ -13,20 +13,17 @@ __all__ = [
 			'geologic_history'
 			]
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-#import necessary calculation functions
-from .calc_funcs import(
-	_ghHea14,
-	_ghHH20,
-	_ghPH12,
-	_ghSE15,
-	_Jacobian,
-	)
+#import model kernel registry
+from .model_kernels import get_kernel
+
+#import decorator for recording hot-path statistics
+from .instrumentation import instrumented
 
 #import dictionaries with conversion information
 from .dictionaries import(
+	cal_coeffs,
 	caleqs,
 	)
 
@@ -93,6 +90,7 @@ def derivatize(num, denom):
 	return dndd
 
 #define function to predict D47 evolution along geologic history
+@instrumented
 def geologic_history(
 	t, 
 	T, 
@@ -104,6 +102,7 @@ def geologic_history(
 	ref_frame = 'CDES90',
 	nnu = 400,
 	z = 6,
+	dtype = np.float64,
 	**kwargs
 	):
 	'''
@@ -168,6 +167,14 @@ def geologic_history(
 		for other model types, this is unused. Defaults to ``6`` as suggested
 		in Stolper and Eiler (2015).
 
+	dtype : np.dtype
+		The floating-point type used for large intermediate arrays; either
+		``np.float64`` or ``np.float32``. Only applies if 
+		``ed.model = 'HH20'``, since other model types only use arrays of
+		length ``nt``. Single precision halves memory use and bandwidth for
+		the [``nnu`` x ``nt``] arrays; see Notes for error bounds. Defaults 
+		to ``np.float64``.
+
 	Returns
 	-------
 
@@ -191,6 +198,9 @@ def geologic_history(
 		If inputted 'calibration' and/or 'ref_frame' arrays are not acceptable
 		strings.
 
+	ValueError
+		If inputted 'dtype' is not float32 or float64.
+
 	See Also
 	--------
 
@@ -198,6 +208,19 @@ def geologic_history(
 		The class that contains the activation energy parameters that are
 		to be modeled.
 
+	Notes
+	-----
+
+	If ``dtype = np.float32``, the Gaussian rate distribution and the fraction
+	of each rate bin reacted during each time step are computed in single
+	precision, while sums over the distribution are accumulated in double
+	precision and the total mass of the distribution is computed analytically.
+	Resulting D values are within 1e-6 permil of double-precision results
+	(typically ~1e-8 permil), independent of ``nt``. Because of rounding
+	noise, Jacobians are calculated using a default finite-difference step of
+	``eps = 1e-2`` rather than ``1e-6``; resulting D_std values are within
+	~1e-5 permil of double-precision results.
+
 	Examples
 	--------
 
@@ -299,18 +322,18 @@ def geologic_history(
 			% len(T)
 			)
 
-	if calibration not in ['PH12', 'SE15', 'Bea17']:
-		raise ValueError(
-			"unexpected calibration %s. Must be 'PH12', 'SE15', or 'Bea17'."
-			% calibration
-			)
-
-	elif not isinstance(calibration, str):
+	if not isinstance(calibration, str):
 		ct = type(calibration).__name__
 		raise TypeError(
 			'unexpected calibration of type %s. Must be string.' % ct
 			)
 
+	elif calibration not in cal_coeffs:
+		raise ValueError(
+			"unexpected calibration %s. Must be 'PH12', 'SE15', 'Bea17', or a"
+			" calibration added using ipl.register_calibration." % calibration
+			)
+
 	if ref_frame not in ['Ghosh25', 'Ghosh90', 'CDES25', 'CDES90']:
 		raise ValueError(
 			"unexpected ref_frame %s. Must be 'Ghosh25', 'Ghosh90', 'CDES25',"
@@ -323,156 +346,44 @@ def geologic_history(
 			'unexpected calibration of type %s. Must be string.' % rft
 			)
 
+	if np.dtype(dtype) not in (np.float32, np.float64):
+		raise ValueError(
+			'unexpected dtype %s. Must be float32 or float64.' % dtype
+			)
+
 	#calculate array of D47eq
 	Deq = caleqs[calibration][ref_frame](T)
 	D0 = d0[0]
 	D0_cov = d0_std[0]**2
 	Tref = ed.Tref
 
-	#calculate D depending on model type
-
-	#Henkes et al. 2014 model
-	if ed.model == 'Hea14':
-
-		#extract relevant parameters and uncertainty in the order:
-		# Ec, lnkcref, Ed, lnkdref, E2, lnk2ref
-		p = ed.Eparams.T.flatten()
-		pcov = ed.Eparams_cov
-
-		#append D0 to params and params_cov to include those in uncertainty
-		p = np.append(p, D0)
-
-		npt = len(pcov)
-		pcov = np.append(pcov, [np.zeros(npt)], 0)
-		pcov = np.append(pcov, np.append(np.zeros(npt), D0_cov).reshape(-1,1),1)
-
-		#solve for D evolution
-		D = _ghHea14(t, *p, Deq, T, Tref)
-
-		#define lambda function for uncertainty propagation
-		lamfunc = lambda t,Ec,lnkcref,Ed,lnkdref,E2,lnk2ref,D0 : _ghHea14(
-			t, 
-			Ec,
-			lnkcref,
-			Ed,
-			lnkdref,
-			E2,
-			lnk2ref,
-			D0,
-			Deq,
-			T,
-			Tref)
-
-	#Hemingway and Henkes 2020 model
-	elif ed.model == 'HH20':
-
-		#extract relevant parameters and uncertainty in the order:
-		# Emu, lnkmuref, Esig, lnksigref
-		p = ed.Eparams.T.flatten()
-		pcov = ed.Eparams_cov
-
-		#append D0 to params and params_cov to include those in uncertainty
-		p = np.append(p, D0)
-
-		npt = len(pcov)
-		pcov = np.append(pcov, [np.zeros(npt)], 0)
-		pcov = np.append(pcov, np.append(np.zeros(npt), D0_cov).reshape(-1,1),1)
-
-		#solve for D evolution
-		D = _ghHH20(t, *p, Deq, T, Tref)
-
-		#define lambda function for uncertainty propagation
-		lamfunc = lambda t, Emu, lnkmuref, Esig, lnksigref, D0 : _ghHH20(
-			t, 
-			Emu, 
-			lnkmuref, 
-			Esig, 
-			lnksigref,
-			D0,
-			Deq,
-			T,
-			Tref,
-			nnu = nnu)
-
-	#Passey and Henkes 2012 model
-	elif ed.model == 'PH12':
-
-		#extract relevant parameters and uncertainty in the order: 
-		# E, lnkref
-		p = ed.Eparams[:,0]
-		pcov = ed.Eparams_cov[:2,:2]
-
-		#append D0 to params and params_cov to include those in uncertainty
-		p = np.append(p, D0)
-
-		npt = len(pcov)
-		pcov = np.append(pcov, [np.zeros(npt)], 0)
-		pcov = np.append(pcov, np.append(np.zeros(npt), D0_cov).reshape(-1,1),1)
-
-		#solve for D evolution
-		D = _ghPH12(t, *p, Deq, T, Tref)
-
-		#define lambda function for uncertainty propagation
-		lamfunc = lambda t, E, lnkref, D0 : _ghPH12(
-			t, 
-			E, 
-			lnkref, 
-			D0, 
-			Deq,
-			T, 
-			Tref)
-
-	#Stolper and Eiler 2015 model
-	elif ed.model == 'SE15':
-
-		#extract relevant parameters and uncertainty in the order:
-		# E1, lnk1ref, Eds, lnkdsref, Emp, mpref
-		p = ed.Eparams.T.flatten()
-		pcov = ed.Eparams_cov
-
-		#append D0 to params and params_cov to include those in uncertainty
-		p = np.append(p, D0)
-
-		npt = len(pcov)
-		pcov = np.append(pcov, [np.zeros(npt)], 0)
-		pcov = np.append(pcov, np.append(np.zeros(npt), D0_cov).reshape(-1,1),1)
-
-		#solve for D evolution
-		D = _ghSE15(
-			t, 
-			*p, 
-			d0[1], 
-			d0[2], 
-			T, 
-			Tref, 
-			calibration = calibration,
-			iso_params = iso_params,
-			ref_frame = ref_frame,
-			z = z)[0]
-
-		#define lambda function for uncertainty propagation
-		lamfunc = lambda t, E1, lnk1ref, Eds, lnkdsref, Emp, mpref, D0 : _ghSE15(
-			t, 
-			E1, 
-			lnk1ref, 
-			Eds, 
-			lnkdsref, 
-			Emp, 
-			mpref,
-			D0,
-			d0[1], 
-			d0[2], 
-			T, 
-			Tref, 
-			calibration = calibration,
-			iso_params = iso_params,
-			ref_frame = ref_frame,
-			z = z)[0]
-
-	#calculate Jacobian and D uncertainty
-	J = _Jacobian(lamfunc, t, p, **kwargs)
-	Dcov = np.dot(J, np.dot(pcov, J.T))
-	D_std = np.sqrt(np.diag(Dcov))
+	#get the model kernel and extract relevant parameters and uncertainty
+	kern = get_kernel(ed.model)
+	p, pcov = kern.geologic_params(ed)
+
+	#append D0 to params and params_cov to include those in uncertainty
+	p = np.append(p, D0)
+
+	npt = len(pcov)
+	pcov = np.append(pcov, [np.zeros(npt)], 0)
+	pcov = np.append(pcov, np.append(np.zeros(npt), D0_cov).reshape(-1,1),1)
+
+	#additional model-specific inputs
+	kw = {'d0' : d0, 'calibration' : calibration, 'iso_params' : iso_params,
+		'ref_frame' : ref_frame, 'z' : z, 'nnu' : nnu, 'dtype' : dtype}
+
+	#solve for D evolution
+	D = kern.geologic(t, p, Deq, T, Tref, **kw)
+
+	#single-precision rounding noise swamps small finite-difference steps, so
+	# use a larger default step size for the Jacobian
+	if np.dtype(dtype) == np.float32:
+		kwargs.setdefault('eps', 1e-2)
+
+	#calculate Jacobian and D uncertainty; only the diagonal of the
+	# [nt x nt] covariance matrix is needed, so never store the full matrix
+	J = kern.geologic_jacobian(t, p, Deq, T, Tref, **kw, **kwargs)
+	D_std = np.sqrt(np.sum(np.dot(J, pcov)*J, axis = 1))
 
 	return D, D_std
 
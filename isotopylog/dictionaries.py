@@ -3,8 +3,9 @@ This module contains all the dictionaries that are used for importing data.
 '''
 
 #import necessary packages
+import csv
+import numpy as np
 import os
-import pandas as pd
 
 #make a function to load files
 #function to load files
@@ -45,31 +46,223 @@ ghosh_aff = 0.081 #25C - 90C
 m = 1.0381 #Ghosh to CDES 25C
 b = 0.0266 #Ghosh to CDES 25C
 
-#make lambda equations for native (i.e., literature reported) equations
+#all supported reference frames
+ref_frames = ['Ghosh25', 'Ghosh90', 'CDES25', 'CDES90']
 
-#PH12: CDES25 native
-PH12 = lambda T : p4/(T**4) + p3/(T**3) + p2/(T**2) + p1/T + p0
+#store native (i.e., literature reported) calibrations as coefficients of
+# increasing powers of 1/T, along with the native reference frame
+cal_coeffs = {'PH12' : (np.array([p0, p1, p2, p3, p4]), 'CDES25'),
+			  'SE15' : (np.array([s0, 0., s2, 0., s4]), 'Ghosh25'),
+			  'Bea17' : (np.array([b0, 0., b2, 0., b4]), 'CDES90'),
+			 }
+
+#folded coefficients for each (calibration, ref_frame) pair, made on first use
+_frame_coeffs = {}
+
+#function to evaluate polynomials
+def _horner(x, c):
+	'''
+	Evaluates the polynomial sum(c[j]*x**j) using Horner's scheme. Works on
+	scalars and arrays of any shape.
+	'''
+
+	y = c[-1]
+
+	for cj in c[-2::-1]:
+		y = y*x + cj
+
+	return y
+
+#function to get the scale and offset between two reference frames
+def _frame_shift(native_frame, ref_frame):
+	'''
+	Returns the (scale, offset) pair such that D_ref = scale*D_native + offset.
+	Family conversions are done at 25C (Ghosh to CDES; m and b), and acid
+	fractionation shifts are then made within the target family.
+	'''
+
+	for rf in (native_frame, ref_frame):
+		if rf not in ref_frames:
+			raise ValueError(
+				'unexpected ref_frame %r. Must be one of: %s'
+				% (rf, ', '.join(ref_frames)))
+
+	nfam, nacid = native_frame[:-2], native_frame[-2:]
+	rfam, racid = ref_frame[:-2], ref_frame[-2:]
+
+	scale, offset = 1., 0.
+
+	#convert between families at the native acid temperature
+	if nfam == 'CDES' and rfam == 'Ghosh':
+		scale, offset = 1/m, -b/m
+
+	elif nfam == 'Ghosh' and rfam == 'CDES':
+		scale, offset = m, b
+
+	#then shift acid temperatures within the target family
+	if nacid != racid:
+		aff = cdes_aff if rfam == 'CDES' else ghosh_aff
+		offset += -aff if racid == '90' else aff
+
+	return scale, offset
+
+#function to get the coefficients for a given calibration and ref. frame
+def calibration_coeffs(calibration, ref_frame = 'CDES90'):
+	'''
+	Returns the coefficients of increasing powers of 1/T for a given
+	calibration, with the reference frame conversion folded in. Returned
+	arrays are read-only and shared between calls.
+
+	Parameters
+	----------
+
+	calibration : str
+		The calibration name; either a literature calibration (``'PH12'``,
+		``'SE15'``, ``'Bea17'``) or one added using 
+		``ipl.register_calibration``.
+
+	ref_frame : str
+		The reference frame; one of ``'Ghosh25'``, ``'Ghosh90'``, 
+		``'CDES25'``, or ``'CDES90'``. Defaults to ``'CDES90'``.
+
+	Returns
+	-------
+
+	c : np.ndarray
+		Array of coefficients; Deq = sum(c[j] * T**-j).
+
+	Raises
+	------
+
+	KeyError
+		If calibration has not been registered.
+
+	ValueError
+		If ref_frame is not one of the supported reference frames.
+	'''
+
+	key = (calibration, ref_frame)
+
+	try:
+		return _frame_coeffs[key]
+
+	except KeyError:
+		pass
+
+	try:
+		cn, native_frame = cal_coeffs[calibration]
+
+	except KeyError:
+		raise KeyError(
+			'unexpected calibration %r. Must be one of: %s'
+			% (calibration, ', '.join(cal_coeffs)))
+
+	scale, offset = _frame_shift(native_frame, ref_frame)
+
+	c = scale*cn
+	c[0] += offset
+	c.flags.writeable = False
+
+	_frame_coeffs[key] = c
+
+	return c
+
+#function to make the calibration equation for a given pair
+def _make_caleq(calibration, ref_frame):
+	'''
+	Makes a function of T that evaluates a given calibration in a given
+	reference frame.
+	'''
+
+	c = calibration_coeffs(calibration, ref_frame)
+
+	return lambda T : _horner(1/np.asarray(T, dtype = float), c)
+
+#function to register custom calibrations
+def register_calibration(name, coeffs, ref_frame = 'CDES90'):
+	'''
+	Registers a custom calibration, which can then be used anywhere a
+	calibration name is accepted (e.g., ``ipl.Deq_from_T``, 
+	``ipl.HeatingExperiment``, ``ipl.geologic_history``).
 
-#SE15: Ghosh25 native
-SE15 = lambda T : s4/(T**4) + s2/(T**2) + s0
+	Parameters
+	----------
 
-#Bea17: CDES90 native
-Bea17 = lambda T : b4/(T**4) + b2/(T**2) + b0
+	name : str
+		The calibration name. Registering an existing name overwrites it.
+
+	coeffs : array-like
+		Coefficients of increasing powers of 1/T, in the native reference
+		frame; that is, Deq = sum(coeffs[j] * T**-j), with T in Kelvin.
+
+	ref_frame : str
+		The native reference frame of the calibration; one of 
+		``'Ghosh25'``, ``'Ghosh90'``, ``'CDES25'``, or ``'CDES90'``. Defaults
+		to ``'CDES90'``.
+
+	Raises
+	------
+
+	TypeError
+		If name is not a string.
+
+	TypeError
+		If coeffs is not a 1d array-like of numbers.
+
+	ValueError
+		If ref_frame is not one of the supported reference frames.
+
+	Examples
+	--------
+
+	Registering a calibration that is written in powers of 1/T::
+
+		#import modules
+		import isotopylog as ipl
+
+		#Deq = 0.1745 + 2.5885e4/T**2 + 1.0771e9/T**4 in CDES90
+		ipl.register_calibration(
+			'myCal',
+			[0.1745, 0, 2.5885e4, 0, 1.0771e9],
+			ref_frame = 'CDES90',
+			)
+
+		D = ipl.Deq_from_T(500, calibration = 'myCal', ref_frame = 'CDES25')
+	'''
+
+	if not isinstance(name, str):
+		raise TypeError(
+			'unexpected calibration name of type %s. Must be string.' 
+			% type(name).__name__)
+
+	try:
+		c = np.array(coeffs, dtype = float)
+
+	except (TypeError, ValueError):
+		raise TypeError(
+			'unexpected coeffs of type %s. Must be array-like of numbers.'
+			% type(coeffs).__name__)
+
+	if c.ndim != 1 or len(c) == 0:
+		raise TypeError(
+			'unexpected coeffs of shape %s. Must be 1d and non-empty.'
+			% (c.shape,))
+
+	#check frame before storing
+	_frame_shift(ref_frame, ref_frame)
+
+	c.flags.writeable = False
+	cal_coeffs[name] = (c, ref_frame)
+
+	#drop any previously folded coefficients and remake equations
+	for rf in ref_frames:
+		_frame_coeffs.pop((name, rf), None)
+
+	caleqs[name] = {rf : _make_caleq(name, rf) for rf in ref_frames}
 
 #store in dictionary
-caleqs = {'PH12':{'Ghosh25':lambda T : (PH12(T) - b)/m,
-				  'Ghosh90': lambda T : (PH12(T) - b)/m - ghosh_aff,
-				  'CDES25': lambda T : PH12(T),
-				  'CDES90':lambda T : PH12(T) - cdes_aff},
-		  'SE15':{'Ghosh25': lambda T : SE15(T),
-		  		  'Ghosh90': lambda T : SE15(T) - ghosh_aff,
-				  'CDES25':lambda T : SE15(T)*m + b,
-				  'CDES90':lambda T : SE15(T)*m + b - cdes_aff},
-		  'Bea17':{'Ghosh25':lambda T : (Bea17(T) - b)/m + ghosh_aff,
-		  		  'Ghosh90' :lambda T : (Bea17(T) - b)/m,
-				  'CDES25':lambda T : Bea17(T) + cdes_aff,
-				  'CDES90': lambda T : Bea17(T)},
-		 }
+caleqs = {cal : {rf : _make_caleq(cal, rf) for rf in ref_frames} 
+	for cal in cal_coeffs}
 
 #---------------------------------------------------------------------#
 # 2) dictionary for holding "isotope parameters" (Daëron et al. 2016) #
@@ -161,47 +354,115 @@ zi = {'Hea14' : [False, False, False],
 # 7) Dictionary for holding all literature kd data #
 #--------------------------------------------------#
 
-#first, import stored data as dataframe
-file = gen_str('lit_values/lit_values.csv')
-kdf = pd.read_csv(file, index_col = [0,1])
+#literature data are only read from file on first use; store the arrays for
+# each (reference, mineral) pair once loaded
+_lit_kd_store = {}
+
+#function to load literature data into the store
+def _load_lit_kd():
+	'''
+	Reads the literature kd data file and stores T, params, and params_std
+	arrays for each (reference, mineral) pair. Parameter columns with no data
+	for a given pair (i.e., p3 and s3 for models with 2 params) are dropped.
+	'''
+
+	#read each row, grouping by (reference, mineral)
+	rows = {}
+
+	with open(gen_str('lit_values/lit_values.csv'), newline = '') as f:
+		reader = csv.reader(f)
+		next(reader) #skip header
+
+		for row in reader:
+			vals = [float(v) if v != '' else np.nan for v in row[3:]]
+			rows.setdefault((row[0], row[1]), []).append(vals)
+
+	#convert each group to arrays of T, params, and params_std
+	for key, vals in rows.items():
+		a = np.array(vals)
+
+		#drop columns with no data
+		a = a[:, ~np.isnan(a).any(axis = 0)]
+		npar = (a.shape[1] - 1)//2
+
+		T = a[:,0]
+		params = a[:,1:npar+1]
+		params_std = a[:,npar+1:]
+
+		for x in (T, params, params_std):
+			x.flags.writeable = False
+
+		_lit_kd_store[key] = (T, params, params_std)
+
+#function to retrieve literature data for a given reference and mineral
+def lit_kd_data(reference, mineral):
+	'''
+	Retrieves literature kd data for a given reference and mineral, reading
+	the literature data file on first use.
+
+	Parameters
+	----------
+
+	reference : str
+		The literature reference; e.g., ``'PH12'``.
+
+	mineral : str
+		The mineral; e.g., ``'calcite'``.
+
+	Returns
+	-------
+
+	T : np.ndarray
+		Read-only array of experiment temperatures, in Celsius. Of length
+		``n``.
+
+	params : np.ndarray
+		Read-only array of model parameters, of shape [``n`` x ``nkp``].
 
-#pre-allocate dictionary
-lit_kd_dict = {}
+	params_std : np.ndarray
+		Read-only array of model parameter uncertainty, as +/- 1 sigma. Of
+		shape [``n`` x ``nkp``].
 
-#then, loop through each reference and store data
-for r, rdf in kdf.groupby(level = 0):
+	Raises
+	------
 
-	#pre-allocate mineral-specific dictionary
-	mindict = {}
+	KeyError
+		If no data exist for the inputted reference and mineral.
+	'''
 
-	#now loop over rdf for each mineral within each reference
-	for m, mdf in rdf.groupby('mineral'):
+	if not _lit_kd_store:
+		_load_lit_kd()
 
-		#drop columns with no data (i.e., p3 and s3 for mods with 2 params)
-		mdf_dropped = mdf.dropna(axis = 1)
+	try:
+		return _lit_kd_store[(reference, mineral)]
 
-		#pre-allocate empty list for that reference and that mineral
-		rml = []
+	except KeyError:
+		raise KeyError(
+			'No literature data for reference %s and mineral %s' 
+			% (reference, mineral))
 
-		#loop over each row and store in list
-		for n, row in mdf_dropped.iterrows():
+#for backwards compatibility, make lit_kd_dict on first access
+def __getattr__(name):
+	'''
+	Makes the nested {reference: {mineral: [experiment dicts]}} literature
+	dictionary, ``lit_kd_dict``, when first accessed.
+	'''
 
-			#make empty dictionary to store experiment-specific data
-			e = {}
+	if name != 'lit_kd_dict':
+		raise AttributeError(
+			'module %s has no attribute %s' % (__name__, name))
 
-			#extract T, params, params_std
-			e['T'] = row['T']
-			e['params'] = row.filter(regex=('p')).values.astype(float)
-			e['params_std'] = row.filter(regex=('s')).values.astype(float)
+	if not _lit_kd_store:
+		_load_lit_kd()
 
-			#append to rml list
-			rml.append(e)
+	lit_kd_dict = {}
 
-		#store to mindict
-		mindict[m] = rml
+	for (ref, mnl), (T, params, params_std) in _lit_kd_store.items():
+		lit_kd_dict.setdefault(ref, {})[mnl] = [
+			{'T' : t, 'params' : p, 'params_std' : ps} 
+			for t, p, ps in zip(T, params, params_std)]
 
-	#store in lit_kd_dict
-	lit_kd_dict[r] = mindict
+	return lit_kd_dict
 
 
 if __name__ == '__main__':
@@ -0,0 +1,337 @@
+'''
+This module contains an opt-in, content-addressed disk cache for fit results.
+Results are keyed on a hash of all ``HeatingExperiment`` arrays and settings,
+the model name, and all fit keywords, and are stored as compressed ``.npz``
+files in the isotopylog cache directory. The total size of the cache is
+bounded by evicting least-recently-used results.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#set magic attributes
+__docformat__ = 'restructuredtext en'
+__all__ = ['clear_fit_cache',
+		   'fit_cache_info',
+		   'get_fit_cache',
+		   'set_fit_cache',
+		  ]
+
+#import packages
+import glob
+import hashlib
+import numpy as np
+import os
+import tempfile
+
+#import necessary isotopylog functions and dictionaries
+from .calc_funcs import(
+	_array_key,
+	_cache_dir,
+	)
+
+from .dictionaries import calibration_coeffs
+
+#version of the stored format; changing this invalidates all stored results
+_format = 1
+
+#store current state; the cache can also be enabled for all processes by
+# setting the ISOTOPYLOG_FIT_CACHE environment variable to 1
+_state = {
+	'enabled' : os.environ.get('ISOTOPYLOG_FIT_CACHE', '0') not in ('', '0'),
+	'max_size' : 256*2**20,
+	}
+
+_stats = {'hits' : 0, 'misses' : 0}
+
+#function to get the fit cache directory
+def _fit_dir():
+	'''
+	Returns the directory used for storing fit results.
+	'''
+	return os.path.join(_cache_dir(), 'fits')
+
+#function for hashing heating experiment contents
+def _he_key(he):
+	'''
+	Generates a hashable key for all ``HeatingExperiment`` contents used when
+	fitting. Returns ``None`` if the experiment uses a custom lambda
+	calibration, which cannot be hashed by content.
+	'''
+
+	if he.calibration == 'Custom':
+		return None
+
+	#include calibration coefficients, such that re-registering a
+	# calibration under the same name never reuses stale results
+	cc = calibration_coeffs(he.calibration, he.ref_frame)
+
+	return _array_key(he.tex, he.dex, he.dex_std, he.T, he.T_std, cc,
+		he.calibration, he.clumps, he.iso_params, he.ref_frame)
+
+#function for generating keys
+def _fit_key(kind, he, **kwargs):
+	'''
+	Generates the hex digest key for a fit, or ``None`` if the cache is
+	disabled or the inputs cannot be hashed.
+
+	Parameters
+	----------
+
+	kind : str
+		The type of result being stored (e.g., ``'invert_experiment'``).
+
+	he : isotopylog.HeatingExperiment
+		The experiment being fit.
+
+	kwargs : dict
+		All keywords that affect the result (e.g., model, nu range, nnu,
+		omega, p0, bounds).
+
+	Returns
+	-------
+
+	key : str or None
+		The sha1 hex digest.
+	'''
+
+	if not _state['enabled']:
+		return None
+
+	hk = _he_key(he)
+
+	#functions cannot be keyed by content
+	if hk is None or any(callable(v) for v in kwargs.values()):
+		return None
+
+	try:
+		k = repr((_format, kind, hk, _array_key(**kwargs)))
+
+	#unexpected keyword types (e.g., ragged lists) cannot be keyed reliably
+	except (TypeError, ValueError):
+		return None
+
+	return hashlib.sha1(k.encode()).hexdigest()
+
+#function for loading results
+def _cache_load(key):
+	'''
+	Loads stored results as a dictionary, or returns ``None`` if `key` is
+	``None`` or no result is stored. Stored ``None`` values are restored and
+	0-d arrays are returned as python scalars.
+	'''
+
+	if key is None:
+		return None
+
+	path = os.path.join(_fit_dir(), key + '.npz')
+
+	try:
+		with np.load(path) as f:
+			res = {k : (f[k].item() if f[k].ndim == 0 else f[k])
+				for k in f.files if k != '_none'}
+
+			res.update({str(k) : None for k in f['_none']})
+
+		#mark as recently used
+		os.utime(path)
+
+	except (OSError, ValueError, KeyError):
+		_stats['misses'] += 1
+		return None
+
+	_stats['hits'] += 1
+
+	return res
+
+#function for storing results
+def _cache_store(key, res):
+	'''
+	Stores a dictionary of results (arrays, scalars, strings, or ``None``)
+	and evicts least-recently-used results if the cache exceeds its maximum
+	size. Does nothing if `key` is ``None`` or the directory cannot be
+	written to.
+	'''
+
+	if key is None:
+		return
+
+	arrs = {k : np.asarray(v) for k, v in res.items() if v is not None}
+	arrs['_none'] = np.array([k for k, v in res.items() if v is None],
+		dtype = str)
+
+	#write to a temporary file first such that other processes never read
+	# partial files
+	try:
+		os.makedirs(_fit_dir(), exist_ok = True)
+
+		with tempfile.NamedTemporaryFile(
+			dir = _fit_dir(), suffix = '.tmp', delete = False) as f:
+			np.savez_compressed(f, **arrs)
+
+		os.replace(f.name, os.path.join(_fit_dir(), key + '.npz'))
+
+		_evict(_state['max_size'])
+
+	except OSError:
+		pass
+
+#function for evicting least-recently-used results
+def _evict(max_size):
+	'''
+	Removes least-recently-used results until the total size of the cache is
+	at most `max_size` bytes.
+	'''
+
+	files = []
+
+	for p in glob.glob(os.path.join(_fit_dir(), '*.npz')):
+		try:
+			s = os.stat(p)
+			files.append((s.st_mtime, s.st_size, p))
+
+		#another process may have removed the file
+		except OSError:
+			pass
+
+	size = sum(f[1] for f in files)
+
+	for _, s, p in sorted(files):
+		if size <= max_size:
+			break
+
+		try:
+			os.remove(p)
+
+		except OSError:
+			pass
+
+		size -= s
+
+#function to turn the fit cache on or off
+def set_fit_cache(enabled = True, max_size = None):
+	'''
+	Enables or disables the on-disk cache of fit results used by
+	``kDistribution.invert_experiment`` and ``calc_L_curve``.
+
+	Parameters
+	----------
+
+	enabled : boolean
+		Whether to load and store fit results. Defaults to ``True``.
+
+	max_size : int or None
+		The maximum total size of stored results, in bytes. If ``None``, the
+		current value is kept (initially 256 MiB).
+
+	Raises
+	------
+
+	TypeError
+		If `enabled` is not boolean.
+
+	ValueError
+		If `max_size` is negative.
+
+	See Also
+	--------
+
+	isotopylog.clear_fit_cache
+		Function to remove all stored results.
+
+	Notes
+	-----
+
+	Results are stored in the ``fits`` subdirectory of the directory given by
+	the ``ISOTOPYLOG_CACHE_DIR`` environment variable (defaults to
+	``~/.cache/isotopylog``). Keys include a hash of all experiment arrays,
+	the calibration coefficients, the model, and all fit keywords, so changed
+	inputs never reuse stale results. Experiments with custom lambda
+	calibrations are never cached.
+
+	The cache can also be enabled in all processes, e.g., for pipelines, by
+	setting the ``ISOTOPYLOG_FIT_CACHE`` environment variable to ``1``.
+
+	Examples
+	--------
+
+	Skipping already-computed inversions when rerunning a pipeline::
+
+		#import modules
+		import isotopylog as ipl
+
+		ipl.set_fit_cache(True, max_size = 1e9)
+
+		#fit on the first run, load from disk on subsequent runs
+		kd = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+			fit_reg = True)
+	'''
+
+	if not isinstance(enabled, bool):
+		et = type(enabled).__name__
+
+		raise TypeError(
+			'unexpected enabled of type %s. Must be boolean.' % et)
+
+	if max_size is not None:
+		if max_size < 0:
+			raise ValueError(
+				'unexpected max_size %r. Must be non-negative.' % max_size)
+
+		_state['max_size'] = int(max_size)
+
+	_state['enabled'] = enabled
+
+#function to check whether the fit cache is on
+def get_fit_cache():
+	'''
+	Returns ``True`` if the on-disk fit cache is currently enabled.
+	'''
+	return _state['enabled']
+
+#function to report cache statistics
+def fit_cache_info():
+	'''
+	Reports the state of the on-disk fit cache.
+
+	Returns
+	-------
+
+	info : dict
+		Dictionary containing: \n
+			``'enabled'``: whether the cache is enabled \n
+			``'path'``: the directory used for storing results \n
+			``'max_size'``: the maximum total size, in bytes \n
+			``'size'``: the current total size, in bytes \n
+			``'nfiles'``: the number of stored results \n
+			``'hits'``: the number of results loaded in this process \n
+			``'misses'``: the number of results not found in this process
+	'''
+
+	files = glob.glob(os.path.join(_fit_dir(), '*.npz'))
+
+	size = 0
+	for p in files:
+		try:
+			size += os.path.getsize(p)
+
+		except OSError:
+			pass
+
+	return {'enabled' : _state['enabled'], 'path' : _fit_dir(),
+		'max_size' : _state['max_size'], 'size' : size,
+		'nfiles' : len(files), 'hits' : _stats['hits'],
+		'misses' : _stats['misses']}
+
+#function to remove all stored results
+def clear_fit_cache():
+	'''
+	Removes all stored fit results and resets hit and miss counts.
+	'''
+
+	_evict(0)
+
+	_stats['hits'] = _stats['misses'] = 0
@@ -0,0 +1,317 @@
+'''
+This module contains lightweight instrumentation for isotopylog hot paths.
+When enabled, each instrumented function records its number of calls, total
+wall time, and the number of model kernel evaluations (nfev) made during its
+calls. Each evaluation of a parameter set is counted once, at the outermost
+kernel layer, such that nfev has the same meaning for all models. When
+disabled (the default), instrumented functions incur only a single
+dictionary lookup per call.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#set magic attributes
+__docformat__ = 'restructuredtext en'
+__all__ = ['get_instrumentation',
+		   'get_stats',
+		   'instrument',
+		   'instrumented',
+		   'reset_stats',
+		   'set_instrumentation',
+		   'stats_to_json',
+		  ]
+
+#import packages
+import contextlib
+import functools
+import json
+import threading
+import time
+
+#store current state and records for each function; records are shared by
+# all threads and updated under a lock
+_state = {'enabled' : False}
+_records = {}
+_lock = threading.Lock()
+
+#store, for each thread, the instrumented calls that are currently running
+# (keyed by name, with their nesting depth) and the number of running kernel
+# calls
+_local = threading.local()
+
+#function for getting the running calls of the current thread
+def _running():
+	'''
+	Returns the dictionary of running calls for the current thread, making it
+	if necessary.
+	'''
+
+	try:
+		return _local.running
+
+	except AttributeError:
+		_local.running = {}
+		_local.nkernel = 0
+
+		return _local.running
+
+#decorator for instrumenting a function
+def instrumented(func = None, name = None, kernel = False):
+	'''
+	Decorator that records calls, wall time, and nfev for `func` whenever
+	instrumentation is enabled.
+
+	Parameters
+	----------
+
+	func : function
+		The function to instrument.
+
+	name : str or None
+		The name under which to record statistics. If ``None``, uses the
+		module and qualified function name (e.g., ``'calc_funcs._fHH20'``).
+		Defaults to ``None``.
+
+	kernel : boolean or function
+		If ``True``, each call is counted as a model evaluation, both for
+		`func` and for all instrumented functions that are currently running
+		(e.g., the fitting function that called it). If a function, it is
+		called with the same arguments as `func` and returns the number of
+		evaluations made (e.g., the number of parameter sets in a batch).
+		Kernel calls made within another kernel call are not counted again.
+		Defaults to ``False``.
+
+	Returns
+	-------
+
+	wrapper : function
+		The instrumented function. Attributes of `func` (e.g., ``cache_info``
+		for cached functions) are preserved.
+	'''
+
+	#allow use as @instrumented(name = ..., kernel = ...)
+	if func is None:
+		return functools.partial(instrumented, name = name, kernel = kernel)
+
+	if name is None:
+		name = '%s.%s' % (func.__module__.split('.')[-1], func.__qualname__)
+
+	@functools.wraps(func)
+	def wrapper(*args, **kwargs):
+
+		#near-zero cost path when disabled
+		if not _state['enabled']:
+			return func(*args, **kwargs)
+
+		running = _running()
+
+		with _lock:
+			rec = _records.setdefault(name,
+				{'calls' : 0, 'time' : 0., 'nfev' : 0})
+			rec['calls'] += 1
+
+			#count model evaluations only at the outermost kernel layer, once
+			# for this function and once for each distinct running caller
+			if kernel and _local.nkernel == 0:
+				n = kernel(*args, **kwargs) if callable(kernel) else 1
+				rec['nfev'] += n
+
+				for k, (r, _) in running.items():
+					if k != name:
+						r['nfev'] += n
+
+		#only time the outermost call for recursive or re-entrant functions
+		# (e.g., fit_HH20inv calling calc_L_curve calling fit_HH20inv), such
+		# that time is not counted twice
+		outer = name not in running
+
+		if outer:
+			running[name] = [rec, 1]
+
+		else:
+			running[name][1] += 1
+
+		if kernel:
+			_local.nkernel += 1
+
+		t0 = time.perf_counter()
+
+		try:
+			return func(*args, **kwargs)
+
+		finally:
+			dt = time.perf_counter() - t0
+
+			if kernel:
+				_local.nkernel -= 1
+
+			if outer:
+				del running[name]
+
+				with _lock:
+					rec['time'] += dt
+
+			else:
+				running[name][1] -= 1
+
+	return wrapper
+
+#function to turn instrumentation on or off
+def set_instrumentation(enabled = True):
+	'''
+	Globally enables or disables instrumentation.
+
+	Parameters
+	----------
+
+	enabled : boolean
+		Whether to record statistics for instrumented functions. Defaults to
+		``True``.
+
+	Raises
+	------
+
+	TypeError
+		If `enabled` is not boolean.
+
+	See Also
+	--------
+
+	isotopylog.instrument
+		Context manager for enabling instrumentation within a block.
+	'''
+
+	if not isinstance(enabled, bool):
+		et = type(enabled).__name__
+
+		raise TypeError(
+			'unexpected enabled of type %s. Must be boolean.' % et)
+
+	_state['enabled'] = enabled
+
+#function to check whether instrumentation is on
+def get_instrumentation():
+	'''
+	Returns ``True`` if instrumentation is currently enabled.
+	'''
+	return _state['enabled']
+
+#function to clear all records
+def reset_stats():
+	'''
+	Clears all recorded statistics.
+	'''
+	_records.clear()
+
+#function to export records as a dictionary
+def get_stats():
+	'''
+	Returns recorded statistics for each instrumented function that has been
+	called while instrumentation was enabled.
+
+	Returns
+	-------
+
+	stats : dict
+		Dictionary keyed by function name, with values being dictionaries
+		containing: \n
+			``'calls'``: the number of calls \n
+			``'time'``: total wall time, in seconds, including time spent in
+			nested instrumented functions; re-entrant calls are only timed
+			once \n
+			``'nfev'``: the number of parameter sets evaluated by model
+			kernels during all calls, with batched evaluations counting each
+			parameter set \n
+
+	Notes
+	-----
+
+	Statistics include calls made in all threads of the current process, but
+	are recorded separately in each process; calls made in worker
+	processes (e.g., by ``kDistribution.invert_experiments`` with
+	``n_jobs > 1``) are not included.
+	'''
+	return {k : dict(v) for k, v in _records.items()}
+
+#function to export records as JSON
+def stats_to_json(path = None, **kwargs):
+	'''
+	Exports recorded statistics as a JSON string.
+
+	Parameters
+	----------
+
+	path : str or None
+		If not ``None``, also writes the JSON string to this file path.
+		Defaults to ``None``.
+
+	kwargs
+		Keyword arguments passed to ``json.dumps`` (e.g., ``indent``).
+
+	Returns
+	-------
+
+	s : str
+		The JSON string of ``ipl.get_stats()``.
+	'''
+
+	s = json.dumps(get_stats(), **kwargs)
+
+	if path is not None:
+		with open(path, 'w') as f:
+			f.write(s)
+
+	return s
+
+#context manager for instrumenting a block
+@contextlib.contextmanager
+def instrument(reset = True):
+	'''
+	Context manager that enables instrumentation within a block and restores
+	the previous state on exit.
+
+	Parameters
+	----------
+
+	reset : boolean
+		If ``True``, clears all recorded statistics on entry. Defaults to
+		``True``.
+
+	Yields
+	------
+
+	stats : dict
+		The live statistics dictionary, updated as instrumented functions are
+		called. Use ``ipl.get_stats()`` for a snapshot.
+
+	Examples
+	--------
+
+	Finding where time is spent when inverting a heating experiment::
+
+		#import modules
+		import isotopylog as ipl
+
+		with ipl.instrument() as stats:
+			kd = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+				fit_reg = True)
+
+		print(ipl.stats_to_json(indent = 2))
+	'''
+
+	enabled = _state['enabled']
+
+	if reset:
+		reset_stats()
+
+	_state['enabled'] = True
+
+	try:
+		yield _records
+
+	finally:
+		_state['enabled'] = enabled
@@ -0,0 +1,510 @@
+'''
+This module contains the model kernel registry. Each kernel holds everything
+that is model-specific for a given model type (fitting, isothermal G or D
+evaluation, geologic history evaluation, and Jacobians for uncertainty
+propagation), so that inversion, forward modeling, and geologic history
+calculations all share a single implementation per model.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#set magic attributes
+__docformat__ = 'restructuredtext en'
+__all__ = ['ModelKernel',
+		   'get_kernel',
+		   'kernels',
+		  ]
+
+#import packages
+import inspect
+import numpy as np
+
+#import backend function for geologic-history recursions
+from .backends import gh_recursion
+
+#import necessary functions for calculations
+from .calc_funcs import(
+	_fHea14,
+	_fHH20,
+	_fPH12,
+	_fSE15,
+	_Gaussian,
+	_ghHea14,
+	_ghHH20,
+	_ghPH12,
+	_ghSE15,
+	)
+
+#import decorator for recording hot-path statistics
+from .instrumentation import instrumented
+
+#function for counting the parameter sets evaluated by a kernel call
+def _nbatch(self, t, params, *args, **kwargs):
+	'''
+	Returns the number of parameter sets in `params`, which is either a single
+	parameter set or a batch of shape [``nb`` x ``np``].
+	'''
+	return len(params) if np.ndim(params) == 2 else 1
+
+#define function for batched central-difference Jacobians
+@instrumented
+def _batch_Jacobian(f, t, p, eps = 1e-6):
+	'''
+	Estimates the Jacobian matrix of derivatives by perturbing each parameter
+	in p by some small amount eps, evaluating all perturbed parameter sets in
+	a single batched call.
+
+	Parameters
+	----------
+
+	f : function
+		Batched model function with signature ``f(t, P)``, where ``P`` is of
+		shape [``nb`` x ``np``] and the result is of shape [``nb`` x ``nt``].
+
+	t : np.array
+		Array of time points. Length ``nt``.
+
+	p : array-like
+		An array containing all the parameters that are inputted to f.
+		Length ``np``.
+
+	eps : float
+		The amount to perturb each parameter by. Defaults to ``1e-6``.
+
+	Returns
+	-------
+
+	J : np.array
+		A 2d array containing the Jacobian matrix. Shape [``nt`` x ``np``].
+
+	See Also
+	--------
+
+	_Jacobian
+		Equivalent function that evaluates one parameter set at a time.
+	'''
+
+	#make all plus and minus perturbed parameter sets
+	p = np.asarray(p, dtype = float)
+	npar = len(p)
+
+	dP = eps*np.eye(npar)
+	P = np.concatenate([p + dP, p - dP])
+
+	#evaluate and difference
+	Y = f(t, P)
+
+	return ((Y[:npar] - Y[npar:]) / (2*eps)).T
+
+class ModelKernel(object):
+	__doc__='''
+	Base class for model kernels. Subclasses define the model-specific fit,
+	isothermal, and geologic history functions; batched evaluation and
+	Jacobians default to looping over parameter sets and batched central
+	differences, respectively, unless overridden by faster versions.
+
+	Attributes
+	----------
+
+	model : string
+		The model name.
+
+	returns_D : boolean
+		If ``True``, isothermal evaluation returns D directly rather than
+		reaction progress, G.
+	'''
+
+	model = None
+	returns_D = False
+
+	def __repr__(self):
+		'''
+		Sets how kernels are represented.
+		'''
+		return '<%s kernel>' % self.model
+
+	#define function for fitting
+	def fit(self, he, fit_reg = False, **kwargs):
+		'''
+		Fits the model to a heating experiment.
+
+		Parameters
+		----------
+
+		he : isotopylog.HeatingExperiment
+			The ``ipl.HeatingExperiment`` instance to fit.
+
+		fit_reg : boolean
+			Tells the function whether or not to find the regularized inverse
+			solution. Only used by ``'HH20'``.
+
+		Returns
+		-------
+
+		res : dict
+			Dictionary of ``ipl.kDistribution`` attributes, including
+			``'params'``.
+		'''
+
+		params, params_cov, rmse, npt = self._fit(he, **kwargs)
+
+		return {'params' : params, 'params_cov' : params_cov, 'rmse' : rmse,
+			'npt' : npt, 'nu' : None, 'omega' : None, 'rho_nu' : None,
+			'rho_nu_inv' : None, 'res_inv' : None, 'rgh_inv' : None}
+
+	#define functions for isothermal evaluation
+	def iso_kwargs(self, he, kd, t, z = 6):
+		'''
+		Returns any non-fit arguments needed for isothermal evaluation of a
+		given experiment and kDistribution.
+		'''
+		return {}
+
+	@instrumented(kernel = _nbatch)
+	def isothermal(self, t, params, **kwargs):
+		'''
+		Evaluates G (or D, if ``returns_D``) at each time point.
+
+		Parameters
+		----------
+
+		t : np.array
+			Array of time points. Length ``nt``.
+
+		params : array-like
+			Model parameters, either of length ``np`` or as a batch of shape
+			[``nb`` x ``np``].
+
+		Returns
+		-------
+
+		Y : np.array
+			Model values, of length ``nt`` or of shape [``nb`` x ``nt``].
+		'''
+
+		P = np.asarray(params, dtype = float)
+
+		if P.ndim == 1:
+			return self._iso_batch(t, P[None,:], **kwargs)[0]
+
+		return self._iso_batch(t, P, **kwargs)
+
+	def isothermal_jacobian(self, t, p, eps = 1e-6, **kwargs):
+		'''
+		Calculates the isothermal Jacobian, of shape [``nt`` x ``np``].
+		'''
+		f = lambda t, P : self.isothermal(t, P, **kwargs)
+
+		return _batch_Jacobian(f, t, p, eps = eps)
+
+	def _iso_batch(self, t, P, **kwargs):
+		'''
+		Batched isothermal evaluation; loops over parameter sets unless
+		overridden.
+		'''
+		return np.array([self._iso(t, *p, **kwargs) for p in P])
+
+	#define functions for geologic history evaluation
+	def geologic_params(self, ed):
+		'''
+		Extracts Arrhenius parameters and their covariance from an
+		``ipl.EDistribution``, in the order used by ``geologic``.
+		'''
+		return ed.Eparams.T.flatten(), ed.Eparams_cov
+
+	@instrumented(kernel = _nbatch)
+	def geologic(self, t, params, Deq, T, Tref, **kwargs):
+		'''
+		Evaluates D along a geologic time-temperature history.
+
+		Parameters
+		----------
+
+		t : np.array
+			Array of time points. Length ``nt``.
+
+		params : array-like
+			Arrhenius parameters followed by D0, either as a single parameter
+			set or as a batch of shape [``nb`` x ``np``].
+
+		Deq : np.array
+			Equilibrium D47 value at each time point. Length ``nt``.
+
+		T : np.array
+			Temperature at each time point, in Kelvin. Length ``nt``.
+
+		Tref : float
+			The Arrhenius reference temperature, in Kelvin.
+
+		Returns
+		-------
+
+		D : np.array
+			D47 values, of length ``nt`` or of shape [``nb`` x ``nt``].
+		'''
+
+		P = np.asarray(params, dtype = float)
+
+		if P.ndim == 1:
+			return self._gh_batch(t, P[None,:], Deq, T, Tref, **kwargs)[0]
+
+		return self._gh_batch(t, P, Deq, T, Tref, **kwargs)
+
+	def geologic_jacobian(self, t, p, Deq, T, Tref, eps = 1e-6, **kwargs):
+		'''
+		Calculates the geologic history Jacobian, of shape [``nt`` x ``np``].
+		'''
+		f = lambda t, P : self.geologic(t, P, Deq, T, Tref, **kwargs)
+
+		return _batch_Jacobian(f, t, p, eps = eps)
+
+	def _gh_batch(self, t, P, Deq, T, Tref, **kwargs):
+		'''
+		Batched geologic history evaluation; loops over parameter sets unless
+		overridden.
+		'''
+		return np.array([self._gh(t, p, Deq, T, Tref, **kwargs) for p in P])
+
+	#define functions for calculating Arrhenius-derived k values
+	@staticmethod
+	def _lnk(t, T, Tref, E, lnkref):
+		'''
+		Returns lnk at each time point for each parameter set, of shape
+		[``nb`` x ``nt``].
+		'''
+		R = 8.314/1000 #in kJ/mol/K
+
+		return lnkref[:,None] + (E[:,None]/R)*(1/Tref - 1/T)
+
+class PH12Kernel(ModelKernel):
+	__doc__='''
+	Kernel for the pseudo-first order model of Passey and Henkes (2012).
+	'''
+
+	model = 'PH12'
+
+	def _fit(self, he, **kwargs):
+		#imported here since ratedata_helper depends on core_functions
+		from .ratedata_helper import fit_PH12
+		return fit_PH12(he, **kwargs)
+
+	def _iso_batch(self, t, P, **kwargs):
+		return _fPH12(t, P[:,0,None], P[:,1,None], logG = False)
+
+	def isothermal_jacobian(self, t, p, eps = 1e-6, **kwargs):
+		'''
+		Calculates the analytic isothermal Jacobian of lnG (the quantity fit
+		by ``fit_PH12``), of shape [``nt`` x 2].
+		'''
+		lnk, intercept = p
+
+		return np.column_stack([-t*np.exp(lnk), np.ones(len(t))/intercept])
+
+	def geologic_params(self, ed):
+		return ed.Eparams[:,0], ed.Eparams_cov[:2,:2]
+
+	def _gh(self, t, p, Deq, T, Tref, **kwargs):
+		return _ghPH12(t, *p, Deq, T, Tref)
+
+	def _gh_batch(self, t, P, Deq, T, Tref, **kwargs):
+		dt = np.gradient(t)
+		kappa = np.exp(self._lnk(t, T, Tref, P[:,0], P[:,1]))
+
+		return gh_recursion(P[:,2], Deq, np.exp(-kappa*dt))
+
+class Hea14Kernel(ModelKernel):
+	__doc__='''
+	Kernel for the transient defect/equilibrium defect model of Henkes et al.
+	(2014).
+	'''
+
+	model = 'Hea14'
+
+	def _fit(self, he, **kwargs):
+		#imported here since ratedata_helper depends on core_functions
+		from .ratedata_helper import fit_Hea14
+		return fit_Hea14(he, **kwargs)
+
+	def _iso_batch(self, t, P, **kwargs):
+		return _fHea14(t, *(P[:,i,None] for i in range(3)), logG = False)
+
+	def isothermal_jacobian(self, t, p, eps = 1e-6, **kwargs):
+		'''
+		Calculates the analytic isothermal Jacobian of lnG (the quantity fit
+		by ``fit_Hea14``), of shape [``nt`` x 3].
+		'''
+		kc, kd, k2 = np.exp(p)
+		e2 = np.exp(-k2*t)
+
+		return np.column_stack([
+			-kc*t,
+			(kd/k2)*(e2 - 1),
+			(kd/k2)*(1 - e2 - k2*t*e2),
+			])
+
+	def _gh(self, t, p, Deq, T, Tref, **kwargs):
+		return _ghHea14(t, *p, Deq, T, Tref)
+
+	def _gh_batch(self, t, P, Deq, T, Tref, **kwargs):
+		dt = np.gradient(t)
+		kc = np.exp(self._lnk(t, T, Tref, P[:,0], P[:,1]))
+		kd = np.exp(self._lnk(t, T, Tref, P[:,2], P[:,3]))
+		k2 = np.exp(self._lnk(t, T, Tref, P[:,4], P[:,5]))
+
+		K = np.exp(-kc*dt + (kd/k2)*(np.exp(-k2*dt) - 1))
+
+		return gh_recursion(P[:,6], Deq, K)
+
+class HH20Kernel(ModelKernel):
+	__doc__='''
+	Kernel for the lognormal distributed activation energy model of
+	Hemingway and Henkes (2020).
+	'''
+
+	model = 'HH20'
+
+	def fit(self, he, fit_reg = False, **kwargs):
+		#imported here since ratedata_helper depends on core_functions
+		from .ratedata_helper import fit_HH20, fit_HH20inv
+
+		#running the model in this order properly catches any nonsense
+		# kwargs!
+
+		#include regularized data if necessary
+		if fit_reg is True:
+
+			#fit the model using the inverse function
+			rho_nu_inv, omega, res_inv, rgh_inv = fit_HH20inv(he, **kwargs)
+
+			#extract fit_HH20 kwargs and run Gaussian fit.
+			ars = inspect.signature(fit_HH20).parameters
+			kwargs = {k : v for k, v in kwargs.items() if k in ars}
+
+		else:
+
+			#this model has no rho_nu_inv and associated statistics
+			rho_nu_inv = omega = res_inv = rgh_inv = None
+
+		#run Gaussian fit
+		params, params_cov, rmse, npt, nu, rho_nu = fit_HH20(he, **kwargs)
+
+		return {'params' : params, 'params_cov' : params_cov, 'rmse' : rmse,
+			'npt' : npt, 'nu' : nu, 'omega' : omega, 'rho_nu' : rho_nu,
+			'rho_nu_inv' : rho_nu_inv, 'res_inv' : res_inv,
+			'rgh_inv' : rgh_inv}
+
+	def iso_kwargs(self, he, kd, t, z = 6):
+		return {'nu_max' : np.max(kd.nu), 'nu_min' : np.min(kd.nu),
+			'nnu' : len(kd.nu)}
+
+	def _iso(self, t, mu_nu, sig_nu, nu_max, nu_min, nnu):
+		return _fHH20(t, mu_nu, sig_nu, nu_max, nu_min, nnu)
+
+	def _iso_batch(self, t, P, nu_max, nu_min, nnu):
+
+		#shared nu grid and decay matrix, of shape [nnu x nt]
+		nu = np.linspace(nu_min, nu_max, nnu)
+		dnu = nu[1] - nu[0]
+		B = np.exp(-np.outer(np.exp(nu), t))*dnu
+
+		#rho for each parameter set, of shape [nb x nnu]
+		rho = _Gaussian(nu, P[:,0], P[:,1]).reshape(nnu, -1).T
+
+		return np.dot(rho, B)
+
+	def _gh(self, t, p, Deq, T, Tref, nnu = 400, dtype = np.float64, 
+		**kwargs):
+		return _ghHH20(t, *p, Deq, T, Tref, nnu = nnu, dtype = dtype)
+
+class SE15Kernel(ModelKernel):
+	__doc__='''
+	Kernel for the paired diffusion model of Stolper and Eiler (2015).
+	Isothermal evaluation returns D rather than G.
+	'''
+
+	model = 'SE15'
+	returns_D = True
+
+	def _fit(self, he, **kwargs):
+		#imported here since ratedata_helper depends on core_functions
+		from .ratedata_helper import fit_SE15
+		return fit_SE15(he, **kwargs)
+
+	def iso_kwargs(self, he, kd, t, z = 6):
+		#calculate d0 and T arrays
+		d13C = np.mean(he.dex[:,1]) #use average of all experimental points
+		d18O = np.mean(he.dex[:,2]) #use average of all experimental points
+
+		return {'d0' : np.array([he.dex[0,0], d13C, d18O]),
+			'T' : np.ones(len(t))*he.T, 'calibration' : he.calibration,
+			'iso_params' : he.iso_params, 'ref_frame' : he.ref_frame, 'z' : z}
+
+	def _iso(self, t, lnk1, lnkds, mp, **kwargs):
+		return _fSE15(t, lnk1, lnkds, mp, **kwargs)[0]
+
+	def _gh(self, t, p, Deq, T, Tref, d0 = None, calibration = 'Bea17',
+		iso_params = 'Gonfiantini', ref_frame = 'CDES90', z = 6, **kwargs):
+		return _ghSE15(
+			t,
+			*p,
+			d0[1],
+			d0[2],
+			T,
+			Tref,
+			calibration = calibration,
+			iso_params = iso_params,
+			ref_frame = ref_frame,
+			z = z)[0]
+
+#store kernels in registry
+kernels = {k.model : k for k in
+	(PH12Kernel(), Hea14Kernel(), HH20Kernel(), SE15Kernel())}
+
+#function to retrieve kernels
+def get_kernel(model):
+	'''
+	Retrieves the kernel for a given model.
+
+	Parameters
+	----------
+
+	model : string
+		The model name; one of ``'PH12'``, ``'Hea14'``, ``'HH20'``, or
+		``'SE15'``.
+
+	Returns
+	-------
+
+	kernel : ModelKernel
+		The kernel instance.
+
+	Raises
+	------
+
+	ValueError
+		If `model` is not an acceptable string.
+
+	TypeError
+		If `model` is not a string.
+	'''
+
+	#raise different exception if it's not a string
+	if not isinstance(model, str):
+
+		mdt = type(model).__name__
+
+		raise TypeError(
+			'Unexpected model of type %s. Must be string.' % mdt)
+
+	try:
+		return kernels[model]
+
+	#raise exception if it's not an acceptable string
+	except KeyError:
+		raise ValueError(
+			'%s is an invalid model string. Must be one of: "PH12",'
+			'"Hea14", "SE15", or "HH20"' % model)
@@ -15,12 +15,13 @@ __all__ = [
 	]
 
 #import modules
-import inspect
-import matplotlib.pyplot as plt
+import hashlib
 import numpy as np
-import pandas as pd
 import warnings
 
+#import process pool for batch inversions
+from concurrent.futures import ProcessPoolExecutor
+
 #import necessary calulation functions
 from .calc_funcs import(
 	_fArrhenius,
@@ -30,18 +31,25 @@ from .calc_funcs import(
 #import helper functions
 from .ratedata_helper import(
 	fit_Arrhenius,
-	fit_Hea14,
-	fit_HH20,
-	fit_HH20inv,
-	fit_PH12,
-	fit_SE15,
+	)
+
+#import model kernel registry
+from .model_kernels import get_kernel
+
+#import disk cache functions for fit results
+from .fit_cache import(
+	_cache_load,
+	_cache_store,
+	_fit_key,
 	)
 
 #import necessary dictionaries
 from .dictionaries import(
+	cal_coeffs,
 	ed_params,
-	lit_kd_dict,
+	lit_kd_data,
 	mod_params,
+	register_calibration,
 	zi,
 	)
 
@@ -210,6 +218,22 @@ class kDistribution(object):
 	[7] Hemingway and Henkes (2020) *Earth Planet. Sci. Lett.*, **X**, XX--XX.
 	'''
 
+	#define the stored attributes
+	__slots__ = (
+		'_model',
+		'_npt',
+		'_nu',
+		'_omega',
+		'_params',
+		'_params_cov',
+		'_res_inv',
+		'_rgh_inv',
+		'_rho_nu',
+		'_rho_nu_inv',
+		'_rmse',
+		'_T',
+		)
+
 	#define all the possible attributes for __init__ using _kwattrs
 	_kwattrs = {
 		'nu' : None, 
@@ -236,9 +260,11 @@ class kDistribution(object):
 			The ``kDistribution`` object.
 		'''
 
-		#first set everything in _kwattrs to its default value
-		for k, v in self._kwattrs.items():
-			setattr(self, k, v)
+		#first set everything in _kwattrs to its default value; since all
+		# defaults are None, set the stored slots directly
+		self._npt = self._nu = self._omega = self._params_cov = None
+		self._res_inv = self._rgh_inv = self._rho_nu = self._rho_nu_inv = None
+		self._rmse = None
 
 		#then, set arguments
 		self.params = params
@@ -271,17 +297,25 @@ class kDistribution(object):
 	#customize the __eq__ method for determining if two kDistributions are equal
 	def __eq__(self, other):
 		'''
-		Sets how kDistributions are evaluated when checking equality
+		Sets how kDistributions are evaluated when checking equality. Two
+		kDistributions are equal if their model, T, nu, params, and params_cov
+		values are exactly equal (see ``_array_equal``).
 
 		Returns
 		-------
 
 		b : boolean
 			Boolean telling whether or not two kDistribution objects are equal.
+
+		See Also
+		--------
+
+		kDistribution.allclose
+			Method for testing equality to within a given tolerance.
 		'''
 
 		try:
-			b = (self.summary == other.summary).all()
+			b = self._compare(other, _array_equal)
 
 		except AttributeError:
 			warnings.warn(
@@ -292,6 +326,19 @@ class kDistribution(object):
 
 		return b
 
+	#customize the __hash__ method so kDistributions can be stored in sets
+	def __hash__(self):
+		'''
+		Sets how kDistributions are hashed, using the numeric fingerprint.
+
+		Returns
+		-------
+
+		h : int
+			Hash of the kDistribution fingerprint.
+		'''
+		return hash(self.fingerprint)
+
 	#Define @classmethods
 	#define classmethod for generating kDistribution instance from data
 	@classmethod
@@ -403,97 +450,145 @@ class kDistribution(object):
 			XX--XX.
 		'''
 
-		#check which model and run the corresponding inversion method:
+		#load stored results if the fit cache is enabled and this fit has
+		# already been done
+		key = _fit_key('invert_experiment', he, model = model,
+			fit_reg = fit_reg, **kwargs)
+		res = _cache_load(key)
 
-		#Passey and Henkes 2012
-		if model == 'PH12':
+		#otherwise, get the model kernel (raises exception if model is not
+		# acceptable) and run the corresponding inversion method
+		if res is None:
+			res = get_kernel(model).fit(he, fit_reg = fit_reg, **kwargs)
+			_cache_store(key, res)
 
-			#fit the model
-			params, params_cov, rmse, npt = fit_PH12(he, **kwargs)
+		params = res.pop('params')
 
-		#Henkes et al. 2014
-		elif model == 'Hea14':
+		#return class instance
+		return cls(
+			params,
+			model,
+			he.T,
+			**res
+			)
 
-			#fit the model
-			params, params_cov, rmse, npt = fit_Hea14(he, **kwargs)
+	#define classmethod for generating many kDistribution instances at once
+	@classmethod
+	def invert_experiments(
+		cls,
+		hes,
+		model = 'HH20',
+		fit_reg = False,
+		n_jobs = None,
+		**kwargs
+		):
+		'''
+		Classmethod for generating a list of ``kDistribution`` instances by
+		inverting many ``ipl.HeatingExperiment`` objects at once. Each
+		experiment is fit using ``kDistribution.invert_experiment`` in a
+		separate process.
 
-		#Stolper and Eiler 2015
-		elif model == 'SE15':
+		Parameters
+		----------
 
-			#fit the model
-			params, params_cov, rmse, npt = fit_SE15(he, **kwargs)
+		hes : list
+			List of ``ipl.HeatingExperiment`` instances to fit.
 
-		#Hemingway and Henkes 2020
-		elif model == 'HH20':
+		model : string
+			The type of model to fit. See ``kDistribution.invert_experiment``
+			for options. Defaults to ``'HH20'``.
 
-			#running the model in this order properly catches any nonsense
-			# kwargs!
+		fit_reg : boolean
+			Tells the function whether or not to find the regularized inverse
+			solution in addition to the lognormal solution. This only applies
+			if `model = 'HH20'`.
 
-			#include regularized data if necessary
-			if fit_reg is True:
+		n_jobs : None or int
+			The number of worker processes to use. If ``None``, uses the number
+			of available CPUs. If ``1``, all experiments are fit serially in the
+			current process. Defaults to ``None``.
 
-				#fit the model using the inverse function
-				rho_nu_inv, omega, res_inv, rgh_inv = fit_HH20inv(
-					he, 
-					**kwargs
-					)
+		Returns
+		-------
 
-				#extract fit_HH20 kwargs and run Gaussian fit.
-				ars = [k for k, v in inspect.signature(
-					fit_HH20).parameters.items()]
+		kds : list
+			List of resulting ``ipl.kDistribution`` instances, in the same
+			order as `hes`. Entries whose fit failed are ``None``.
 
-				kwa = {k : kwargs[k] for k in dict(kwargs) if k in ars}
+		errs : list
+			List of the same length as `kds` containing the exception raised by
+			each failed fit, or ``None`` for successful fits.
 
-				#run Gaussian fit
-				params, params_cov, rmse, npt, nu, rho_nu = fit_HH20(
-					he, 
-					**kwa
-					)
+		Notes
+		-----
 
-			else:
+		Any additional keyword arguments are passed to every call of
+		``kDistribution.invert_experiment``. Results are returned in input
+		order regardless of the order in which worker processes finish.
 
-				#run Gaussian fit
-				params, params_cov, rmse, npt, nu, rho_nu = fit_HH20(
-					he, 
-					**kwargs
-					)
+		Experiments using a custom lambda calibration cannot be sent to worker
+		processes; in this case all experiments are fit serially. Calibrations
+		added using ``ipl.register_calibration`` are re-registered in each
+		worker process, such that results do not depend on the process start
+		method (e.g., spawn on macOS and Windows).
 
-				#this model has no rho_nu_inv and associated statistics
-				rho_nu_inv = omega = res_inv = rgh_inv = None
+		See Also
+		--------
 
-		#raise exception if it's not an acceptable string
-		elif isinstance(model, str):
-			raise ValueError(
-				'%s is an invalid model string. Must be one of: "PH12",'
-				'"Hea14", "SE15", or "HH20"' % model)
+		kDistribution.invert_experiment
+			Method for fitting a single experiment.
 
-		#raise different exception if it's not a string
-		else:
+		isotopylog.EDistribution.from_experiments
+			Method for fitting many experiments and directly combining the
+			results into an ``EDistribution``.
 
-			mdt = type(model).__name__
+		Examples
+		--------
 
-			raise TypeError(
-				'Unexpected model of type %s. Must be string.' % mdt)
+		Fitting a list of HeatingExperiment objects using 4 processes::
 
-		#set HH20 specific attributes to not if model is not HH20
-		if model != 'HH20':
-			nu = omega = rho_nu = rho_nu_inv = res_inv = rgh_inv = None
+			#import packages
+			import isotopylog as ipl
 
-		#return class instance
-		return cls(
-			params,
-			model,
-			he.T,
-			nu = nu,
-			npt = npt,
-			omega = omega,
-			params_cov = params_cov,
-			rho_nu = rho_nu,
-			rho_nu_inv = rho_nu_inv,
-			res_inv = res_inv,
-			rgh_inv = rgh_inv,
-			rmse = rmse
-			)
+			#assume hes is a list of HeatingExperiment objects
+			kds, errs = ipl.kDistribution.invert_experiments(
+				hes,
+				model = 'HH20',
+				n_jobs = 4
+				)
+		'''
+
+		#store coefficients of all named calibrations used, since calibrations
+		# added using ipl.register_calibration do not exist in worker
+		# processes started using spawn or forkserver
+		cals = {he.calibration : cal_coeffs[he.calibration] for he in hes
+			if he.calibration in cal_coeffs}
+
+		#make list of arguments to pass to each worker
+		args = [(cls, he, model, fit_reg, kwargs, cals) for he in hes]
+
+		#lambda calibrations cannot be pickled, so fit these serially
+		if n_jobs != 1 and any(he.calibration == 'Custom' for he in hes):
+
+			warnings.warn(
+				'HeatingExperiments with custom lambda calibrations cannot be'
+				' sent to worker processes. Fitting serially instead.',
+				UserWarning)
+
+			n_jobs = 1
+
+		#fit each experiment, preserving input order
+		if n_jobs == 1 or len(args) <= 1:
+			res = [_invert_worker(a) for a in args]
+
+		else:
+			with ProcessPoolExecutor(max_workers = n_jobs) as ex:
+				res = list(ex.map(_invert_worker, args))
+
+		kds = [r[0] for r in res]
+		errs = [r[1] for r in res]
+
+		return kds, errs
 
 	#define classmethod for generating kDistribution instance directly from
 	# EDistribution
@@ -530,6 +625,9 @@ class kDistribution(object):
 		value that is within the range of experimental T values (that is,
 		interpolate rather than extrapolate in 1/T space).
 
+		Resulting parameter covariance includes the covariance between E and
+		ln(kref); see ``kDistribution.params_from_EDistribution``.
+
 		See Also
 		--------
 
@@ -537,6 +635,10 @@ class kDistribution(object):
 			The class for combining multiple ``kDistribution`` instances and
 			determining the underlying activation energies.
 
+		kDistribution.params_from_EDistribution
+			Classmethod for calculating rate parameters over many temperatures
+			at once.
+
 		Examples
 		--------
 
@@ -553,25 +655,214 @@ class kDistribution(object):
 			kd = ipl.kDistribution.from_EDistribution(ed, T)
 		'''
 
+		#calculate rate parameters and covariance at T
+		params, params_cov = cls.params_from_EDistribution(ed, T)
+
+		#return class instance
+		return cls(params, ed.model, T, params_cov = params_cov)
+
+	#define classmethod for calculating rate parameters over many temperatures
+	@classmethod
+	def params_from_EDistribution(cls, ed, T):
+		'''
+		Classmethod for calculating rate parameters and their covariance
+		directly from activation energy data at any number of temperatures in
+		a single vectorized evaluation, without creating ``kDistribution``
+		instances.
+
+		Parameters
+		----------
+
+		ed : isotopylog.EDistribution
+			The ``ipl.EDistribution`` instance containing the activation energy
+			data of interest.
+
+		T : float or array-like
+			The temperature(s) at which to calculate rates, in Kelvin. Can be
+			of any shape.
+
+		Returns
+		-------
+
+		params : np.ndarray
+			Array of resulting rate parameters, of shape [``T.shape`` x 
+			``nkp``], where ``nkp`` is the number of model parameters.
+
+		params_cov : np.ndarray
+			Array of the full rate parameter covariance matrix at each 
+			temperature, of shape [``T.shape`` x ``nkp`` x ``nkp``].
+
+		Notes
+		-----
+
+		Covariance is propagated from the full ``ed.Eparams_cov`` matrix, 
+		including the covariance between E and ln(kref). Parameters that are
+		regressed with a forced zero intercept (see ``fit_Arrhenius``) are 
+		calculated with Tref = inf, consistent with their regression.
+
+		See Also
+		--------
+
+		kDistribution.from_EDistribution
+			Classmethod for generating a single ``kDistribution`` instance.
+
+		Examples
+		--------
+
+		Assuming some EDistribution instance exists, rate data can be calculated
+		over a temperature sweep as::
+
+			#import packages
+			import isotopylog as ipl
+			import numpy as np
+
+			#say, calculate data from 100 to 500 C
+			T = np.linspace(100, 500, 1000) + 273.15
+
+			#assuming EDistribution instance, ed
+			params, params_cov = ipl.kDistribution.params_from_EDistribution(
+				ed, T)
+		'''
+
 		#extract relevant data from EDistribution
 		E = ed.Eparams[0,:] #KJ/mol
 		lnkref = ed.Eparams[1,:]
-		Tref = ed.Tref
+		Eparams_cov = ed.Eparams_cov
 		R = 8.314e-3 #KJ/mol/K
 
+		#calculate x values in Arrhenius space for each T and param, using
+		# Tref = inf for params with zero intercept
+		T = np.asarray(T, dtype = float)
+		Trefs = np.where(zi[ed.model], np.inf, ed.Tref)
+
+		x = (1/Trefs - 1/T[...,None])/R
+
 		#calculate rate parameters
-		params = lnkref + (E/R)*(1/Tref - 1/T)
+		params = lnkref + E*x
 
-		#calculate rate parameter uncertainty
-		Evar = np.diag(ed.Eparams_cov)[::2]
-		lnkref_var = np.diag(ed.Eparams_cov)[1::2]
+		#make Jacobian of params w.r.t. [E, lnkref] for each param, of shape
+		# [T.shape x nkp x 2nkp], and propagate covariance
+		nkp = len(E)
+		J = np.zeros(x.shape + (2*nkp,))
 
-		lnk_var = lnkref_var + Evar*((1/R)*(1/Tref - 1/T))**2
-		params_cov = np.diag(lnk_var)
+		i = np.arange(nkp)
+		J[..., i, 2*i] = x
+		J[..., i, 2*i + 1] = 1
 
-		#return class instance
-		return cls(params, ed.model, T, params_cov = params_cov)
+		params_cov = J @ Eparams_cov @ np.swapaxes(J, -1, -2)
+
+		return params, params_cov
+
+	#define method for testing equality to within a tolerance
+	def allclose(self, other, rtol = 1e-5, atol = 1e-8):
+		'''
+		Determines whether two kDistributions are equal to within a tolerance.
+		Models must be identical, while T, nu, params, and params_cov values are
+		compared using ``np.allclose``.
+
+		Parameters
+		----------
+
+		other : isotopylog.kDistribution
+			The ``kDistribution`` to compare against.
+
+		rtol : float
+			The relative tolerance, as in ``np.allclose``. Defaults to 
+			``1e-5``.
+
+		atol : float
+			The absolute tolerance, as in ``np.allclose``. Defaults to 
+			``1e-8``.
+
+		Returns
+		-------
+
+		b : boolean
+			Boolean telling whether or not two kDistribution objects are equal
+			to within the inputted tolerance.
+
+		Warnings
+		--------
+
+		UserWarning
+			If attempting to compare to an object that is not a 
+			``kDistribution``.
+
+		Examples
+		--------
+
+		Comparing two kDistributions, kd1 and kd2, that may differ due to
+		floating-point noise::
+
+			kd1.allclose(kd2, rtol = 1e-8)
+		'''
+
+		#make comparison function; arrays must be of the same shape
+		cmp = lambda a, b: np.shape(a) == np.shape(b) and \
+			np.allclose(a, b, rtol = rtol, atol = atol)
+
+		try:
+			b = self._compare(other, cmp)
+
+		except AttributeError:
+			warnings.warn(
+				'Attempting to test equality of objects of different type',
+				UserWarning)
+
+			b = False
+
+		return b
+
+	#define method for comparing the numeric contents of two kDistributions
+	def _compare(self, other, cmp):
+		'''
+		Compares model, T, nu, params, and params_cov values between two
+		kDistributions using the inputted comparison function.
 
+		Parameters
+		----------
+
+		other : isotopylog.kDistribution
+			The ``kDistribution`` to compare against.
+
+		cmp : function
+			Function taking two array-like inputs and returning a boolean.
+
+		Returns
+		-------
+
+		b : boolean
+			Boolean telling whether or not all entries compare as equal.
+
+		Raises
+		------
+
+		AttributeError
+			If `other` does not contain the compared attributes.
+		'''
+
+		#models must be identical
+		if self.model != other.model:
+			return False
+
+		#compare each numeric attribute, allowing for None values
+		pairs = [
+			(self.T, other.T),
+			(self.nu, other.nu),
+			(self.params, other.params),
+			(self.params_cov, other.params_cov),
+			]
+
+		for a, b in pairs:
+
+			if a is None or b is None:
+				if a is not b:
+					return False
+
+			elif not cmp(a, b):
+				return False
+
+		return True
 
 	#define method for plotting HH20 results
 	def plot(self, ax = None, lnd = {}, invd = {}):
@@ -656,8 +947,9 @@ class kDistribution(object):
 				' fits can be plotted. Consider extracting k values directly'
 				' from summary table instead.' % self.model)
 
-		#make axis if necessary
+		#make axis if necessary, importing plotting backend only when needed
 		if ax is None:
+			import matplotlib.pyplot as plt
 			_, ax = plt.subplots(1,1)
 
 		#plot lognormal data
@@ -692,7 +984,86 @@ class kDistribution(object):
 		#return result
 		return ax
 
+	#define classmethod for loading a saved kDistribution
+	@classmethod
+	def load(cls, file, name = None, mmap_mode = None):
+		'''
+		Classmethod for loading a ``kDistribution`` instance saved using the
+		``save`` method or ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		name : str or None
+			The name of the object to load. If ``None``, loads the first
+			``kDistribution`` in the file. Defaults to ``None``.
+
+		mmap_mode : None or str
+			If ``'r'`` or ``'c'``, numeric arrays (e.g., ``rho_nu_inv``)
+			are loaded as memory maps. Defaults to ``None``.
+
+		Returns
+		-------
+
+		kd : isotopylog.kDistribution
+			The loaded ``kDistribution`` instance.
+
+		See Also
+		--------
+
+		isotopylog.load
+			Function for loading all objects in a file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import _load_one
+
+		return _load_one(cls, file, name, mmap_mode)
+
+	#define method for saving to a binary file
+	def save(self, file, compress = False):
+		'''
+		Saves the ``kDistribution`` instance to a binary ``.npz`` (or, if the
+		file ends in ``'.h5'`` or ``'.hdf5'``, HDF5) file. To store many
+		objects in one file, use ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		compress : boolean
+			Whether to compress arrays. Compressed arrays cannot be memory
+			mapped when loading. Defaults to ``False``.
+
+		See Also
+		--------
+
+		isotopylog.save
+			Function for saving many objects to one file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import save
+
+		save(file, self, compress = compress)
+
 	#Define @property getters and setters
+	@property
+	def fingerprint(self):
+		'''
+		A sha1 hex digest of the model, T, params, and params_cov values. Two
+		kDistributions with identical numeric contents have identical
+		fingerprints, allowing duplicates to be found without comparing
+		summary tables.
+		'''
+
+		return _kd_fingerprint(self.model, self.T, self.params, self.params_cov)
+
 	@property
 	def nu(self):
 		'''
@@ -928,6 +1299,8 @@ class kDistribution(object):
 				  'T' : self.T
 				 }
 
+		#import pandas only when needed
+		import pandas as pd
 		s = pd.Series(attrs)
 
 		return s
@@ -961,8 +1334,9 @@ class EDistribution(object):
 		activation energies.
 
 	p0 : list
-		List of initial guesses for fitting E parameters. Defaults to
-		``[150, -7]``, which should be adequate for all model fits.
+		Retained for backwards compatibility only; the Arrhenius regression
+		is solved in closed form and does not use an initial guess. Defaults
+		to ``[150, -7]``.
 
 	Tref : int
 		The temperature at which the reference k value is calculated. Following
@@ -1089,6 +1463,9 @@ class EDistribution(object):
 		'Tref' : np.inf,
 		}
 
+	#store literature instances, keyed by (reference, mineral)
+	_lit_cache = {}
+
 	#define magic methods
 	#initialize the object
 	def __init__(self, kds, **kwargs):
@@ -1134,49 +1511,251 @@ class EDistribution(object):
 		return str(self.summary)
 
 	#Define @classmethods
-	#define classmethod for generating EDistribution instance from literature
-	# data
+	#define classmethod for generating EDistribution instance from arrays
 	@classmethod
-	def from_literature(cls, mineral = 'calcite', reference = 'HH20', **kwargs):
+	def _from_arrays(
+		cls, 
+		model, 
+		T, 
+		params, 
+		params_cov, 
+		objs = None, 
+		fps = None, 
+		**kwargs
+		):
 		'''
-		Classmethod for generating an ``ipl.EDistribution`` instance directly
-		from literature data. This method simply inputs the results of
-		literature model fits; it does not re-calculate rate data using raw
-		literature D data.
+		Classmethod for generating an ``EDistribution`` instance directly from
+		stacked arrays, without creating any ``kDistribution`` objects unless
+		given. These are only made if the ``kds`` attribute is accessed.
 
 		Parameters
 		----------
 
-		mineral : string
-			The mineral type whose data will be imported. Current options are:\n
-				``'apatite'`` ('SE15' reference only)\n
-				``'calcite'`` (all references)\n
-				``'dolomite'`` ('HH20' reference only)
+		model : str
+			The model type of all entries.
 
-		reference : string
-			The reference whose data will be imported. Current options are:\n
-				``'PH12'`` (Passey and Henkes 2012; model type 'PH12')\n
-				``'Hea14'`` (Henkes et al. 2014; model type 'Hea14')\n
-				``'SE15'`` (Stolper and Eiler 2015; model type 'SE15')\n
-				``'Bea18'`` (Brenner et al. 2018; model type 'SE15')\n
-				``'HH20'`` (Hemingway and Henkes 2020; model type 'HH20')
+		T : array-like
+			Array of temperatures, in Kelvin. Of length ``npt``.
+
+		params : array-like
+			2d array of rate parameters, of shape [``npt`` x ``nkp``].
+
+		params_cov : array-like
+			3d array of rate parameter covariance matrices, of shape
+			[``npt`` x ``nkp`` x ``nkp``].
+
+		objs : None or list
+			List of corresponding ``kDistribution`` objects, or ``None`` for
+			entries that should be made when needed. If ``None``, no objects
+			are made. Defaults to ``None``.
+
+		fps : None or list
+			List of corresponding fingerprints. If ``None``, fingerprints are
+			calculated from the arrays. Defaults to ``None``.
 
 		Returns
 		-------
 
 		ed : isotopylog.EDistribution
-			The ``ipl.EDistribution`` object containing all the literature data.
+			The ``EDistribution`` object.
+		'''
 
-		Raises
-		------
+		#make instance without calling __init__, setting defaults
+		ed = cls.__new__(cls)
 
-		ValueError
-			If inputted ``mineral`` or ``reference`` string are not appropriate.
+		for k, v in cls._kwattrs.items():
+			setattr(ed, k, v)
 
-		Notes
-		-----
+		#store arrays
+		T = np.asarray(T, dtype = float)
+		params = np.asarray(params, dtype = float)
+		params_cov = np.asarray(params_cov, dtype = float)
 
-		All rate data within the ``ed.kds`` list are reported in units of
+		if objs is None:
+			objs = [None]*len(T)
+
+		if fps is None:
+			fps = [_kd_fingerprint(model, *e) 
+				for e in zip(T, params, params_cov)]
+
+		ed._reset(model)
+		ed._extend(T, params, params_cov, objs, fps)
+
+		#overwrite all attributes in kwargs and raise exception if unknown
+		for k, v in kwargs.items():
+			if k in cls._kwattrs:
+				setattr(ed, k, v)
+
+			else:
+				raise ValueError(
+					'__init__() got an unexpected keyword argument %s' % k)
+
+		return ed
+
+	#define classmethod for generating EDistribution instance directly from a
+	# list of heating experiments
+	@classmethod
+	def from_experiments(
+		cls,
+		hes,
+		model = 'HH20',
+		fit_reg = False,
+		n_jobs = None,
+		Tref = np.inf,
+		**kwargs
+		):
+		'''
+		Classmethod for generating an ``ipl.EDistribution`` instance directly
+		by inverting many ``ipl.HeatingExperiment`` objects in parallel and
+		combining the resulting ``ipl.kDistribution`` instances.
+
+		Parameters
+		----------
+
+		hes : list
+			List of ``ipl.HeatingExperiment`` instances to fit.
+
+		model : string
+			The type of model to fit. See ``kDistribution.invert_experiment``
+			for options. Defaults to ``'HH20'``.
+
+		fit_reg : boolean
+			Tells the function whether or not to find the regularized inverse
+			solution in addition to the lognormal solution. This only applies
+			if `model = 'HH20'`.
+
+		n_jobs : None or int
+			The number of worker processes to use. If ``None``, uses the number
+			of available CPUs. Defaults to ``None``.
+
+		Tref : int or float
+			The reference temperature of the resulting ``EDistribution``.
+			Defaults to ``np.inf``.
+
+		Returns
+		-------
+
+		ed : isotopylog.EDistribution
+			The ``ipl.EDistribution`` object containing all successfully fit
+			experiments.
+
+		Raises
+		------
+
+		ValueError
+			If `hes` is empty.
+
+		ValueError
+			If none of the inputted experiments could be fit.
+
+		Warnings
+		--------
+
+		UserWarning
+			If some experiments could not be fit; these are excluded from the
+			resulting ``EDistribution``.
+
+		Notes
+		-----
+
+		Any additional keyword arguments are passed to every call of
+		``kDistribution.invert_experiment``.
+
+		See Also
+		--------
+
+		kDistribution.invert_experiments
+			Method for fitting many experiments and returning each resulting
+			``kDistribution`` and error.
+
+		Examples
+		--------
+
+		Fitting a list of HeatingExperiment objects and combining results::
+
+			#import packages
+			import isotopylog as ipl
+
+			#assume hes is a list of HeatingExperiment objects
+			ed = ipl.EDistribution.from_experiments(hes, model = 'PH12')
+		'''
+
+		#check that there are experiments to fit
+		if len(hes) == 0:
+			raise ValueError(
+				'unexpected empty hes. Must contain at least one'
+				' HeatingExperiment.')
+
+		#fit all experiments
+		kds, errs = kDistribution.invert_experiments(
+			hes,
+			model = model,
+			fit_reg = fit_reg,
+			n_jobs = n_jobs,
+			**kwargs
+			)
+
+		#warn about any failed experiments and keep the rest
+		failed = ['%s (%s)' % (i, e) for i, e in enumerate(errs)
+			if e is not None]
+
+		if len(failed) == len(hes):
+			raise ValueError(
+				'None of the inputted experiments could be fit. Errors: %s'
+				% '; '.join(failed))
+
+		elif len(failed) > 0:
+			warnings.warn(
+				'Excluding experiments that could not be fit: %s'
+				% '; '.join(failed), UserWarning)
+
+		kds = [kd for kd in kds if kd is not None]
+
+		return cls(kds, Tref = Tref)
+
+	#define classmethod for generating EDistribution instance from literature
+	# data
+	@classmethod
+	def from_literature(cls, mineral = 'calcite', reference = 'HH20', **kwargs):
+		'''
+		Classmethod for generating an ``ipl.EDistribution`` instance directly
+		from literature data. This method simply inputs the results of
+		literature model fits; it does not re-calculate rate data using raw
+		literature D data.
+
+		Parameters
+		----------
+
+		mineral : string
+			The mineral type whose data will be imported. Current options are:\n
+				``'apatite'`` ('SE15' reference only)\n
+				``'calcite'`` (all references)\n
+				``'dolomite'`` ('HH20' reference only)
+
+		reference : string
+			The reference whose data will be imported. Current options are:\n
+				``'PH12'`` (Passey and Henkes 2012; model type 'PH12')\n
+				``'Hea14'`` (Henkes et al. 2014; model type 'Hea14')\n
+				``'SE15'`` (Stolper and Eiler 2015; model type 'SE15')\n
+				``'Bea18'`` (Brenner et al. 2018; model type 'SE15')\n
+				``'HH20'`` (Hemingway and Henkes 2020; model type 'HH20')
+
+		Returns
+		-------
+
+		ed : isotopylog.EDistribution
+			The ``ipl.EDistribution`` object containing all the literature data.
+
+		Raises
+		------
+
+		ValueError
+			If inputted ``mineral`` or ``reference`` string are not appropriate.
+
+		Notes
+		-----
+
+		All rate data within the ``ed.kds`` list are reported in units of
 		inverse seconds, independent of the units used in the original
 		publication.
 
@@ -1284,24 +1863,38 @@ class EDistribution(object):
 			raise TypeError(
 				'Unexpected "reference" of type %s. Must be string.' % mt)
 
-		#get params, params_cov, and T from appropriate dictionary
-		exps = lit_kd_dict[reference][mineral]
+		#make and store instance on first call for this reference and mineral
+		key = (reference, mineral)
+
+		if key not in cls._lit_cache:
+
+			#get params, params_std, and T from the literature store
+			T, params, params_std = lit_kd_data(reference, mineral)
 
-		#loop through each and make kd instance, appending to list
-		kds = []
+			#make covariance matrices; kDistribution objects are only made
+			# if needed
+			params_cov = params_std[:,:,None]**2*np.eye(params.shape[1])
 
-		for e in exps:
-			kd = kDistribution(
-				e['params'], 
+			cls._lit_cache[key] = cls._from_arrays(
 				model, 
-				e['T'] + 273.15, 
-				params_cov = np.diag(e['params_std']**2)
+				T + 273.15, 
+				params, 
+				params_cov
 				)
 
-			kds.append(kd)
+		#copy stored instance, then overwrite all attributes in kwargs and
+		# raise exception if unknown
+		ed = cls._lit_cache[key].copy()
 
-		#return class instance
-		return cls(kds, **kwargs)
+		for k, v in kwargs.items():
+			if k in cls._kwattrs:
+				setattr(ed, k, v)
+
+			else:
+				raise ValueError(
+					'__init__() got an unexpected keyword argument %s' % k)
+
+		return ed
 
 	#method to append new data to an existing EDistribution
 	def append(self, new_data):
@@ -1335,16 +1928,20 @@ class EDistribution(object):
 			ed1.append(ed2)
 		'''
 
-		#extract kds list
-		kds = self.kds
-
 		#if new_data is kdistribution, append it directly
 		if isinstance(new_data, kDistribution):
-			kds.append(new_data)
+			T, params, params_cov = _kd_arrays(new_data)
+			objs = [new_data]
+			fps = [new_data.fingerprint]
 
-		#if new_data is EDistribution, extract its kds list and append
+		#if new_data is EDistribution, append its stored arrays
 		elif isinstance(new_data, EDistribution):
-			kds.extend(new_data.kds)
+			n = new_data.npt
+			T = new_data._T[:n]
+			params = new_data._params[:n]
+			params_cov = new_data._params_cov[:n]
+			objs = new_data._kdobjs
+			fps = new_data._fps
 
 		#raise error of other data type
 		else:
@@ -1355,8 +1952,50 @@ class EDistribution(object):
 				' EDistribution instance' % ndt
 				)
 
-		#save as new kds attribute
-		self.kds = kds
+		#check that models match
+		if new_data.model != self.model:
+
+			mts = [self.model, new_data.model]
+			raise ValueError(
+				'Attempting to calculate E distributions on kDistribution'
+				' objects of model types: %s. All objects must be of the same'
+				' model type.' % mts)
+
+		#add to stored arrays
+		self._extend(T, params, params_cov, objs, fps)
+
+	#method to copy an existing EDistribution
+	def copy(self):
+		'''
+		Method for copying an existing EDistribution. Stored arrays are copied
+		so that ``append`` and ``drop`` on the copy do not affect the original;
+		any existing ``kDistribution`` objects and the stored Arrhenius
+		regression are shared.
+
+		Returns
+		-------
+
+		ed : isotopylog.EDistribution
+			The copied ``EDistribution`` object.
+		'''
+
+		#make new instance with the same attributes
+		ed = self.__class__.__new__(self.__class__)
+		ed.__dict__.update(self.__dict__)
+
+		#copy stored arrays and lists
+		n = self.npt
+		ed._T = self._T[:n].copy()
+
+		if n > 0:
+			ed._params = self._params[:n].copy()
+			ed._params_cov = self._params_cov[:n].copy()
+
+		ed._kdobjs = list(self._kdobjs)
+		ed._fps = list(self._fps)
+		ed._fpcount = dict(self._fpcount)
+
+		return ed
 
 	#method to drop existing data from the EDistribution instance
 	def drop(self, index):
@@ -1368,9 +2007,9 @@ class EDistribution(object):
 		Parameters
 		----------
 
-		index : int or slice
+		index : int, slice, or array-like
 			The index of the ``ed.kds`` list to be dropped. Must be either 
-			an integer or a slice.
+			an integer, a slice, or a list of integers.
 
 		Examples
 		--------
@@ -1381,14 +2020,196 @@ class EDistribution(object):
 			ed.drop(0)
 		'''
 
-		#extract kds list
-		kds = self.kds
+		#make boolean array of entries to keep
+		n = self.npt
+		keep = np.ones(n, dtype = bool)
+		keep[index] = False
 
-		#remove entry by index
-		kds.remove(kds[index])
+		#shift kept entries to the front of the stored arrays
+		m = np.sum(keep)
+		self._T[:m] = self._T[:n][keep]
+		self._params[:m] = self._params[:n][keep]
+		self._params_cov[:m] = self._params_cov[:n][keep]
 
-		#store new list
-		self.kds = kds
+		self._kdobjs = [o for o, k in zip(self._kdobjs, keep) if k]
+		self._fps = [f for f, k in zip(self._fps, keep) if k]
+		self._npt = m
+
+		self._fpcount = {}
+		for f in self._fps:
+			self._fpcount[f] = self._fpcount.get(f, 0) + 1
+
+		#reset stored regression
+		self._Efit_store = None
+
+	#define classmethod for loading a saved EDistribution
+	@classmethod
+	def load(cls, file, name = None, mmap_mode = None):
+		'''
+		Classmethod for loading a ``EDistribution`` instance saved using the
+		``save`` method or ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		name : str or None
+			The name of the object to load. If ``None``, loads the first
+			``EDistribution`` in the file. Defaults to ``None``.
+
+		mmap_mode : None or str
+			If ``'r'`` or ``'c'``, numeric arrays (e.g., the stacked
+			kDistribution parameters) are loaded as memory maps. Defaults
+			to ``None``.
+
+		Returns
+		-------
+
+		ed : isotopylog.EDistribution
+			The loaded ``EDistribution`` instance.
+
+		See Also
+		--------
+
+		isotopylog.load
+			Function for loading all objects in a file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import _load_one
+
+		return _load_one(cls, file, name, mmap_mode)
+
+	#define method for saving to a binary file
+	def save(self, file, compress = False):
+		'''
+		Saves the ``EDistribution`` instance to a binary ``.npz`` (or, if the
+		file ends in ``'.h5'`` or ``'.hdf5'``, HDF5) file. To store many
+		objects in one file, use ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		compress : boolean
+			Whether to compress arrays. Compressed arrays cannot be memory
+			mapped when loading. Defaults to ``False``.
+
+		See Also
+		--------
+
+		isotopylog.save
+			Function for saving many objects to one file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import save
+
+		save(file, self, compress = compress)
+
+	#method to add entries to the stored arrays
+	def _extend(self, T, params, params_cov, objs, fps):
+		'''
+		Adds entries to the end of the stored T, params, and params_cov arrays,
+		growing the arrays by doubling their capacity when needed.
+
+		Parameters
+		----------
+
+		T : array-like
+			Array of temperatures, in Kelvin. Of length ``n``.
+
+		params : array-like
+			2d array of rate parameters, of shape [``n`` x ``nkp``].
+
+		params_cov : array-like
+			3d array of rate parameter covariance matrices, of shape
+			[``n`` x ``nkp`` x ``nkp``].
+
+		objs : list
+			List of corresponding ``kDistribution`` objects, or ``None`` for
+			entries that have not been made yet. Of length ``n``.
+
+		fps : list
+			List of corresponding fingerprints. Of length ``n``.
+
+		Warnings
+		--------
+
+		UserWarning
+			If the resulting list contains repeat entries.
+		'''
+
+		n0 = self._npt
+		n1 = n0 + len(T)
+
+		#grow arrays if necessary, keeping existing entries
+		if n1 > len(self._T):
+
+			cap = max(n1, 2*len(self._T))
+			nkp = np.shape(params)[1]
+
+			Tnew = np.zeros(cap)
+			pnew = np.zeros([cap, nkp])
+			pcnew = np.zeros([cap, nkp, nkp])
+
+			if n0 > 0:
+				Tnew[:n0] = self._T[:n0]
+				pnew[:n0] = self._params[:n0]
+				pcnew[:n0] = self._params_cov[:n0]
+
+			self._T, self._params, self._params_cov = Tnew, pnew, pcnew
+
+		#store new entries
+		self._T[n0:n1] = T
+		self._params[n0:n1] = params
+		self._params_cov[n0:n1] = params_cov
+
+		self._kdobjs.extend(objs)
+		self._fps.extend(fps)
+		self._npt = n1
+
+		#warn if there are repeat entries (compared by fingerprint counts)
+		for f in fps:
+			self._fpcount[f] = self._fpcount.get(f, 0) + 1
+
+		if len(self._fpcount) != n1:
+			warnings.warn(
+				'kds list contains repeat entries. Consider removing repeated'
+				' entry as to not bias regression statistics', UserWarning)
+
+		#reset stored regression
+		self._Efit_store = None
+
+	#method to empty the stored arrays
+	def _reset(self, model):
+		'''
+		Empties the stored T, params, and params_cov arrays and sets the model.
+
+		Parameters
+		----------
+
+		model : str
+			The model type of all entries.
+		'''
+
+		self._model = model
+		self._npt = 0
+
+		self._T = np.zeros(0)
+		self._params = None
+		self._params_cov = None
+
+		self._kdobjs = []
+		self._fps = []
+		self._fpcount = {}
+
+		#reset stored regression
+		self._Efit_store = None
 
 	#define method for generating Arrhenius plots
 	def plot(
@@ -1514,8 +2335,9 @@ class EDistribution(object):
 				' for model type %s.' % (param, self.model)
 				)
 
-		#make axis if necessary
+		#make axis if necessary, importing plotting backend only when needed
 		if ax is None:
+			import matplotlib.pyplot as plt
 			_, ax = plt.subplots(1,1)
 
 		#plot errorbar data
@@ -1572,32 +2394,36 @@ class EDistribution(object):
 
 	#Define @property getters and setters
 	@property
-	def Eparams(self):
+	def _Efit(self):
 		'''
-		The T vs. lnk regression slopes and intercepts for each parameter in
-		model kparams.
+		The stored Arrhenius regression results (params, params_cov, rmse) for
+		all model kparams. Calculated once and reset whenever kds or Tref
+		are changed through their setters (including via append and drop).
 		'''
 
-		#extract constants
-		# nkp = number of k params
-		npt, nkp = np.shape(self.kparams)
-
-		#pre-allocate array of the right shape
-		# E and lnkref for each k param
-		Eparams = np.zeros([2, nkp])
-
-		#loop through k params and solve
-		for i in range(nkp):
-			Eparams[:,i], _, _ = fit_Arrhenius(
+		#regress all k params in a single call if not already stored
+		if self._Efit_store is None:
+			self._Efit_store = fit_Arrhenius(
 				self.Ts, 
-				self.kparams[:,i], 
-				lnk_std = self.kparams_std[:,i], 
-				p0 = self.p0, 
+				self.kparams, 
+				lnk_std = self.kparams_std, 
 				Tref = self.Tref,
-				zero_int = zi[self.model][i] #since some params have zero int
+				zero_int = zi[self.model] #since some params have zero int
 				)
 
-		return Eparams
+		return self._Efit_store
+
+	@property
+	def Eparams(self):
+		'''
+		The T vs. lnk regression slopes and intercepts for each parameter in
+		model kparams.
+		'''
+
+		#extract from the stored regression
+		Eparams, _, _ = self._Efit
+
+		return Eparams.copy()
 	
 	@property
 	def Eparams_cov(self):
@@ -1606,34 +2432,33 @@ class EDistribution(object):
 		for each parameter in model kparams.
 		'''
 
-		#extract constants
-		# nkp = number of k params
-		npt, nkp = np.shape(self.kparams)
-
-		#pre-allocate array of the right shape
-		# E and lnkref covariance for each k param
-		epc = np.zeros([2*nkp, 2*nkp])
-
-		#loop through k params and solve
-		for i in range(nkp):
-			_, epc[2*i:2*i+2, 2*i:2*i+2], _ = fit_Arrhenius(
-				self.Ts, 
-				self.kparams[:,i], 
-				lnk_std = self.kparams_std[:,i], 
-				p0 = self.p0, 
-				Tref = self.Tref,
-				zero_int = zi[self.model][i] #since some params have zero int
-				)
+		#extract from the stored regression; epc is block diagonal
+		_, epc, _ = self._Efit
 
-		return epc
+		return epc.copy()
 
 	@property
 	def kds(self):
 		'''
 		The list of ``isotopylog.kDistribution`` objects on which activation
-		energy values will be calculated.
-		'''
-		return self._kds
+		energy values will be calculated. Values are stored internally as
+		arrays, and any ``kDistribution`` objects that do not yet exist are
+		made when this attribute is accessed. Changes to the returned list, or
+		to the objects within it, are not reflected in the stored arrays; use
+		the ``append`` and ``drop`` methods or set ``kds`` instead.
+		'''
+
+		#make any kDistribution objects that do not yet exist
+		for i, o in enumerate(self._kdobjs):
+			if o is None:
+				self._kdobjs[i] = kDistribution(
+					self._params[i].copy(),
+					self.model,
+					self._T[i],
+					params_cov = self._params_cov[i].copy(),
+					)
+
+		return list(self._kdobjs)
 	
 	@kds.setter
 	def kds(self, value):
@@ -1673,27 +2498,36 @@ class EDistribution(object):
 				' objects of model types: %s. All objects must be of the same'
 				' model type.' % mts)
 
-		#fourth, if any entires in kds are EDistributions, extract their
-		# underlying kDistribution list and combine everything
-		kdlist = []
+		#fourth, gather arrays for each entry; if any entires in kds are
+		# EDistributions, extract their stored arrays and combine everything
+		Ts, ps, pcs, objs, fps = [], [], [], [], []
 
 		for k in value:
-			try:
-				kdlist.append(k.kds)
+			if isinstance(k, EDistribution):
+				n = k.npt
+				Ts.append(k._T[:n])
+				ps.append(k._params[:n])
+				pcs.append(k._params_cov[:n])
+				objs.extend(k._kdobjs)
+				fps.extend(k._fps)
 
-			except AttributeError:
-				kdlist.append(k)
-
-		#finally, warn if there are repeat entries
-		n = len(kdlist)
-		eqn = sum([kdlist[i] == k for i in range(n) for k in kdlist])
-		if eqn != n:
-			warnings.warn(
-				'kds list contains repeat entries. Consider removing repeated'
-				' entry as to not bias regression statistics', UserWarning)
-
-		self._kds = kdlist
-		self._model = list(set(mods))[0]
+			else:
+				T, params, params_cov = _kd_arrays(k)
+				Ts.append(T)
+				ps.append(params)
+				pcs.append(params_cov)
+				objs.append(k)
+				fps.append(k.fingerprint)
+
+		#finally, store arrays (warns if there are repeat entries)
+		self._reset(mods[0])
+		self._extend(
+			np.concatenate(Ts), 
+			np.concatenate(ps), 
+			np.concatenate(pcs), 
+			objs, 
+			fps
+			)
 
 	@property
 	def kparams(self):
@@ -1703,13 +2537,9 @@ class EDistribution(object):
 		model type.
 		'''
 
-		#extract values
-		ks = [kd.params for kd in self.kds]
-
-		#stack into array
-		ks = np.stack(ks)
-
-		return ks
+		#return a copy, since stored arrays are rewritten in place when
+		# entries are dropped or appended
+		return self._params[:self.npt].copy()
 	
 	@property
 	def kparams_std(self):
@@ -1719,13 +2549,10 @@ class EDistribution(object):
 		depending on the model type.
 		'''
 
-		#extract values
-		ks = [np.sqrt(np.diag(kd.params_cov)) for kd in self.kds]
-
-		#stack into array
-		ks = np.stack(ks)
+		#extract diagonal of each stored covariance matrix
+		ks = np.diagonal(self._params_cov[:self.npt], axis1 = 1, axis2 = 2)
 
-		return ks
+		return np.sqrt(ks)
 
 	@property
 	def model(self):
@@ -1741,12 +2568,13 @@ class EDistribution(object):
 		The number of data points in the E regression (i.e., the number of
 		``kDistribution`` instances inputted).
 		'''
-		return len(self._kds)
+		return self._npt
 	
 	@property
 	def p0(self):
 		'''
-		The initial guess for fitting Arrhenius plots.
+		The initial guess for fitting Arrhenius plots. Retained for backwards
+		compatibility only; it has no effect on the closed-form regression.
 		'''
 		return self._p0
 	
@@ -1764,25 +2592,10 @@ class EDistribution(object):
 		Of length ``nkparams``.
 		'''
 
-		#extract constants
-		# nkp = number of k params
-		npt, nkp = np.shape(self.kparams)
-
-		#pre-allocate array of the right shape
-		rmse = np.zeros(nkp)
-
-		#loop through k params and solve
-		for i in range(nkp):
-			_, _, rmse[i] = fit_Arrhenius(
-				self.Ts, 
-				self.kparams[:,i], 
-				lnk_std = self.kparams_std[:,i], 
-				p0 = self.p0, 
-				Tref = self.Tref,
-				zero_int = zi[self.model][i] #since some params have zero int
-				)
+		#extract from the stored regression
+		_, _, rmse = self._Efit
 
-		return rmse
+		return rmse.copy()
 
 	@property
 	def summary(self):
@@ -1821,6 +2634,8 @@ class EDistribution(object):
 				 'npt' : self.npt
 				 }
 
+		#import pandas only when needed
+		import pandas as pd
 		s = pd.Series(attrs)
 
 		return s
@@ -1839,6 +2654,9 @@ class EDistribution(object):
 		'''
 		self._Tref = value
 
+		#reset stored regression
+		self._Efit_store = None
+
 	@property
 	def Ts(self):
 		'''
@@ -1846,14 +2664,167 @@ class EDistribution(object):
 		the E regression.
 		'''
 
-		#extract a list of T values
-		Ts = [k.T for k in self.kds]
-
-		#convert to array and round
-		Ts = np.array(Ts)
-		Ts = np.around(Ts, 3)
+		#extract stored T values and round
+		Ts = np.around(self._T[:self.npt], 3)
 
 		return Ts
 
+#define function for extracting kDistribution contents as stacked arrays
+def _kd_arrays(kd):
+	'''
+	Extracts T, params, and params_cov from a kDistribution as arrays of
+	length 1, for adding to ``EDistribution`` array storage. Missing
+	covariance is stored as zeros.
+
+	Parameters
+	----------
+
+	kd : isotopylog.kDistribution
+		The ``kDistribution`` object.
+
+	Returns
+	-------
+
+	T : np.ndarray
+		Array of shape [1].
+
+	params : np.ndarray
+		Array of shape [1 x ``nkp``].
+
+	params_cov : np.ndarray
+		Array of shape [1 x ``nkp`` x ``nkp``].
+	'''
+
+	params = np.asarray(kd.params, dtype = float)
+	nkp = len(params)
+
+	if kd.params_cov is None:
+		params_cov = np.zeros([nkp, nkp])
+
+	else:
+		params_cov = np.asarray(kd.params_cov, dtype = float)
+
+	return np.array([kd.T], dtype = float), params[None,:], params_cov[None,:,:]
+
+#define function for fingerprinting kDistribution contents
+def _kd_fingerprint(model, T, params, params_cov):
+	'''
+	Calculates a sha1 hex digest of kDistribution contents. Used by both
+	``kDistribution.fingerprint`` and the array storage of ``EDistribution``
+	so that both give identical results.
+
+	Parameters
+	----------
+
+	model : str
+		The model type.
+
+	T : float
+		The temperature, in Kelvin.
+
+	params : array-like
+		The model parameters.
+
+	params_cov : None or array-like
+		The model parameter covariance matrix.
+
+	Returns
+	-------
+
+	fp : str
+		The resulting hex digest.
+	'''
+
+	#hash model and T
+	h = hashlib.sha1(model.encode())
+	h.update(np.float64(T).tobytes())
+
+	#hash params and params_cov (if it exists); adding 0 maps -0 to 0
+	for a in [params, params_cov]:
+		if a is None:
+			h.update(b'None')
+
+		else:
+			a = np.ascontiguousarray(a, dtype = float) + 0.
+			h.update(str(a.shape).encode())
+			h.update(a.tobytes())
+
+	return h.hexdigest()
+
+#define function for exact comparison of two arrays
+def _array_equal(a, b):
+	'''
+	Determines whether two arrays are exactly equal. Arrays with identical
+	bytes (including any identical NaN entries) are compared directly; all
+	others fall back to elementwise comparison (e.g., for -0 vs. 0 or for
+	differing dtypes).
+
+	Parameters
+	----------
+
+	a : array-like
+		The first array.
+
+	b : array-like
+		The second array.
+
+	Returns
+	-------
+
+	eq : boolean
+		Boolean telling whether or not the arrays are equal.
+	'''
+
+	a = np.asarray(a)
+	b = np.asarray(b)
+
+	if a.shape != b.shape:
+		return False
+
+	return a.tobytes() == b.tobytes() or bool((a == b).all())
+
+#define function for inverting a single experiment within a worker process
+def _invert_worker(args):
+	'''
+	Fits a single heating experiment and captures any resulting error. Defined
+	at the module level so that it can be sent to worker processes.
+
+	Parameters
+	----------
+
+	args : tuple
+		Tuple containing, in order, the ``kDistribution`` class to create,
+		the ``ipl.HeatingExperiment`` instance, the model string, the fit_reg
+		boolean, a dictionary of additional keyword arguments, and a
+		dictionary of (coefficients, reference frame) tuples for each named
+		calibration used.
+
+	Returns
+	-------
+
+	kd : isotopylog.kDistribution or None
+		The resulting ``kDistribution``, or ``None`` if the fit failed.
+
+	err : Exception or None
+		The exception raised by a failed fit, or ``None`` if successful.
+	'''
+
+	cls, he, model, fit_reg, kwargs, cals = args
+
+	#re-register any calibrations that are missing or differ in this process
+	for name, (c, rf) in cals.items():
+		cn = cal_coeffs.get(name)
+
+		if cn is None or cn[1] != rf or not np.array_equal(cn[0], c):
+			register_calibration(name, c, ref_frame = rf)
+
+	try:
+		kd = cls.invert_experiment(he, model = model, fit_reg = fit_reg,
+			**kwargs)
+		return kd, None
+
+	except Exception as e:
+		return None, e
+
 if __name__ == '__main__':
 	import isotopylog as ipl
\ No newline at end of file
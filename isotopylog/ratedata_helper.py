@@ -21,33 +21,36 @@ __all__ = ['calc_L_curve',
 		  ]
 
 #import packages
-import matplotlib.pyplot as plt
 import numpy as np
+import warnings
 
 #import necessary linear algebra functions
 from numpy.linalg import (
 	inv,
+	LinAlgError,
 	norm,
 	)
 
+from scipy.linalg import(
+	lstsq,
+	solve,
+	)
+
 #import necessary optimization functions
 from scipy.optimize import (
 	curve_fit,
-	lsq_linear,
 	nnls,
 	)
 
-# #import signal processing functions
-from scipy.signal import argrelmax
-
 #import necessary isotopylog calculation and fitting functions
 from .calc_funcs import(
 	_calc_A,
+	_calc_apg,
+	_calc_normal_factor,
 	_calc_R,
 	_calc_R_stoch,
 	_calc_rmse,
 	_calc_Rpr,
-	_fArrhenius,
 	_fHea14,
 	_fPH12,
 	_fSE15,
@@ -55,6 +58,16 @@ from .calc_funcs import(
 	_fHH20,
 	)
 
+#import disk cache functions for fit results
+from .fit_cache import(
+	_cache_load,
+	_cache_store,
+	_fit_key,
+	)
+
+#import decorator for recording hot-path statistics
+from .instrumentation import instrumented
+
 #import necessary isotopylog core functions
 from .core_functions import(
 	derivatize,
@@ -65,10 +78,15 @@ from .timedata_helper import(
 	_calc_D_from_G,
 	)
 
+#instrument optimization functions so time spent in scipy is recorded
+curve_fit = instrumented(curve_fit, name = 'scipy.curve_fit')
+nnls = instrumented(nnls, name = 'scipy.nnls')
+
 #first, set absolute sigma for curve fitting
 abs_sig = False
 
 #define function for calculating best-fit omega using L-curve approach
+@instrumented
 def calc_L_curve(
 	he,
 	ax = None,
@@ -82,6 +100,8 @@ def calc_L_curve(
 	plot = False,
 	ld = {},
 	pd = {},
+	solver = 'direct',
+	tol = 1e-8,
 	):
 	'''
 	Function to choose the "best" omega value for regularization following
@@ -138,6 +158,14 @@ def calc_L_curve(
 		``matplotlib.pyplot.scatter``. Defaults to empty dictionary. Only 
 		called if ``plot = True``.
 
+	solver : str
+		The solver to use for each regularized inversion; passed to
+		``fit_HH20inv``. Defaults to ``'direct'``.
+
+	tol : float
+		Relative tolerance for early stopping; only used if
+		``solver = 'apg'``. Defaults to ``1e-8``.
+
 	Returns
 	-------
 
@@ -212,24 +240,44 @@ def calc_L_curve(
 	log_om_vec = np.linspace(np.log10(omega_min), np.log10(omega_max), nom)
 	om_vec = 10**log_om_vec
 
-	res_vec_calc = np.zeros(nom)
-	rgh_vec_calc = np.zeros(nom)
-
-	#for each omega value in the vector, calculate the errors
-	for i, w in enumerate(om_vec):
+	#load the stored omega sweep if the fit cache is enabled and this sweep
+	# has already been done; kink and plotting options are not included
+	key = _fit_key('calc_L_curve', he, nu_max = nu_max, nu_min = nu_min,
+		nnu = nnu, nom = nom, omega_max = omega_max, omega_min = omega_min,
+		solver = solver, tol = tol)
+	res = _cache_load(key)
 
-		#call the inverse fit parent function
-		_, _, res_inv, rgh_inv = fit_HH20inv(
-			he, 
-			nu_max = nu_max,
-			nu_min = nu_min,
-			nnu = nnu,
-			omega = w
-			)
+	if res is not None:
+		res_vec_calc = res['res_vec']
+		rgh_vec_calc = res['rgh_vec']
 
-		#store results
-		res_vec_calc[i] = res_inv
-		rgh_vec_calc[i] = rgh_inv
+	else:
+		res_vec_calc = np.zeros(nom)
+		rgh_vec_calc = np.zeros(nom)
+		rho_inv = None
+
+		#for each omega value in the vector, calculate the errors; iterative
+		# solves go from large (well conditioned) to small omega, each
+		# warm started from the previous solution
+		for i in range(nom)[::-1]:
+
+			#call the inverse fit parent function
+			rho_inv, _, res_inv, rgh_inv = fit_HH20inv(
+				he, 
+				nu_max = nu_max,
+				nu_min = nu_min,
+				nnu = nnu,
+				omega = om_vec[i],
+				solver = solver,
+				tol = tol,
+				x0 = rho_inv,
+				)
+
+			#store results
+			res_vec_calc[i] = res_inv
+			rgh_vec_calc[i] = rgh_inv
+
+		_cache_store(key, {'res_vec' : res_vec_calc, 'rgh_vec' : rgh_vec_calc})
 
 	#convert to log space
 	res_vec = np.log10(res_vec_calc)
@@ -250,7 +298,9 @@ def calc_L_curve(
 	k[k == np.inf] = 0
 	k[k == np.nan] = 0
 
-	#extract peak indices
+	#extract peak indices (signal processing functions are only imported
+	# when needed)
+	from scipy.signal import argrelmax
 	pkinds = argrelmax(k)[0]
 	pki = np.argsort(k[pkinds])[::-1][:kink+1] #keep top 2 "kink" points
 	ivals = pkinds[pki]
@@ -265,8 +315,9 @@ def calc_L_curve(
 	#plot if necessary
 	if plot is True:
 
-		#create axis if necessary
+		#create axis if necessary, importing plotting backend only when needed
 		if ax is None:
+			import matplotlib.pyplot as plt
 			_, ax = plt.subplots(1, 1)
 
 		#plot results
@@ -316,11 +367,12 @@ def calc_L_curve(
 		return om_best
 
 #function to fit E distributions using Arrhenius plot
+@instrumented
 def fit_Arrhenius(
 	T, 
 	lnk, 
 	lnk_std = None, 
-	p0 = [150, -7], 
+	p0 = None, 
 	Tref = np.inf,
 	zero_int = False
 	):
@@ -338,17 +390,19 @@ def fit_Arrhenius(
 
 	lnk : array-like
 		Array of corresponding natural logged rate data, in units of inverse
-		time. Of length ``nT``.
+		time. Either of length ``nT`` or of shape [``nT`` x ``nk``], in which
+		case each column is regressed independently in a single call.
 
 	lnk_std : None or array-like
 		Array of corresponding uncertainty in natural logged rate data. If not
-		``None``, then must be of length ``nT``. Defaults to ``None`` for an
-		unweighted fit (technically, will make an array of 1e-10 of length 
-		``nT`` for lnk_std).
+		``None``, then must be of the same shape as `lnk`. Defaults to 
+		``None`` for an unweighted fit.
 	
-	p0 : array-like
-		Array of paramter guess to initialize the fitting algorithm, in the
-		order [E, ln(kref)]. Defaults to ``[150, -7]``.
+	p0 : None or array-like
+		Deprecated and ignored; retained for backwards compatibility only.
+		Since the problem is linear in E and ln(kref), it is solved exactly
+		and no initial guess is needed. Passing anything other than ``None``
+		raises a ``DeprecationWarning``. Defaults to ``None``.
 
 	Tref : int or Float
 		The reference temperature, in Kelvin. Following Passey and Henkes 
@@ -357,34 +411,63 @@ def fit_Arrhenius(
 		pass ``np.inf`` for a "traditional" Arrhenius fit; that is, kref = k0 
 		= x intercept. Defaults to ``np.inf``.
 
-	zero_int : boolean
+	zero_int : boolean or array-like
 		Tells the function whether or not to force the intercept to zero.
 		This is used for calculating sig_E in the 'HH20' model and
 		ln([p0]/[peq]) for the 'SE15' model, both of which are expected to have
-		zero intercept in ln(k) vs. 1/T space.
+		zero intercept in ln(k) vs. 1/T space. If `lnk` is 2d, can be a list
+		of booleans of length ``nk``, one for each column.
 
 	Returns
 	-------
 
 	params : np.ndarray
-		Array of resulting parameter values, in the order
-		[E, ln(kref)].
+		Array of resulting parameter values, in the order [E, ln(kref)]. If
+		`lnk` is 2d, of shape [2 x ``nk``].
 
 	params_cov : np.ndarray
 		Covariance matrix associated with the resulting parameter values, of
 		shape [2 x 2]. The +/- 1 sigma uncertainty for each parameter can be 
-		calculated as ``np.sqrt(np.diag(params_cov))``
+		calculated as ``np.sqrt(np.diag(params_cov))``. If `lnk` is 2d, the
+		block-diagonal matrix of shape [2``nk`` x 2``nk``] containing the
+		[2 x 2] covariance matrix of each column.
 
-	rmse : float
-		Root Mean Square Error (in lnk units) of the model fit.
+	rmse : float or np.ndarray
+		Root Mean Square Error (in lnk units) of the model fit. If `lnk` is 2d,
+		of length ``nk``.
+
+	Warnings
+	--------
+
+	UserWarning
+		If the number of data points does not exceed the number of fitted
+		parameters, in which case the covariance cannot be estimated and is
+		set to ``np.inf``.
+
+	DeprecationWarning
+		If `p0` is not ``None``, since it has no effect.
 
 	Notes
 	-----
 
+	Since the model is linear in E and ln(kref) (or in E alone when 
+	`zero_int` is ``True``), the weighted least-squares solution is
+	calculated in closed form rather than iteratively. Following the 
+	``curve_fit`` convention with ``absolute_sigma = False``, the parameter
+	covariance is scaled by the reduced chi-square of the fit.
+
 	Changing Tref will have no impact on resulting activation energy value or
 	corresponding uncertainty. Only the uncertainty in the intercept will be
 	affected.
 
+	Columns that do not vary with temperature (e.g., the SE15 ln(mp)
+	parameter, which is constant in all literature kDistributions) are fit
+	exactly, giving E = 0 with zero covariance. Versions before the
+	closed-form solution instead returned a spurious E uncertainty of order
+	1e5 kJ/mol for such columns, which propagated into ``geologic_history``
+	D_std values of order 1e4 permil for the SE15 model; SE15 D_std values
+	are now of order 0.1 permil. This is a deliberate change in behavior.
+
 	If uncertainty is passed but some entires are equal to zero, uncertainty
 	for those entries is set to be equal to the mean value of all other entries.
 
@@ -412,56 +495,99 @@ def fit_Arrhenius(
 	[1] Passey and Henkes (2012) *Earth Planet. Sci. Lett.*, **351**, 223--236.
 	'''
 
-	#if lnk_std is None or all zeros, make it None and absolute sigma false
-	if lnk_std is None or (lnk_std == 0).all():
-		lnk_std = None
+	#warn if an initial guess is passed, since it has no effect
+	if p0 is not None:
+		warnings.warn(
+			'p0 is ignored since the Arrhenius regression is solved in'
+			' closed form. It will be removed in a future version.',
+			DeprecationWarning, stacklevel = 2)
 
-	#else, if some entries are zero, replace them by the non-zero mean
-	elif (lnk_std == 0).any():
-		lnk_std[lnk_std == 0] = np.mean(lnk_std[lnk_std != 0])
+	#set constants
+	R = 8.314/1000 #kJ/mol/K
 
-	#for the case of forced zero intercept
-	if zero_int is True:
-		
-		#fit model to lambda function with forced zero intercept
-		lamfunc = lambda T, E : _fArrhenius(T, E, 0, np.inf)
+	#convert to arrays, treating 1d lnk as a single column
+	T = np.asarray(T, dtype = float)
+	lnk = np.asarray(lnk, dtype = float)
+	ravel = lnk.ndim == 1
+
+	y = lnk.reshape(len(T), -1)
+	npt, nk = np.shape(y)
 
-		#update P0
-		p0 = p0[0]
+	#if lnk_std is None, make all weights equal
+	if lnk_std is None:
+		sig = np.ones([npt, nk])
 
-	#for the case with no forced intercept
 	else:
-		#fit model to lambda function to allow inputting constants
-		lamfunc = lambda T, E, lnkref: _fArrhenius(T, E, lnkref, Tref)
+		#copy to avoid changing inputted uncertainty in place
+		sig = np.array(lnk_std, dtype = float).reshape(npt, nk)
+		isz = (sig == 0)
 
-	#solve
-	p, pcov = curve_fit(lamfunc, T, lnk, p0,
-		sigma = lnk_std, 
-		absolute_sigma = abs_sig,
-		)
+		#if all entries in a column are zero, make that column unweighted
+		allz = isz.all(axis = 0)
+		sig[:, allz] = 1
 
-	#calcualte lnkhat
-	lnkhat = lamfunc(T, *p)
+		#else, if some entries are zero, replace them by the non-zero mean
+		for j in np.where(isz.any(axis = 0) & ~allz)[0]:
+			sig[isz[:,j], j] = np.mean(sig[~isz[:,j], j])
 
-	#calculate rmse
-	rmse = _calc_rmse(lnk, lnkhat)
+	w = sig**-2
 
-	#if zero_int was true, put params and params_cov back into 2x2 matrix in
-	# order to keep things consistent
-	if zero_int is True:
-		params = np.zeros(2)
-		params[0] = p
+	#get zero intercept flag and number of fitted parameters for each column
+	zint = np.broadcast_to(np.asarray(zero_int, dtype = bool), (nk,))
+	npar = np.where(zint, 1, 2)
 
-		params_cov = np.zeros([2,2])
-		params_cov[0,0] = pcov
+	#calculate x values; zero intercept columns are always fit with Tref = inf
+	x = np.where(zint, -1/(R*T[:,None]), (1/Tref - 1/T[:,None])/R)
 
-	else:
-		params = p
-		params_cov = pcov
+	#center data on weighted means (no centering for zero intercept)
+	Sw = np.sum(w, axis = 0)
+	xm = np.where(zint, 0, np.sum(w*x, axis = 0)/Sw)
+	ym = np.where(zint, 0, np.sum(w*y, axis = 0)/Sw)
+
+	Sxx = np.sum(w*(x - xm)**2, axis = 0)
+	Sxy = np.sum(w*(x - xm)*(y - ym), axis = 0)
+
+	#solve for E and ln(kref)
+	E = Sxy/Sxx
+	lnkref = ym - E*xm
+
+	#calculate lnkhat and rmse
+	res = y - (lnkref + E*x)
+	rmse = norm(res, axis = 0)/(npt**0.5)
+
+	#scale covariance by the reduced chi-square of the fit
+	dof = npt - npar
+	fit_cov = dof > 0
+
+	if not fit_cov.all():
+		warnings.warn(
+			'Number of data points does not exceed number of fitted'
+			' parameters; covariance of the parameters could not be'
+			' estimated and is set to inf.', UserWarning)
+
+	s2 = np.sum(w*res**2, axis = 0)/np.where(fit_cov, dof, 1)
+
+	vE = np.where(fit_cov, s2/Sxx, np.inf)
+	vk = np.where(zint, 0, np.where(fit_cov, s2*(1/Sw + xm**2/Sxx), np.inf))
+	cEk = np.where(zint, 0, np.where(fit_cov, -s2*xm/Sxx, np.inf))
+
+	#store in block-diagonal matrix, one [2 x 2] block for each column
+	i = 2*np.arange(nk)
+	params = np.array([E, lnkref])
+	params_cov = np.zeros([2*nk, 2*nk])
+
+	params_cov[i, i] = vE
+	params_cov[i+1, i+1] = vk
+	params_cov[i, i+1] = params_cov[i+1, i] = cEk
+
+	#if lnk was 1d, return results in the original shapes
+	if ravel:
+		return params[:,0], params_cov, rmse[0]
 
 	return params, params_cov, rmse
 
 #function to fit data using Hea14 model
+@instrumented
 def fit_Hea14(he, logy = True, p0 = [-10., -10., -10.]):
 	'''
 	Fits D evolution data using the transient defect/equilibrium model of
@@ -599,6 +725,7 @@ def fit_Hea14(he, logy = True, p0 = [-10., -10., -10.]):
 	return params, params_cov, rmse, npt
 
 #function to fit data using HH20 lognormal model
+@instrumented
 def fit_HH20(he, nu_max = 10, nu_min = -50, nnu = 300, p0 = [-20, 5]):
 	'''
 	Fits D evolution data using the distributed activation energy model of
@@ -753,6 +880,7 @@ def fit_HH20(he, nu_max = 10, nu_min = -50, nnu = 300, p0 = [-20, 5]):
 	return params, params_cov, rmse, npt, nu, rho_nu
 
 #function to fit data using the HH20 inverse model
+@instrumented
 def fit_HH20inv(
 	he,
 	nu_max = 10,
@@ -760,6 +888,9 @@ def fit_HH20inv(
 	nnu = 300,
 	non_neg = True,
 	omega = 'auto',
+	solver = 'direct',
+	tol = 1e-8,
+	x0 = None,
 	**kwargs
 	):
 	'''
@@ -793,6 +924,24 @@ def fit_HH20inv(
 		The "smoothing parameter" to use. This can be a number or `auto`; if 
 		'auto', the function uses Tikhonov regularization to calculate the
 		optimal omega value. Defaults to `auto`.
+
+	solver : str
+		The solver to use for the regularized inversion. Options are: \n
+			``'direct'``: dense normal-equation solve using ``nnls`` if
+			``non_neg = True`` \n
+			``'apg'``: iterative accelerated projected gradient solver that
+			only requires matrix-vector products with A and R; recommended
+			for large `nnu` \n
+		Defaults to ``'direct'``.
+
+	tol : float
+		Relative tolerance for early stopping; only used if
+		``solver = 'apg'``. Defaults to ``1e-8``.
+
+	x0 : None or array-like
+		Initial guess for rho_nu, of length `nnu`; only used if
+		``solver = 'apg'`` and `omega` is a number. If ``None``, starts from a
+		flat distribution. Defaults to ``None``.
 	
 	Returns
 	-------
@@ -820,6 +969,28 @@ def fit_HH20inv(
 	TypeError
 		If unexpected keyword arguments are passed to `calc_L_curve`.
 
+	ValueError
+		If `solver` is not 'direct' or 'apg'.
+
+	Notes
+	-----
+
+	The regularization matrix R is stored as a sparse banded operator, and the
+	regularized problem is solved in normal-equation form, i.e.,
+	(A'A + omega^2 R'R) p = A'g, rather than by stacking A, R*omega, and the
+	sum to unity constraint into a single dense matrix. Memory therefore scales
+	as [`nnu` x `nnu`] independent of the number of experimental time points.
+
+	Direct solutions scale cubically with `nnu`. For fine nu grids (e.g.,
+	`nnu` > 2000), pass ``solver = 'apg'`` to instead solve iteratively using
+	only matrix-vector products; results converge to the direct solution as
+	`tol` is decreased. When ``omega = 'auto'``, each iterative solve in the
+	L-curve sweep is warm started from the solution at the next-largest
+	omega. Iterative solves of the poorly conditioned small-omega problems
+	still take many iterations, so the direct solver remains faster for
+	coarse nu grids (e.g., `nnu` < 1000). A UserWarning is raised if an
+	iterative solve does not converge to `tol`.
+
 	See Also
 	--------
 
@@ -883,6 +1054,8 @@ def fit_HH20inv(
 			nu_min = nu_min,
 			nnu = nnu,
 			plot = False,
+			solver = solver,
+			tol = tol,
 			**kwargs
 			)
 
@@ -899,31 +1072,55 @@ def fit_HH20inv(
 	else:
 		omega = float(omega)
 
-	#concatenate A+R and Gex+zeros
-	A_reg = np.concatenate(
-		(A, R*omega))
+	#get sum to unity constraint spacing, (dnu 1).p = 1
+	dnu = nu[1] - nu[0]
+
+	#calculate inverse results using the chosen solver
+	if solver == 'apg':
+
+		#iteratively solve using only A and R matrix-vector products
+		rho_nu_inv, _ = _calc_apg(
+			A,
+			Gex,
+			R,
+			omega,
+			dnu = dnu if non_neg is True else None,
+			non_neg = non_neg,
+			tol = tol,
+			x0 = x0,
+			)
+
+	elif solver == 'direct':
 
-	Gex_reg = np.concatenate(
-		(Gex, np.zeros(nnu + 1)))
+		#rather than concatenating A, R*omega, and a sum to unity row into a
+		# single dense matrix, build the normal equations directly:
+		# (A'A + omega^2 R'R) p = A'g
+		K = np.dot(A.T, A) + omega**2 * R.T.dot(R).toarray()
+		b = np.dot(A.T, Gex)
 
-	#concatenate sum to unity constraint
-	dnu = nu[1] - nu[0]
-	nuvec = dnu*np.ones([1,nnu])
+		if non_neg is True:
 
-	A_reg_unity = np.concatenate((A_reg, nuvec))
-	Gex_reg_unity = np.concatenate((Gex_reg, np.ones(1)))
+			#include sum to unity constraint
+			K += dnu**2
+			b += dnu
 
-	#calculate inverse results and estimated G
-	if non_neg is True:
-		# rho_nu_inv, _ = nnls(A_reg, Gex_reg)
-		rho_nu_inv, _ = nnls(A_reg_unity, Gex_reg_unity)
+			#convert to an equivalent [nnu x nnu] least-squares problem
+			M, y = _calc_normal_factor(K, b)
+			rho_nu_inv, _ = nnls(M, y)
+
+		else:
+			try:
+				rho_nu_inv = solve(K, b, assume_a = 'pos')
+
+			except LinAlgError:
+				rho_nu_inv = lstsq(K, b)[0]
 
 	else:
-		res = lsq_linear(A_reg, Gex_reg)
-		rho_nu_inv = res.x
+		raise ValueError(
+			'unexpected solver %s. Must be "direct" or "apg".' % solver)
 
 	Ghat = np.inner(A, rho_nu_inv)
-	rgh = np.inner(R, rho_nu_inv)
+	rgh = R.dot(rho_nu_inv)
 
 	#convert to D47
 	D47hat, _ = _calc_D_from_G(
@@ -945,6 +1142,7 @@ def fit_HH20inv(
 	return rho_nu_inv, omega, res_inv, rgh_inv
 
 #function to fit data using PH12 model
+@instrumented
 def fit_PH12(he, logy = True, p0 = [-10., 0.5], thresh = 1e-10):
 	'''
 	Fits D evolution data using the first-order model approximation of Passey
@@ -1113,6 +1311,7 @@ def fit_PH12(he, logy = True, p0 = [-10., 0.5], thresh = 1e-10):
 	return params, params_cov, rmse, npt
 
 #function to fit data using SE15 model
+@instrumented
 def fit_SE15(he, p0 = [-7., -9., 0.0992], mp = None, z = 6):
 	'''
 	Fits D evolution data using the paired diffusion model of Stolper and
@@ -0,0 +1,561 @@
+'''
+This module contains functions for saving and loading ``HeatingExperiment``,
+``kDistribution``, and ``EDistribution`` objects in binary form. Many objects
+can be stored in a single ``.npz`` file (or HDF5 file, if h5py is installed),
+and large arrays can be loaded as memory maps.
+'''
+
+#import from future for python 2
+from __future__ import(
+	division,
+	print_function,
+	)
+
+#set magic attributes
+__docformat__ = 'restructuredtext en'
+__all__ = ['load',
+		   'save',
+		  ]
+
+#import packages
+import numpy as np
+import os
+import tempfile
+import zipfile
+
+#import isotopylog classes
+from .timedata import HeatingExperiment
+
+from .ratedata import(
+	EDistribution,
+	kDistribution,
+	)
+
+#version of the stored format
+_format = 1
+
+#private HeatingExperiment attributes that are stored in addition to those
+# passed to __init__
+_he_private = ('_Ginv', '_Dinv')
+
+#file extensions that are stored as HDF5
+_h5_exts = ('.h5', '.hdf5')
+
+#define functions for converting objects to and from flat dictionaries of
+# arrays, with keys of the form 'name/attribute'
+
+#function for storing a set of attributes
+def _pack(prefix, attrs):
+	'''
+	Converts a dictionary of attributes to arrays, recording which attributes
+	were ``None`` or lists such that these are restored exactly.
+	'''
+
+	arrs = {}
+	nones = []
+	lists = []
+
+	for k, v in attrs.items():
+		if v is None:
+			nones.append(k)
+
+		else:
+			if isinstance(v, list):
+				lists.append(k)
+
+			arrs[prefix + k] = np.asarray(v)
+
+	arrs[prefix + '__none__'] = np.array(nones, dtype = str)
+	arrs[prefix + '__list__'] = np.array(lists, dtype = str)
+
+	return arrs
+
+#function for restoring a set of attributes
+def _unpack(prefix, arrs):
+	'''
+	Restores a dictionary of attributes stored using ``_pack``. 0-d arrays are
+	returned as python scalars.
+	'''
+
+	n = len(prefix)
+	attrs = {}
+
+	for k, v in arrs.items():
+		if not k.startswith(prefix) or '/' in k[n:]:
+			continue
+
+		attrs[k[n:]] = v.item() if v.ndim == 0 else v
+
+	#remove class name stored by save
+	attrs.pop('__class__', None)
+
+	attrs.update({str(k) : None for k in attrs.pop('__none__')})
+
+	for k in attrs.pop('__list__'):
+		attrs[str(k)] = attrs[str(k)].tolist()
+
+	return attrs
+
+#function for converting a HeatingExperiment
+def _he_to_arrays(he, prefix):
+	'''
+	Converts a ``HeatingExperiment`` to a dictionary of arrays.
+	'''
+
+	if he.calibration == 'Custom':
+		raise ValueError(
+			'HeatingExperiments with custom lambda calibrations cannot be'
+			' saved. Add the calibration using ipl.register_calibration'
+			' instead.')
+
+	attrs = {k : getattr(he, k) for k in he._kwattrs}
+	attrs.update({'dex' : he.dex, 'T' : he.T, 'tex' : he.tex})
+
+	#store regularized inverse forward model, which only exists after
+	# forward modeling an HH20 kDistribution
+	for k in _he_private:
+		attrs[k] = getattr(he, k, None)
+
+	return _pack(prefix, attrs)
+
+#function for restoring a HeatingExperiment
+def _he_from_arrays(arrs, prefix):
+	'''
+	Restores a ``HeatingExperiment`` from a dictionary of arrays.
+	'''
+
+	attrs = _unpack(prefix, arrs)
+	dex, T, tex = attrs.pop('dex'), attrs.pop('T'), attrs.pop('tex')
+	priv = {k : attrs.pop(k, None) for k in _he_private}
+
+	he = HeatingExperiment(dex, T, tex, **attrs)
+
+	for k, v in priv.items():
+		setattr(he, k, v)
+
+	return he
+
+#function for converting a kDistribution
+def _kd_to_arrays(kd, prefix):
+	'''
+	Converts a ``kDistribution`` to a dictionary of arrays.
+	'''
+
+	attrs = {k : getattr(kd, k) for k in kd._kwattrs}
+	attrs.update({'params' : kd.params, 'model' : kd.model, 'T' : kd.T})
+
+	return _pack(prefix, attrs)
+
+#function for restoring a kDistribution
+def _kd_from_arrays(arrs, prefix):
+	'''
+	Restores a ``kDistribution`` from a dictionary of arrays.
+	'''
+
+	attrs = _unpack(prefix, arrs)
+	params, model, T = attrs.pop('params'), attrs.pop('model'), attrs.pop('T')
+
+	return kDistribution(params, model, T, **attrs)
+
+#function for converting an EDistribution
+def _ed_to_arrays(ed, prefix):
+	'''
+	Converts an ``EDistribution`` to a dictionary of arrays. Stacked T,
+	params, and params_cov arrays are always stored; ``kDistribution``
+	objects are only stored if they have been made, such that lazily made
+	entries stay lazy.
+	'''
+
+	n = ed.npt
+	attrs = {k : getattr(ed, k) for k in ed._kwattrs}
+	attrs.update({'model' : ed.model, 'T' : ed._T[:n],
+		'params' : ed._params[:n], 'params_cov' : ed._params_cov[:n],
+		'fps' : np.array(ed._fps, dtype = str)})
+
+	arrs = _pack(prefix, attrs)
+
+	for i, o in enumerate(ed._kdobjs):
+		if o is not None:
+			arrs.update(_kd_to_arrays(o, '%skds/%d/' % (prefix, i)))
+
+	return arrs
+
+#function for restoring an EDistribution
+def _ed_from_arrays(arrs, prefix):
+	'''
+	Restores an ``EDistribution`` from a dictionary of arrays.
+	'''
+
+	attrs = _unpack(prefix, arrs)
+	model = attrs.pop('model')
+	T = attrs.pop('T')
+	params = attrs.pop('params')
+	params_cov = attrs.pop('params_cov')
+	fps = [str(f) for f in attrs.pop('fps')]
+
+	#restore any stored kDistribution objects
+	objs = []
+
+	for i in range(len(T)):
+		p = '%skds/%d/' % (prefix, i)
+		objs.append(_kd_from_arrays(arrs, p) if p + '__none__' in arrs
+			else None)
+
+	return EDistribution._from_arrays(model, T, params, params_cov,
+		objs = objs, fps = fps, **attrs)
+
+#store conversion functions for each class
+_converters = {
+	'HeatingExperiment' : (HeatingExperiment, _he_to_arrays, _he_from_arrays),
+	'kDistribution' : (kDistribution, _kd_to_arrays, _kd_from_arrays),
+	'EDistribution' : (EDistribution, _ed_to_arrays, _ed_from_arrays),
+	}
+
+#define functions for reading and writing flat dictionaries of arrays
+
+#function for memory mapping an array stored in an uncompressed npz file
+def _npz_memmap(path, zf, info, mmap_mode):
+	'''
+	Returns a memory map of an array stored uncompressed in an npz file, or
+	``None`` if the array cannot be memory mapped.
+	'''
+
+	if info.compress_type != zipfile.ZIP_STORED:
+		return None
+
+	with zf.open(info) as f:
+		version = np.lib.format.read_magic(f)
+
+		if version == (1, 0):
+			shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+
+		elif version == (2, 0):
+			shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+
+		else:
+			return None
+
+		#header length within the member
+		hlen = f.tell()
+
+	#only memory map numeric arrays; scalars and strings are small
+	if len(shape) == 0 or 0 in shape or dtype.kind not in 'biufc':
+		return None
+
+	#offset of member data within the file, skipping the local file header
+	with open(path, 'rb') as f:
+		f.seek(info.header_offset)
+		lh = f.read(30)
+
+	nlen = int.from_bytes(lh[26:28], 'little')
+	elen = int.from_bytes(lh[28:30], 'little')
+	offset = info.header_offset + 30 + nlen + elen + hlen
+
+	return np.memmap(path, dtype = dtype, mode = mmap_mode, offset = offset,
+		shape = shape, order = 'F' if fortran else 'C')
+
+#function for reading npz files
+def _read_npz(path, mmap_mode):
+	'''
+	Reads all arrays from an npz file, memory mapping numeric arrays if
+	`mmap_mode` is not ``None`` and the file is uncompressed.
+	'''
+
+	if mmap_mode is None:
+		with np.load(path) as f:
+			return {k : f[k] for k in f.files}
+
+	#memory map each array stored in the zip archive (named 'key.npy')
+	with zipfile.ZipFile(path) as zf:
+		arrs = {info.filename[:-4] : _npz_memmap(path, zf, info, mmap_mode)
+			for info in zf.infolist()}
+
+	#fall back to reading any arrays that cannot be memory mapped
+	missing = [k for k, v in arrs.items() if v is None]
+
+	with np.load(path) as f:
+		arrs.update({k : f[k] for k in missing})
+
+	return arrs
+
+#function for writing npz files
+def _write_npz(path, arrs, compress):
+	'''
+	Writes arrays to an npz file, writing to a temporary file first such that
+	other processes never read partial files.
+	'''
+
+	func = np.savez_compressed if compress else np.savez
+
+	d = os.path.dirname(os.path.abspath(path))
+
+	with tempfile.NamedTemporaryFile(dir = d, suffix = '.tmp',
+		delete = False) as f:
+		func(f, **arrs)
+
+	os.replace(f.name, path)
+
+#function for reading HDF5 files
+def _read_h5(path, mmap_mode):
+	'''
+	Reads all datasets from an HDF5 file, memory mapping contiguous numeric
+	datasets if `mmap_mode` is not ``None``. Strings are decoded from utf-8.
+	'''
+
+	import h5py
+
+	arrs = {}
+
+	def visit(k, ds):
+		if not isinstance(ds, h5py.Dataset):
+			return
+
+		offset = ds.id.get_offset()
+
+		if (mmap_mode is not None and ds.ndim > 0 and offset is not None
+			and ds.dtype.kind in 'biufc'):
+			arrs[k] = np.memmap(path, dtype = ds.dtype, mode = mmap_mode,
+				offset = offset, shape = ds.shape)
+
+		else:
+			v = ds[()]
+
+			if isinstance(v, bytes) or getattr(v, 'dtype', None) is not None \
+				and v.dtype.kind == 'S':
+				v = np.char.decode(np.asarray(v), 'utf-8')
+
+			arrs[k] = np.asarray(v)
+
+	with h5py.File(path, 'r') as f:
+		f.visititems(visit)
+
+	return arrs
+
+#function for writing HDF5 files
+def _write_h5(path, arrs, compress):
+	'''
+	Writes arrays to an HDF5 file. Strings are encoded as utf-8 since HDF5
+	does not store numpy unicode arrays.
+	'''
+
+	try:
+		import h5py
+
+	except ImportError:
+		raise ImportError(
+			'h5py is required to save HDF5 files. Install h5py or save to'
+			' an .npz file instead.')
+
+	with h5py.File(path, 'w') as f:
+		for k, v in arrs.items():
+			if v.dtype.kind == 'U':
+				v = np.char.encode(v, 'utf-8')
+
+			#compression is only possible for non-scalar datasets
+			if compress and v.ndim > 0:
+				f.create_dataset(k, data = v, compression = 'gzip')
+
+			else:
+				f.create_dataset(k, data = v)
+
+#define public functions
+
+#function for saving objects
+def save(file, objs, compress = False):
+	'''
+	Saves one or many ``ipl.HeatingExperiment``, ``ipl.kDistribution``, and
+	``ipl.EDistribution`` objects to a single binary file. All arrays and
+	metadata are stored losslessly.
+
+	Parameters
+	----------
+
+	file : str
+		The file path. Files ending in ``'.h5'`` or ``'.hdf5'`` are saved in
+		HDF5 format (requires h5py); all others are saved in numpy ``.npz``
+		format (``'.npz'`` is appended if there is no extension).
+
+	objs : object, list, or dict
+		The object(s) to save. If a dict, keys are used as object names;
+		otherwise, objects are named ``'obj_0'``, ``'obj_1'``, etc.
+
+	compress : boolean
+		Whether to compress arrays. Compressed arrays cannot be memory mapped
+		when loading. Defaults to ``False``.
+
+	Raises
+	------
+
+	TypeError
+		If any object is not a ``HeatingExperiment``, ``kDistribution``, or
+		``EDistribution``.
+
+	ValueError
+		If any name contains ``'/'``, or if a ``HeatingExperiment`` uses a
+		custom lambda calibration.
+
+	ImportError
+		If saving to an HDF5 file and h5py is not installed.
+
+	See Also
+	--------
+
+	isotopylog.load
+		Function for loading saved objects.
+
+	Examples
+	--------
+
+	Saving fitted kDistributions along with the experiments they were
+	fit to::
+
+		#import modules
+		import isotopylog as ipl
+
+		#assume he is a HeatingExperiment and kd is its fitted kDistribution
+		ipl.save('results.npz', {'he' : he, 'kd' : kd})
+
+		#load everything, memory mapping large arrays
+		objs = ipl.load('results.npz', mmap_mode = 'r')
+		kd = objs['kd']
+	'''
+
+	#get names for each object
+	if isinstance(objs, dict):
+		named = list(objs.items())
+
+	else:
+		if not isinstance(objs, (list, tuple)):
+			objs = [objs]
+
+		named = [('obj_%d' % i, o) for i, o in enumerate(objs)]
+
+	arrs = {'__format__' : np.array(_format),
+		'__names__' : np.array([n for n, _ in named], dtype = str)}
+
+	for n, o in named:
+
+		if '/' in str(n):
+			raise ValueError(
+				"unexpected object name %s. Must not contain '/'." % n)
+
+		cn = type(o).__name__
+
+		if cn not in _converters or not isinstance(o, _converters[cn][0]):
+			raise TypeError(
+				'unexpected object of type %s. Must be HeatingExperiment,'
+				' kDistribution, or EDistribution.' % cn)
+
+		prefix = '%s/' % n
+		arrs[prefix + '__class__'] = np.array(cn)
+		arrs.update(_converters[cn][1](o, prefix))
+
+	#write file
+	ext = os.path.splitext(file)[1].lower()
+
+	if ext in _h5_exts:
+		_write_h5(file, arrs, compress)
+
+	else:
+		if ext == '':
+			file = file + '.npz'
+
+		_write_npz(file, arrs, compress)
+
+#function for loading objects
+def load(file, mmap_mode = None):
+	'''
+	Loads objects saved using ``ipl.save`` or the ``save`` method of each
+	class.
+
+	Parameters
+	----------
+
+	file : str
+		The file path.
+
+	mmap_mode : None or str
+		If not ``None``, numeric arrays (e.g., ``rho_nu_inv`` or forward-model
+		outputs) are loaded as read-only (``'r'``) or copy-on-write (``'c'``)
+		memory maps rather than read into memory. Only applies to arrays
+		saved without compression. Defaults to ``None``.
+
+	Returns
+	-------
+
+	objs : dict
+		Dictionary of loaded objects, keyed by name, in the order saved.
+
+	Raises
+	------
+
+	ValueError
+		If `mmap_mode` is not ``None``, ``'r'``, or ``'c'``.
+
+	ValueError
+		If the file was saved using an unknown format version.
+
+	See Also
+	--------
+
+	isotopylog.save
+		Function for saving objects.
+	'''
+
+	if mmap_mode not in (None, 'r', 'c'):
+		raise ValueError(
+			"unexpected mmap_mode %s. Must be None, 'r', or 'c'." % mmap_mode)
+
+	if os.path.splitext(file)[1].lower() in _h5_exts:
+		arrs = _read_h5(file, mmap_mode)
+
+	else:
+		arrs = _read_npz(file, mmap_mode)
+
+	fmt = arrs.get('__format__')
+
+	if fmt is None or int(fmt) != _format:
+		raise ValueError(
+			'unexpected format %s in %s. Must be %d; file may have been saved'
+			' by a newer version of isotopylog.' % (fmt, file, _format))
+
+	objs = {}
+
+	for n in arrs['__names__']:
+		prefix = '%s/' % n
+		cn = str(arrs[prefix + '__class__'])
+		objs[str(n)] = _converters[cn][2](arrs, prefix)
+
+	return objs
+
+#function for loading a single object of a given class
+def _load_one(cls, file, name, mmap_mode):
+	'''
+	Loads a single object of class `cls`; either the object called `name` or,
+	if `name` is ``None``, the first object of class `cls` in the file.
+	'''
+
+	objs = load(file, mmap_mode = mmap_mode)
+
+	if name is not None:
+		try:
+			o = objs[name]
+
+		except KeyError:
+			raise ValueError(
+				'no object named %s in %s. Contains: %s.'
+				% (name, file, ', '.join(objs)))
+
+		if not isinstance(o, cls):
+			raise TypeError(
+				'object %s in %s is of type %s, not %s.'
+				% (name, file, type(o).__name__, cls.__name__))
+
+		return o
+
+	for o in objs.values():
+		if isinstance(o, cls):
+			return o
+
+	raise ValueError(
+		'no %s objects in %s.' % (cls.__name__, file))
@@ -0,0 +1,86 @@
+'''
+Tests for the iterative (apg) HH20 inverse solver, which should converge to
+the direct solution for well-conditioned problems and warn otherwise.
+'''
+
+import warnings
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+import isotopylog.fit_cache as fit_cache
+import isotopylog.ratedata_helper as ratedata_helper
+
+from isotopylog.calc_funcs import(
+	_calc_A,
+	_calc_apg,
+	_calc_R,
+	_fHH20,
+	)
+
+#make a synthetic HH20 heating experiment
+def _experiment(T = 723.15, seed = 0, nt = 12):
+	tex = np.linspace(0, 3600*50, nt)
+	G = _fHH20(tex, -12., 3., 10, -50, 300)
+	Deq = ipl.Deq_from_T(T)
+
+	rng = np.random.default_rng(seed)
+	dex = np.zeros((nt, 3))
+	dex[:,0] = G*(0.6 - Deq) + Deq + rng.normal(0, 0.005, nt)
+	dex[0,0] = 0.6
+
+	return ipl.HeatingExperiment(dex, T, tex, dex_std = 0.01*np.ones((nt, 3)))
+
+@pytest.mark.parametrize('non_neg', [True, False])
+@pytest.mark.parametrize('omega', [0.1, 1., 10.])
+def test_apg_matches_direct(non_neg, omega):
+	he = _experiment()
+
+	rd, _, resd, rghd = ipl.fit_HH20inv(he, omega = omega, non_neg = non_neg)
+
+	with warnings.catch_warnings():
+		warnings.simplefilter('error')
+
+		ra, _, resa, rgha = ipl.fit_HH20inv(he, omega = omega,
+			non_neg = non_neg, solver = 'apg', tol = 1e-10)
+
+	assert np.max(np.abs(ra - rd)) < 1e-3*np.max(np.abs(rd))
+	np.testing.assert_allclose([resa, rgha], [resd, rghd], rtol = 1e-5)
+
+def test_apg_warns_if_not_converged():
+	he = _experiment()
+	nu = np.linspace(-50, 10, 300)
+
+	A = _calc_A(he.tex, nu)
+	R = _calc_R(len(nu))
+
+	with pytest.warns(UserWarning, match = 'did not converge'):
+		_, nit = _calc_apg(A, he.Gex, R, 0.01, dnu = nu[1] - nu[0],
+			maxiter = 100)
+
+	assert nit == 100
+
+def test_L_curve_warm_start(monkeypatch):
+	he = _experiment()
+	kw = {'nnu' : 100, 'nom' : 10, 'omega_min' : 0.1, 'omega_max' : 10.}
+
+	#record the initial guess passed to each iterative solve
+	x0s = []
+
+	def apg(*args, **kwargs):
+		x0s.append(kwargs.get('x0'))
+		return _calc_apg(*args, **kwargs)
+
+	monkeypatch.setattr(ratedata_helper, '_calc_apg', apg)
+	monkeypatch.setitem(fit_cache._state, 'enabled', False)
+
+	omd = ipl.calc_L_curve(he, **kw)
+	oma = ipl.calc_L_curve(he, solver = 'apg', tol = 1e-10, **kw)
+
+	assert oma == omd
+
+	#only the first (largest omega) solve starts cold
+	assert len(x0s) == kw['nom']
+	assert x0s[0] is None
+	assert all(x0 is not None for x0 in x0s[1:])
@@ -0,0 +1,34 @@
+'''
+Tests for the closed-form Arrhenius regression, including columns that do not
+vary with temperature, and the resulting SE15 geologic history uncertainty.
+'''
+
+import numpy as np
+
+import isotopylog as ipl
+
+def test_constant_column():
+	T = np.linspace(600, 800, 6)
+	lnk = np.column_stack([
+		-200/(8.314e-3*T) + 20,
+		np.full(len(T), 0.5),
+		])
+
+	params, params_cov, rmse = ipl.fit_Arrhenius(T, lnk)
+
+	#constant column gives E = 0 exactly, with zero covariance
+	np.testing.assert_allclose(params[:,0], [200, 20], rtol = 1e-10)
+	np.testing.assert_allclose(params[:,1], [0, 0.5], atol = 1e-12)
+	np.testing.assert_allclose(params_cov[2:,2:], 0, atol = 1e-20)
+
+def test_se15_geologic_history_std_is_bounded():
+	t = np.linspace(0, 20e6*3.15e7, 200)
+	T = 373 + 100*np.sin(np.linspace(0, 3, 200))
+	ed = ipl.EDistribution.from_literature(mineral = 'calcite',
+		reference = 'SE15')
+
+	D, D_std = ipl.geologic_history(t, T, ed, [0.6, 2., -5.],
+		d0_std = [0.01, 0., 0.])
+
+	assert np.isfinite(D_std).all()
+	assert np.max(D_std) < 1
@@ -0,0 +1,144 @@
+'''
+Parity tests for the sequential loop backends. NumPy loops are checked against
+the scalar loop functions that numba compiles; if numba is installed, the
+compiled backend is also checked against NumPy for each model function.
+'''
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+
+from isotopylog import backends
+
+from isotopylog.calc_funcs import(
+	_fSE15,
+	_ghHea14,
+	_ghHH20,
+	_ghPH12,
+	_ghSE15,
+	)
+
+#tolerance for backend parity
+rtol = 1e-12
+
+@pytest.fixture(autouse = True)
+def reset_backend():
+	'''
+	Restores the backend selected before each test.
+	'''
+	name = ipl.get_backend()
+	yield
+	ipl.set_backend(name)
+
+#make a geologic t-T history and its Deq values
+def _history(nt = 500):
+	t = np.linspace(0, 1e6*3.15e7, nt)
+	T = 400 + 50*np.sin(np.linspace(0, 3, nt))
+	Deq = ipl.Deq_from_T(T)
+
+	return t, T, Deq
+
+#make all model function calls to compare between backends
+def _run_models():
+	t, T, Deq = _history()
+	tex = np.linspace(0, 2e5, 300)
+	Tex = np.ones(300)*723.15
+
+	return [
+		_ghPH12(t, 200., -20., 0.6, Deq, T, 400.),
+		_ghHea14(t, 200., -20., 180., -22., 190., -21., 0.6, Deq, T, 400.),
+		_ghHH20(t, 220., -22., -2., 2.4, 0.6, Deq, T, 400.),
+		_ghSE15(t, 200., -20., 210., -21., 0.1, 0.1, 0.6, 2., -5., T, 400.)[0],
+		_fSE15(tex, -8.7, -10.8, 0.11, np.array([0.6, 2., -5.]), Tex)[0],
+		]
+
+def test_gh_recursion_numpy_matches_loop():
+	rng = np.random.default_rng(0)
+
+	#check both the per-set and vectorized-over-sets paths
+	for nb in (1, 3, 25):
+		D0 = rng.random(nb)
+		Deq = rng.random(200)
+		K = rng.random((nb, 200))
+
+		np.testing.assert_allclose(
+			backends._np_gh_recursion(D0, Deq, K),
+			backends._loop_gh_recursion(D0, Deq, K),
+			rtol = rtol)
+
+def test_backward_euler_numpy_matches_loop():
+	rng = np.random.default_rng(1)
+
+	x0 = np.array([1., 2.])
+	A = -rng.random((100, 4))
+	B = rng.random((100, 2))
+	t = np.cumsum(rng.random(100))
+
+	np.testing.assert_allclose(
+		backends._np_backward_euler(x0, A, B, t),
+		backends._loop_backward_euler(x0, A, B, t),
+		rtol = rtol)
+
+def test_backward_euler_matches_matrix_inverse():
+	rng = np.random.default_rng(2)
+
+	x0 = np.array([1., 2.])
+	A = -rng.random((100, 4))
+	B = rng.random((100, 2))
+	t = np.cumsum(rng.random(100))
+
+	#reference solution using explicit matrix inverses at each step
+	x = np.zeros([100, 2])
+	x[0] = x0
+
+	for i in range(99):
+		dt = t[i+1] - t[i]
+		Ainv = np.linalg.inv(np.eye(2) - dt*A[i].reshape(2,2))
+		x[i+1] = np.dot(Ainv, x[i] + dt*B[i])
+
+	np.testing.assert_allclose(backends.backward_euler(x0, A, B, t), x,
+		rtol = rtol)
+
+def test_gh_recursion_1d_matches_batch():
+	t, T, Deq = _history()
+	K = np.exp(-np.linspace(0, 1, len(t)))
+
+	D = backends.gh_recursion(0.6, Deq, K)
+	Db = backends.gh_recursion(np.array([0.6, 0.6]), Deq, np.array([K, K]))
+
+	assert D.shape == (len(t),)
+	np.testing.assert_allclose(Db[0], D, rtol = rtol)
+	np.testing.assert_allclose(Db[1], D, rtol = rtol)
+
+def test_numba_matches_numpy():
+	pytest.importorskip('numba')
+
+	ipl.set_backend('numpy')
+	ref = _run_models()
+
+	ipl.set_backend('numba')
+	assert ipl.get_backend() == 'numba'
+
+	for D, Dref in zip(_run_models(), ref):
+		np.testing.assert_allclose(D, Dref, rtol = rtol)
+
+def test_auto_backend():
+	ipl.set_backend('auto')
+
+	if backends._has_numba():
+		assert ipl.get_backend() == 'numba'
+
+	else:
+		assert ipl.get_backend() == 'numpy'
+
+def test_set_backend_errors():
+	with pytest.raises(ValueError):
+		ipl.set_backend('fortran')
+
+	with pytest.raises(TypeError):
+		ipl.set_backend(1)
+
+	if not backends._has_numba():
+		with pytest.raises(ImportError):
+			ipl.set_backend('numba')
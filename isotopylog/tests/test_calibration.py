@@ -0,0 +1,139 @@
+'''
+Tests for inverting calibration equations. Temperatures solved from Deq
+values should match the temperatures used to calculate them for every
+calibration and reference frame, and values outside of the physical branch
+of each calibration should return NaN. Interpolated inverse tables should
+match exact solutions and be stored on disk.
+'''
+
+import itertools
+import json
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+import isotopylog.calc_funcs as calc_funcs
+
+from isotopylog.calc_funcs import(
+	_calc_cal_branch,
+	_calc_inv_table,
+	)
+
+from isotopylog.dictionaries import(
+	cal_coeffs,
+	caleqs,
+	ref_frames,
+	)
+
+cals = list(itertools.product(sorted(cal_coeffs), ref_frames))
+
+T = np.linspace(273.15, 1500, 500)
+
+@pytest.mark.parametrize('calibration, ref_frame', cals)
+def test_exact_round_trip(calibration, ref_frame):
+	kw = {'calibration' : calibration, 'ref_frame' : ref_frame}
+
+	Deq = ipl.Deq_from_T(T, **kw)
+
+	np.testing.assert_allclose(ipl.T_from_Deq(Deq, **kw), T, rtol = 1e-12)
+
+	#scalars return scalars
+	T0 = ipl.T_from_Deq(float(Deq[0]), **kw)
+
+	assert np.ndim(T0) == 0
+	assert T0 == pytest.approx(T[0], rel = 1e-12)
+
+@pytest.mark.parametrize('calibration, ref_frame', cals)
+def test_out_of_branch(calibration, ref_frame):
+	kw = {'calibration' : calibration, 'ref_frame' : ref_frame}
+	_, _, _, _, Dg = _calc_cal_branch(calibration, ref_frame)
+
+	D = np.array([Dg[0] - 0.01, Dg[-1] + 0.01, np.nan, 0.6])
+	T = ipl.T_from_Deq(D, **kw)
+
+	assert np.isnan(T[:3]).all()
+	assert np.isfinite(T[3])
+
+@pytest.mark.parametrize('calibration, ref_frame', cals)
+def test_table_matches_exact(calibration, ref_frame):
+	kw = {'calibration' : calibration, 'ref_frame' : ref_frame}
+
+	#include temperatures outside of the table range, which are solved exactly
+	Tt = np.concatenate([np.linspace(250, 1500, 10000), [200., 2000.]])
+	Deq = ipl.Deq_from_T(Tt, **kw)
+
+	Te = ipl.T_from_Deq(Deq, method = 'exact', **kw)
+	Ti = ipl.T_from_Deq(Deq, method = 'table', **kw)
+
+	#documented interpolation error
+	np.testing.assert_allclose(Ti, Te, rtol = 0, atol = 1e-3)
+	np.testing.assert_allclose(Ti[-2:], Te[-2:], rtol = 1e-12)
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+	monkeypatch.setenv('ISOTOPYLOG_CACHE_DIR', str(tmp_path))
+	monkeypatch.setattr(calc_funcs, '_inv_tables', {})
+
+	return tmp_path
+
+@pytest.fixture
+def registered_cal():
+	name = '_testTableCal'
+	ipl.register_calibration(name, [0.1745, 0, 2.5885e4, 0, 1.0771e9])
+
+	yield name
+
+	cal_coeffs.pop(name, None)
+	caleqs.pop(name, None)
+
+def test_table_cache(cache_dir):
+	Dt, Tt, err = _calc_inv_table('Bea17', 'CDES90')
+
+	assert err < 1e-3
+	assert len(list(cache_dir.glob('invtab_Bea17_CDES90_*.npy'))) == 1
+	assert len(list(cache_dir.glob('invtab_Bea17_CDES90_*.json'))) == 1
+
+	#reload from disk as a read-only memory map
+	calc_funcs._inv_tables.clear()
+	Dt2, Tt2, err2 = _calc_inv_table('Bea17', 'CDES90')
+
+	assert isinstance(Dt2, np.memmap) and not Dt2.flags.writeable
+	assert err2 == err
+	np.testing.assert_array_equal(Dt2, Dt)
+	np.testing.assert_array_equal(Tt2, Tt)
+
+	#changed inputs make a new table
+	_calc_inv_table('Bea17', 'CDES90', tol = 1e-2)
+
+	assert len(list(cache_dir.glob('invtab_Bea17_CDES90_*.npy'))) == 2
+
+def test_table_cache_corrupt(cache_dir):
+	Dt, Tt, err = _calc_inv_table('Bea17', 'CDES90')
+
+	#unreadable metadata is remade rather than loaded
+	calc_funcs._inv_tables.clear()
+	p, = cache_dir.glob('invtab_Bea17_CDES90_*.json')
+	p.write_text('{')
+
+	Dt2, Tt2, err2 = _calc_inv_table('Bea17', 'CDES90')
+
+	assert err2 == err
+	np.testing.assert_array_equal(Tt2, Tt)
+	assert json.loads(p.read_text())['err'] == err
+
+def test_table_cache_invalidated(cache_dir, registered_cal):
+	D = np.linspace(0.3, 0.6, 10)
+	T1 = ipl.T_from_Deq(D, calibration = registered_cal, method = 'table')
+
+	#re-registering with different coefficients never reuses the old table
+	ipl.register_calibration(registered_cal,
+		[0.2, 0, 2.5885e4, 0, 1.0771e9])
+	calc_funcs._inv_tables.clear()
+
+	T2 = ipl.T_from_Deq(D, calibration = registered_cal, method = 'table')
+	Te = ipl.T_from_Deq(D, calibration = registered_cal, method = 'exact')
+
+	assert not np.allclose(T2, T1)
+	np.testing.assert_allclose(T2, Te, rtol = 0, atol = 1e-3)
+	assert len(list(cache_dir.glob('invtab_%s_*.npy' % registered_cal))) == 2
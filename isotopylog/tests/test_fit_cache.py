@@ -0,0 +1,125 @@
+'''
+Tests for the on-disk fit cache: stored results are reused only when all fit
+inputs match, and least-recently-used results are evicted when the cache
+exceeds its maximum size.
+'''
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+import isotopylog.fit_cache as fit_cache
+
+from isotopylog.calc_funcs import _fHH20
+
+#make a synthetic HH20 heating experiment
+def _experiment(T = 723.15, seed = 0, nt = 12):
+	tex = np.linspace(0, 3600*50, nt)
+	G = _fHH20(tex, -12., 3., 10, -50, 300)
+	Deq = ipl.Deq_from_T(T)
+
+	rng = np.random.default_rng(seed)
+	dex = np.zeros((nt, 3))
+	dex[:,0] = G*(0.6 - Deq) + Deq + rng.normal(0, 0.005, nt)
+	dex[0,0] = 0.6
+
+	return ipl.HeatingExperiment(dex, T, tex, dex_std = 0.01*np.ones((nt, 3)))
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+	monkeypatch.setenv('ISOTOPYLOG_CACHE_DIR', str(tmp_path))
+	state = dict(fit_cache._state)
+
+	ipl.set_fit_cache(True)
+	ipl.clear_fit_cache()
+
+	yield
+
+	ipl.clear_fit_cache()
+	fit_cache._state.update(state)
+
+def _counts():
+	info = ipl.fit_cache_info()
+
+	return info['hits'], info['misses']
+
+def test_hit(cache):
+	he = _experiment()
+
+	kd1 = ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	assert _counts() == (0, 1)
+
+	kd2 = ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	assert _counts() == (1, 1)
+
+	np.testing.assert_array_equal(kd2.params, kd1.params)
+	np.testing.assert_array_equal(kd2.params_cov, kd1.params_cov)
+
+	#equal but separate experiments also hit
+	ipl.kDistribution.invert_experiment(_experiment(), model = 'PH12')
+	assert _counts() == (2, 1)
+
+def test_miss_when_p0_changes(cache):
+	he = _experiment()
+
+	ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	ipl.kDistribution.invert_experiment(he, model = 'PH12', p0 = [-9., 0.5])
+	assert _counts() == (0, 2)
+
+	ipl.kDistribution.invert_experiment(he, model = 'PH12', p0 = [-9., 0.5])
+	assert _counts() == (1, 2)
+
+def test_miss_when_omega_changes(cache):
+	he = _experiment()
+
+	kd1 = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+		fit_reg = True, omega = 1.)
+	kd2 = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+		fit_reg = True, omega = 2.)
+	assert _counts() == (0, 2)
+	assert kd1.omega == 1. and kd2.omega == 2.
+
+	kd3 = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+		fit_reg = True, omega = 1.)
+	assert _counts() == (1, 2)
+
+	np.testing.assert_array_equal(kd3.rho_nu_inv, kd1.rho_nu_inv)
+
+def test_miss_when_experiment_changes(cache):
+	ipl.kDistribution.invert_experiment(_experiment(seed = 0), model = 'PH12')
+	ipl.kDistribution.invert_experiment(_experiment(seed = 1), model = 'PH12')
+	assert _counts() == (0, 2)
+
+def test_eviction(cache):
+	he = _experiment()
+
+	ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	size = ipl.fit_cache_info()['size']
+
+	#room for two results
+	ipl.set_fit_cache(True, max_size = int(2.5*size))
+
+	for lnkref in [-9., -8.]:
+		ipl.kDistribution.invert_experiment(he, model = 'PH12',
+			p0 = [lnkref, 0.5])
+
+	info = ipl.fit_cache_info()
+	assert info['nfiles'] == 2
+	assert info['size'] <= info['max_size']
+
+	#most recent result is kept, least recent is evicted
+	ipl.kDistribution.invert_experiment(he, model = 'PH12', p0 = [-8., 0.5])
+	assert _counts() == (1, 3)
+
+	ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	assert _counts() == (1, 4)
+
+def test_disabled(cache):
+	ipl.set_fit_cache(False)
+	he = _experiment()
+
+	ipl.kDistribution.invert_experiment(he, model = 'PH12')
+	ipl.kDistribution.invert_experiment(he, model = 'PH12')
+
+	assert _counts() == (0, 0)
+	assert ipl.fit_cache_info()['nfiles'] == 0
@@ -0,0 +1,53 @@
+'''
+Tests for nfev counting, which should count each evaluated parameter set once
+regardless of model or of how many kernel layers it passes through.
+'''
+
+import threading
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+
+t = np.linspace(0, 20e6*3.15e7, 200)
+T = 373 + 100*np.sin(np.linspace(0, 3, 200))
+
+#number of Arrhenius parameters plus D0 for each model
+npars = {'PH12' : 3, 'HH20' : 5, 'SE15' : 7}
+
+@pytest.mark.parametrize('ref', ['PH12', 'HH20', 'SE15'])
+def test_geologic_history_nfev(ref):
+	ed = ipl.EDistribution.from_literature(mineral = 'calcite',
+		reference = ref)
+	ed.Eparams
+
+	with ipl.instrument():
+		ipl.geologic_history(t, T, ed, [0.6, 2., -5.])
+
+	stats = ipl.get_stats()
+
+	#one forward evaluation plus a central-difference Jacobian
+	nfev = 1 + 2*npars[ref]
+	assert stats['core_functions.geologic_history']['nfev'] == nfev
+	assert stats['model_kernels.ModelKernel.geologic']['nfev'] == nfev
+
+def test_threads_are_counted_separately():
+	ed = ipl.EDistribution.from_literature(mineral = 'calcite',
+		reference = 'PH12')
+	ed.Eparams
+
+	with ipl.instrument():
+		ths = [threading.Thread(target = ipl.geologic_history,
+			args = (t, T, ed, [0.6, 0., 0.])) for _ in range(4)]
+
+		for th in ths:
+			th.start()
+
+		for th in ths:
+			th.join()
+
+	stats = ipl.get_stats()
+
+	assert stats['core_functions.geologic_history']['calls'] == 4
+	assert stats['core_functions.geologic_history']['nfev'] == 4*7
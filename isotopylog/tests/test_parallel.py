@@ -0,0 +1,98 @@
+'''
+Tests for fitting many heating experiments in worker processes. Workers are
+started using spawn, as on macOS and Windows, such that they do not inherit
+any state from the parent process. Errors raised by individual fits are
+captured and reported per experiment.
+'''
+
+import functools
+import multiprocessing
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+import isotopylog.ratedata as ratedata
+
+from concurrent.futures import ProcessPoolExecutor
+
+from isotopylog.calc_funcs import _fHH20
+from isotopylog.dictionaries import(
+	cal_coeffs,
+	caleqs,
+	)
+
+#make a synthetic HH20 heating experiment
+def _experiment(seed, T = 723.15, nt = 15):
+	tex = np.linspace(0, 3600*50, nt)
+	G = _fHH20(tex, -12., 3., 10, -50, 300)
+	Deq = ipl.Deq_from_T(T)
+
+	rng = np.random.default_rng(seed)
+	dex = np.zeros((nt, 3))
+	dex[:,0] = G*(0.6 - Deq) + Deq + rng.normal(0, 0.005, nt)
+	dex[0,0] = 0.6
+
+	return ipl.HeatingExperiment(dex, T, tex, dex_std = 0.01*np.ones((nt, 3)))
+
+@pytest.fixture
+def spawn_pool(monkeypatch):
+	ctx = multiprocessing.get_context('spawn')
+	monkeypatch.setattr(ratedata, 'ProcessPoolExecutor',
+		functools.partial(ProcessPoolExecutor, mp_context = ctx))
+
+@pytest.fixture
+def registered_cal():
+	name = '_testSpawnCal'
+	ipl.register_calibration(name, [0.1745, 0, 2.5885e4, 0, 1.0771e9])
+
+	yield name
+
+	cal_coeffs.pop(name, None)
+	caleqs.pop(name, None)
+
+def test_registered_calibration_in_spawned_workers(spawn_pool, registered_cal):
+	hes = [_experiment(i) for i in range(3)]
+
+	for he in hes:
+		he.calibration = registered_cal
+
+	kds1, errs1 = ipl.kDistribution.invert_experiments(hes, n_jobs = 1)
+	kds2, errs2 = ipl.kDistribution.invert_experiments(hes, n_jobs = 2)
+
+	assert errs1 == errs2 == [None]*3
+
+	for k1, k2 in zip(kds1, kds2):
+		np.testing.assert_allclose(k2.params, k1.params)
+
+def test_from_experiments_empty():
+	with pytest.raises(ValueError, match = 'empty'):
+		ipl.EDistribution.from_experiments([], model = 'PH12', n_jobs = 1)
+
+def test_from_experiments_errors():
+	hes = [_experiment(i, T = T) for i, T in enumerate([673.15, 723.15,
+		773.15])]
+
+	#an experiment with no valid data after the first points cannot be fit
+	bad = _experiment(3)
+	bad.dex[3:,0] = np.nan
+	hes.insert(1, bad)
+
+	kds, errs = ipl.kDistribution.invert_experiments(hes, model = 'PH12',
+		n_jobs = 2)
+
+	assert [kd is None for kd in kds] == [False, True, False, False]
+	assert [e is None for e in errs] == [True, False, True, True]
+	assert isinstance(errs[1], ValueError)
+
+	#failed experiments are excluded with a warning
+	with pytest.warns(UserWarning, match = '1 \\('):
+		ed = ipl.EDistribution.from_experiments(hes, model = 'PH12',
+			n_jobs = 1)
+
+	assert ed.npt == 3
+
+	#all experiments failing raises, listing each error
+	with pytest.raises(ValueError, match = '0 \\(.*; 1 \\('):
+		ipl.EDistribution.from_experiments([bad, bad], model = 'PH12',
+			n_jobs = 1)
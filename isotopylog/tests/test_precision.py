@@ -0,0 +1,81 @@
+'''
+Error-bound tests for single-precision forward modeling. Single-precision
+results are checked against double-precision results for the HH20 model
+functions, including long time-temperature histories.
+'''
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+
+from isotopylog.calc_funcs import(
+	_calc_A,
+	_fHH20,
+	_ghHH20,
+	)
+
+#bound on D differences between single and double precision, in permil
+atol = 1e-6
+
+#make a geologic t-T history and its Deq values
+def _history(nt):
+	t = np.linspace(0, 20e6*3.15e7, nt)
+	T = 373 + 100*np.sin(np.linspace(0, 3, nt))
+	Deq = ipl.Deq_from_T(T)
+
+	return t, T, Deq
+
+@pytest.mark.parametrize('nt', [100, 3000, 30000])
+def test_ghHH20_single_error_bound(nt):
+	t, T, Deq = _history(nt)
+	p = (224.3, 27.4, -17.4, 0., 0.6)
+
+	#literature HH20 values are reported with Tref = inf
+	D64 = _ghHH20(t, *p, Deq, T, np.inf)
+	D32 = _ghHH20(t, *p, Deq, T, np.inf, dtype = np.float32)
+
+	np.testing.assert_allclose(D32, D64, rtol = 0, atol = atol)
+
+def test_fHH20_single_error_bound():
+	t = np.linspace(0, 1e5, 200)
+	p = (-18., 2.5, 5., -40., 400)
+
+	D64 = _fHH20(t, *p)
+	D32 = _fHH20(t, *p, dtype = np.float32)
+
+	np.testing.assert_allclose(D32, D64, rtol = 0, atol = atol)
+
+def test_calc_A_single():
+	t = np.linspace(0, 1e5, 200)
+	nu = np.linspace(-40, 5, 400)
+	dnu = nu[1] - nu[0]
+
+	A64 = _calc_A(t, nu)
+	A32 = _calc_A(t, nu, dtype = np.float32)
+
+	assert A32.dtype == np.float32
+	np.testing.assert_allclose(A32, A64, rtol = 0, atol = 1e-6*dnu)
+
+def test_geologic_history_single():
+	t, T, _ = _history(2000)
+	ed = ipl.EDistribution.from_literature(
+		mineral = 'calcite',
+		reference = 'HH20')
+
+	D64, Ds64 = ipl.geologic_history(t, T, ed, [0.6, 0, 0],
+		d0_std = [0.01, 0, 0])
+	D32, Ds32 = ipl.geologic_history(t, T, ed, [0.6, 0, 0],
+		d0_std = [0.01, 0, 0], dtype = np.float32)
+
+	np.testing.assert_allclose(D32, D64, rtol = 0, atol = atol)
+	np.testing.assert_allclose(Ds32, Ds64, rtol = 0, atol = 1e-4)
+
+def test_geologic_history_dtype_error():
+	t, T, _ = _history(10)
+	ed = ipl.EDistribution.from_literature(
+		mineral = 'calcite',
+		reference = 'HH20')
+
+	with pytest.raises(ValueError):
+		ipl.geologic_history(t, T, ed, [0.6, 0, 0], dtype = np.float16)
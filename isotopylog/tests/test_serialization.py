@@ -0,0 +1,136 @@
+'''
+Round-trip tests for saving and loading ``HeatingExperiment``,
+``kDistribution``, and ``EDistribution`` objects, with and without
+compression and memory mapping.
+'''
+
+import numpy as np
+import pytest
+
+import isotopylog as ipl
+
+from isotopylog.calc_funcs import _fHH20
+from isotopylog.serialization import _converters
+
+#make a synthetic HH20 heating experiment
+def _experiment(T = 723.15, seed = 0, nt = 12):
+	tex = np.linspace(0, 3600*50, nt)
+	G = _fHH20(tex, -12., 3., 10, -50, 300)
+	Deq = ipl.Deq_from_T(T)
+
+	rng = np.random.default_rng(seed)
+	dex = np.zeros((nt, 3))
+	dex[:,0] = G*(0.6 - Deq) + Deq + rng.normal(0, 0.005, nt)
+	dex[:,1] = rng.normal(2, 0.1, nt)
+	dex[:,2] = rng.normal(-5, 0.1, nt)
+	dex[0,0] = 0.6
+
+	return ipl.HeatingExperiment(dex, T, tex, dex_std = 0.01*np.ones((nt, 3)))
+
+@pytest.fixture(scope = 'module')
+def objs():
+	he = _experiment()
+	kd = ipl.kDistribution.invert_experiment(he, model = 'HH20',
+		fit_reg = True, omega = 1.)
+
+	kds = [ipl.kDistribution.invert_experiment(_experiment(T, i),
+		model = 'PH12') for i, T in enumerate([673.15, 723.15, 773.15])]
+
+	return {'he' : he, 'kd' : kd, 'ed' : ipl.EDistribution(kds),
+		'ed_lit' : ipl.EDistribution.from_literature(mineral = 'calcite',
+			reference = 'HH20')}
+
+#check that two objects store identical arrays and metadata
+def _assert_same(o1, o2):
+	assert type(o1) is type(o2)
+
+	cn = type(o1).__name__
+	a1 = _converters[cn][1](o1, '')
+	a2 = _converters[cn][1](o2, '')
+
+	assert sorted(a1) == sorted(a2)
+
+	for k in a1:
+		np.testing.assert_array_equal(a2[k], a1[k], err_msg = k)
+
+@pytest.mark.parametrize('compress', [False, True])
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+@pytest.mark.parametrize('name', ['he', 'kd', 'ed', 'ed_lit'])
+def test_round_trip(objs, tmp_path, name, compress, mmap_mode):
+	o = objs[name]
+	path = str(tmp_path / 'obj.npz')
+
+	o.save(path, compress = compress)
+	o2 = type(o).load(path, mmap_mode = mmap_mode)
+
+	_assert_same(o, o2)
+
+def test_memory_mapped_arrays(objs, tmp_path):
+	path = str(tmp_path / 'kd.npz')
+
+	objs['kd'].save(path)
+	kd = ipl.kDistribution.load(path, mmap_mode = 'r')
+
+	assert isinstance(kd.rho_nu, np.memmap)
+
+	#compressed arrays are read into memory
+	objs['kd'].save(path, compress = True)
+	kd = ipl.kDistribution.load(path, mmap_mode = 'r')
+
+	assert not isinstance(kd.rho_nu, np.memmap)
+
+def test_many_objects(objs, tmp_path):
+	path = str(tmp_path / 'all.npz')
+
+	ipl.save(path, objs)
+	loaded = ipl.load(path)
+
+	assert list(loaded) == list(objs)
+
+	for k, o in objs.items():
+		_assert_same(o, loaded[k])
+
+	#lazily made kDistributions stay lazy
+	assert all(o is None for o in loaded['ed_lit']._kdobjs)
+
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+def test_forward_modeled_round_trip(objs, tmp_path, mmap_mode):
+	he = _experiment()
+	he.forward_model(objs['kd'], nt = 50)
+	path = str(tmp_path / 'he.npz')
+
+	he.save(path)
+	he2 = ipl.HeatingExperiment.load(path, mmap_mode = mmap_mode)
+
+	for k in ['t', 'D', 'D_std', '_Ginv', '_Dinv']:
+		np.testing.assert_array_equal(getattr(he2, k), getattr(he, k))
+
+	#regularized inverse results can be plotted
+	matplotlib = pytest.importorskip('matplotlib')
+	matplotlib.use('Agg')
+
+	he2.plot(plot_reg = True)
+
+def test_unknown_format(objs, tmp_path):
+	path = str(tmp_path / 'he.npz')
+	objs['he'].save(path)
+
+	with np.load(path) as f:
+		arrs = {k : f[k] for k in f.files}
+
+	arrs['__format__'] = np.array(99)
+	np.savez(path, **arrs)
+
+	with pytest.raises(ValueError):
+		ipl.HeatingExperiment.load(path)
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_hdf5_round_trip(objs, tmp_path, compress):
+	pytest.importorskip('h5py')
+	path = str(tmp_path / 'all.h5')
+
+	ipl.save(path, objs, compress = compress)
+	loaded = ipl.load(path, mmap_mode = 'r')
+
+	for k, o in objs.items():
+		_assert_same(o, loaded[k])
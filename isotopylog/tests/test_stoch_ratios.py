@@ -0,0 +1,74 @@
+'''
+Tests for the vectorized, cached stochastic isotope ratios used by the SE15
+model, which should match the per-composition results exactly.
+'''
+
+import numpy as np
+import pytest
+
+from isotopylog.calc_funcs import(
+	_calc_R_stoch,
+	_calc_Rpr,
+	_calc_stoch_ratios,
+	)
+
+@pytest.fixture(autouse = True)
+def clear_cache():
+	_calc_stoch_ratios.cache_clear()
+
+	yield
+
+	_calc_stoch_ratios.cache_clear()
+
+#calculate each ratio one composition at a time
+def _elementwise(d13C, d18O, iso_params, z):
+	d13C, d18O = np.broadcast_arrays(d13C, d18O)
+	res = np.zeros((4,) + d13C.shape)
+
+	for i in np.ndindex(d13C.shape):
+		R = _calc_R_stoch(float(d13C[i]), float(d18O[i]), iso_params)
+		res[(slice(None),) + i] = R + (_calc_Rpr(*R, z),)
+
+	return res
+
+@pytest.mark.parametrize('d13C, d18O', [
+	(2., np.linspace(-10, 5, 7)),
+	(np.linspace(-5, 5, 7), -3.),
+	(np.linspace(-5, 5, 3)[:,None], np.linspace(-10, 5, 4)),
+	])
+@pytest.mark.parametrize('iso_params', ['Gonfiantini', 'Brand'])
+def test_matches_elementwise(d13C, d18O, iso_params):
+	res = _calc_stoch_ratios(d13C, d18O, iso_params, 6)
+	exp = _elementwise(d13C, d18O, iso_params, 6)
+
+	for r, e in zip(res, exp):
+		assert r.shape == e.shape
+		np.testing.assert_allclose(r, e, rtol = 1e-14, atol = 0)
+
+def test_scalar_inputs():
+	res = _calc_stoch_ratios(2., -5., 'Gonfiantini', 6)
+	exp = _elementwise(2., -5., 'Gonfiantini', 6)
+
+	assert all(isinstance(r, float) for r in res)
+	np.testing.assert_allclose(res, exp, rtol = 1e-14, atol = 0)
+
+def test_cached_arrays_are_read_only():
+	d18O = np.linspace(-10, 5, 7)
+
+	res = _calc_stoch_ratios(2., d18O, 'Gonfiantini', 6)
+
+	for r in res:
+		assert not r.flags.writeable
+
+		with pytest.raises(ValueError):
+			r[0] = 0.
+
+	#equal inputs return the stored arrays
+	res2 = _calc_stoch_ratios(2., d18O.copy(), 'Gonfiantini', 6)
+
+	assert all(r2 is r for r2, r in zip(res2, res))
+	assert _calc_stoch_ratios.cache_info().hits == 1
+
+	#changing z is a separate entry
+	_calc_stoch_ratios(2., d18O, 'Gonfiantini', 4)
+	assert _calc_stoch_ratios.cache_info().misses == 2
@@ -0,0 +1,106 @@
+'''
+Tests for importing many heating experiments from one table, which should
+give the same experiments as importing each one separately using
+``HeatingExperiment.from_csv``.
+'''
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import isotopylog as ipl
+
+from isotopylog.calc_funcs import _fHH20
+
+#make the rows of a synthetic HH20 experiment, with the first icull rows away
+# from equilibrium and all remaining rows at equilibrium
+def _rows(name, T, ref_frame, icull = None, nt = 8):
+	t = np.linspace(0, 3600*50, nt)
+	Deq = ipl.Deq_from_T(T, ref_frame = ref_frame)
+
+	#stay far from equilibrium
+	D = 0.1*_fHH20(t, -16., 1., 10, -50, 300) + 0.5 + Deq
+
+	if icull is not None:
+		D[icull:] = Deq + 0.001
+
+	return pd.DataFrame({
+		'experiment' : name,
+		't_s' : t,
+		'T_C' : T - 273.15,
+		'D47' : D,
+		'D47_std' : 0.01,
+		'd13C_vpdb' : np.linspace(2, 2.1, nt),
+		'd18O_vpdb' : np.linspace(-5, -5.1, nt),
+		'iso_params' : 'Brand',
+		'ref_frame' : ref_frame,
+		})
+
+@pytest.fixture
+def table():
+	exps = [
+		_rows('a', 723.15, 'CDES90', icull = 5),
+		_rows('b', 673.15, 'CDES25'),
+		_rows('c', 773.15, 'Ghosh25', icull = 0),
+		_rows('d', 698.15, 'CDES90', icull = 7),
+		]
+
+	#interleave rows of all experiments, keeping time order within each
+	rng = np.random.default_rng(0)
+	keys = np.concatenate([np.arange(len(e)) + rng.random(len(e))
+		for e in exps])
+	df = pd.concat(exps, ignore_index = True)
+	df = df.iloc[np.argsort(keys, kind = 'stable')].reset_index(drop = True)
+
+	#first row of the table is culled immediately
+	i = df.index[df['experiment'] == 'c'][0]
+	df = pd.concat([df.loc[[i]], df.drop(i)], ignore_index = True)
+
+	return df
+
+def _assert_same(he1, he2):
+	for k in ['dex', 'dex_std', 'T', 'tex']:
+		np.testing.assert_array_equal(getattr(he1, k), getattr(he2, k))
+
+	for k in ['calibration', 'clumps', 'iso_params', 'ref_frame']:
+		assert getattr(he1, k) == getattr(he2, k)
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+@pytest.mark.parametrize('culled', [False, True])
+def test_matches_from_csv(table, culled):
+	#rows of each experiment are not contiguous
+	e = table['experiment'].to_numpy()
+	assert np.sum(e[1:] != e[:-1]) > 4
+
+	hes = ipl.HeatingExperiment.from_table(table, culled = culled)
+	ids = pd.unique(table['experiment'])
+
+	assert len(hes) == len(ids)
+
+	for he, n in zip(hes, ids):
+		df = table[table['experiment'] == n].drop(columns = 'experiment')
+		_assert_same(he, ipl.HeatingExperiment.from_csv(df, culled = culled))
+
+	if culled:
+		nrows = {'a' : 5, 'b' : 8, 'c' : 0, 'd' : 7}
+
+		for he, n in zip(hes, ids):
+			assert len(he.tex) == nrows[n]
+
+def test_reference_frames(table):
+	hes = ipl.HeatingExperiment.from_table(table, culled = False)
+	ids = pd.unique(table['experiment'])
+
+	rfs = {'a' : 'CDES90', 'b' : 'CDES25', 'c' : 'Ghosh25', 'd' : 'CDES90'}
+
+	assert [he.ref_frame for he in hes] == [rfs[n] for n in ids]
+
+def test_missing_id(table):
+	table.loc[3, 'experiment'] = None
+
+	with pytest.raises(ValueError):
+		ipl.HeatingExperiment.from_table(table)
+
+def test_missing_id_column(table):
+	with pytest.raises(KeyError):
+		ipl.HeatingExperiment.from_table(table, id_col = 'sample')
@@ -15,9 +15,7 @@ __all__ = [
 	]
 
 #import packages
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import warnings
 
 #import types for checking
@@ -38,12 +36,15 @@ from .timedata_helper import(
 	_calc_D_from_G,
 	_calc_G_from_D,
 	_cull_data,
+	_cull_groups,
 	_forward_model,
 	_read_csv,
+	_read_table,
 	)
 
 #import necessary isotopylog dictionaries
 from .dictionaries import(
+	cal_coeffs,
 	caleqs,
 	clump_isos,
 	)
@@ -80,10 +81,11 @@ class HeatingExperiment(object):
 			``'PH12'``: for Passey and Henkes (2012) Eq. 4 \n
 			``'SE15'``: for Stolper and Eiler (2015) Fig. 3 \n
 			``'Bea17'``: for Bonifacie et al. (2017) Eq. 2 \n
-		If as a lambda function, must have T in Kelvin. Note that literature
-		equations will be adjusted to be consistent with any reference frame,
-		but lambda functions will be reference-frame-specific.
-		Defaults to ``'Bea17'``.
+		Calibrations added using ``ipl.register_calibration`` are also
+		accepted by name. If as a lambda function, must have T in Kelvin.
+		Note that literature equations will be adjusted to be consistent with
+		any reference frame, but lambda functions will be reference-frame-
+		specific. Defaults to ``'Bea17'``.
 
 	clumps : string
 		The clumped isotope system under consideration. Currently only
@@ -366,6 +368,8 @@ class HeatingExperiment(object):
 		 		 'T' : Tstr + '+/-' + Tstd
 		 		}
 
+		#import pandas only when needed
+		import pandas as pd
 		s = pd.Series(attrs)
 
 		return str(s)
@@ -390,10 +394,11 @@ class HeatingExperiment(object):
 				``'PH12'``: for Passey and Henkes (2012) Eq. 4 \n
 				``'SE15'``: for Stolper and Eiler (2015) Fig. 3 \n
 				``'Bea17'``: for Bonifacie et al. (2017) Eq. 2 \n
-			If as a lambda function, must have T in Kelvin. Note that
-			literature equations will be adjusted to be consistent with any 
-			reference frame, but lambda functions will be reference-frame-
-			specific. Defaults to ``'Bea17'``.
+			Calibrations added using ``ipl.register_calibration`` are also
+			accepted by name. If as a lambda function, must have T in Kelvin.
+			Note that literature equations will be adjusted to be consistent
+			with any reference frame, but lambda functions will be
+			reference-frame-specific. Defaults to ``'Bea17'``.
 
 		culled : boolean
 			Tells the function whether or not to cull data following the
@@ -493,6 +498,161 @@ class HeatingExperiment(object):
 		#return class instance
 		return cls(dex, T, tex, **file_attrs)
 
+	#method for generating many HeatingExperiment instances from one table
+	@classmethod
+	def from_table(
+		cls,
+		file,
+		id_col = 'experiment',
+		calibration = 'Bea17',
+		culled = True,
+		cull_sig = 1,
+		):
+		'''
+		Imports data from a csv file or table containing many heating
+		experiments (e.g., an instrument export) and creates a
+		HeatingExperiment object for each experiment.
+
+		Parameters
+		----------
+
+		file : string or pd.DataFrame
+			Either a string pointing to the csv file or a pd.DataFrame object
+			containing the data to import. Must contain the same columns as
+			required by ``HeatingExperiment.from_csv``, plus `id_col`.
+
+		id_col : string
+			The column identifying which experiment each row belongs to. Rows
+			of each experiment need not be contiguous, but must be listed in
+			time order (i.e., initial data first). Defaults to
+			``'experiment'``.
+
+		calibration : string or LambdaType
+			The D-T calibration curve to use for all experiments. See
+			``HeatingExperiment.from_csv`` for options. Defaults to
+			``'Bea17'``.
+
+		culled : boolean
+			Tells the function whether or not to cull data following the
+			approach of Passey and Henkes (2012).
+
+		cull_sig : int or float
+			The number of standard deviations deemed to be the cutoff
+			threshold. For example, if ``cull_sig = 1``, then drops everything
+			within 1 sigma of Deq.
+
+		Returns
+		-------
+
+		hes : list
+			List of ``HeatingExperiment`` objects, in order of first
+			appearance of each id in `id_col` (i.e., the order of
+			``pd.unique(df[id_col])``).
+
+		Raises
+		------
+
+		KeyError
+			If the inputted calibration is not an acceptable string or a 
+			lambda function.
+
+		KeyError
+			If the inputted csv file does not contain any of the necessary 
+			columns, including `id_col`.
+
+		TypeError
+			If the file parameter is not a path string or pandas DataFrame.
+
+		ValueError
+			If the inputted csv file doesn't contain appropriate data for CO47
+			clumps, or if any row is missing an experiment id.
+
+		Warnings
+		--------
+
+		UserWarning
+			If trying to cull data but no D uncertainty is inputted for some
+			rows.
+
+		See Also
+		--------
+
+		HeatingExperiment.from_csv
+			Classmethod for importing a single experiment.
+
+		Notes
+		-----
+
+		The table is parsed once and all columns are extracted as arrays
+		before grouping. Culling is vectorized across all experiments, such
+		that the only python work is creating each HeatingExperiment object.
+		Each experiment uses the ``iso_params`` and ``ref_frame`` values of its
+		first row.
+
+		Examples
+		--------
+
+		Importing all experiments from a single table and inverting each::
+
+			#import modules
+			import isotopylog as ipl
+
+			#table with an 'experiment' column identifying each experiment
+			file = 'string_with_file_name.csv'
+			hes = ipl.HeatingExperiment.from_table(file, culled = True)
+
+			kds = ipl.kDistribution.invert_experiments(hes, model = 'HH20')
+
+		References
+		----------
+
+		[1] Passey and Henkes (2012) *Earth Planet. Sci. Lett.*, **351**, 223--236.
+		'''
+
+		#import all experimental data at once
+		_, starts, ends, dex, T, tex, file_attrs = _read_table(
+			file, 
+			id_col = id_col
+			)
+
+		file_attrs['calibration'] = calibration #add to extracted dict
+
+		#cull data if necessary
+		if culled is True:
+
+			#check if uncertainty exists; raise warning if not
+			if not (file_attrs['dex_std'][:,0] > 0).all():
+				warnings.warn(
+					'Trying to cull data with no clumped isotope uncertainty.'
+					' Uncertainty is needed to assess approach to equilibrium.'
+					' Data may not be culled appropriately.', UserWarning
+					)
+
+			#cull all experiments at once
+			ends = _cull_groups(
+				dex, 
+				T, 
+				starts, 
+				ends, 
+				file_attrs, 
+				cull_sig = cull_sig
+				)
+
+		#make each class instance
+		dex_std = file_attrs['dex_std']
+		hes = []
+
+		for i, (i0, i1) in enumerate(zip(starts, ends)):
+			hes.append(cls(dex[i0:i1], T[i0:i1], tex[i0:i1],
+				calibration = calibration,
+				clumps = file_attrs['clumps'],
+				dex_std = dex_std[i0:i1],
+				iso_params = file_attrs['iso_params'][i],
+				ref_frame = file_attrs['ref_frame'][i],
+				))
+
+		return hes
+
 	#method for forward modeling rate data to predict D or G evolution
 	def forward_model(self, kd, nt = 300, z = 6, **kwargs):
 		'''
@@ -724,8 +884,9 @@ class HeatingExperiment(object):
 		.. image:: ../../_images/he_2.png
 		'''
 
-		#make axis if necessary
+		#make axis if necessary, importing plotting backend only when needed
 		if ax is None:
+			import matplotlib.pyplot as plt
 			_, ax = plt.subplots(1,1)
 
 		#get the right y axis
@@ -986,6 +1147,75 @@ class HeatingExperiment(object):
 		if self.D_std is not None:
 			self.D_std = m*self.D_std
 
+	#define classmethod for loading a saved HeatingExperiment
+	@classmethod
+	def load(cls, file, name = None, mmap_mode = None):
+		'''
+		Classmethod for loading a ``HeatingExperiment`` instance saved using the
+		``save`` method or ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		name : str or None
+			The name of the object to load. If ``None``, loads the first
+			``HeatingExperiment`` in the file. Defaults to ``None``.
+
+		mmap_mode : None or str
+			If ``'r'`` or ``'c'``, numeric arrays (e.g., forward-modeled
+			``t``, ``D``, and ``D_std``) are loaded as memory maps. Defaults
+			to ``None``.
+
+		Returns
+		-------
+
+		he : isotopylog.HeatingExperiment
+			The loaded ``HeatingExperiment`` instance.
+
+		See Also
+		--------
+
+		isotopylog.load
+			Function for loading all objects in a file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import _load_one
+
+		return _load_one(cls, file, name, mmap_mode)
+
+	#define method for saving to a binary file
+	def save(self, file, compress = False):
+		'''
+		Saves the ``HeatingExperiment`` instance to a binary ``.npz`` (or, if
+		the file ends in ``'.h5'`` or ``'.hdf5'``, HDF5) file. To store many
+		objects in one file, use ``ipl.save``.
+
+		Parameters
+		----------
+
+		file : str
+			The file path.
+
+		compress : boolean
+			Whether to compress arrays. Compressed arrays cannot be memory
+			mapped when loading. Defaults to ``False``.
+
+		See Also
+		--------
+
+		isotopylog.save
+			Function for saving many objects to one file.
+		'''
+
+		#import serialization functions only when needed
+		from .serialization import save
+
+		save(file, self, compress = compress)
+
 	#define @property getters and setters
 	@property
 	def caleq(self):
@@ -1024,11 +1254,16 @@ class HeatingExperiment(object):
 		elif value in ['SE15','se15','Stolper15','Stolper2015','Stolper']:
 			self._calibration = 'SE15'
 
+		#accept any calibration added using ipl.register_calibration
+		elif isinstance(value, str) and value in cal_coeffs:
+			self._calibration = value
+
 		#raise exception if it's not an acceptable string
 		elif isinstance(value, str):
 			raise ValueError(
 				'%s is an invalid T-D calibration. Must be one of: "Bea17",'
-				'"PH12", or "SE15"' % value)
+				'"PH12", "SE15", or a calibration added using'
+				' ipl.register_calibration' % value)
 
 		#if it's a lambda function, store appropriately
 		elif isinstance(value, LambdaType):
@@ -1314,6 +1549,9 @@ class HeatingExperiment(object):
 		DataFrame containing all the summary data.
 		'''
 
+		#import pandas only when needed
+		import pandas as pd
+
 		#extract parameters
 		isos = clump_isos[self.clumps]
 		iso_stds = [i + '_std' for i in isos]
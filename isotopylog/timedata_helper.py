@@ -13,27 +13,20 @@ __docformat__ = 'restructuredtext en'
 __all__ = ['_calc_D_from_G',
 		   '_calc_G_from_D',
 		   '_cull_data',
+		   '_cull_groups',
 		   '_forward_model',
 		   '_read_csv',
+		   '_read_table',
 			]
 
 #import packages
 import numpy as np
-import pandas as pd
 
 #import types for checking
 from types import LambdaType
 
-#import necessary functions for calculations
-from .calc_funcs import(
-	_calc_R_stoch,
-	_calc_Rpr,
-	_fHea14,
-	_fPH12,
-	_fSE15,
-	_fHH20,
-	_Jacobian,
-	)
+#import model kernel registry
+from .model_kernels import get_kernel
 
 #import necessary isotopylog dictionaries
 from .dictionaries import(
@@ -211,6 +204,48 @@ def _calc_G_from_D(
 
 	return G, G_std
 
+#function for calculating equilibrium D for culling
+def _calc_Deq(T, calibration, ref_frame):
+	'''
+	Calculates equilibrium D47 for an array of temperatures using either a
+	literature calibration name or a lambda function.
+
+	Raises
+	------
+
+	KeyError
+		If the inputted calibration is not an acceptable string or a lambda
+		function.
+	'''
+
+	try:
+		return caleqs[calibration][ref_frame](T)
+
+	except KeyError:
+		if isinstance(calibration, LambdaType):
+			return calibration(T)
+
+		else:
+			raise KeyError('unexpected calibration %s' % calibration)
+
+#function for finding the culling cutoff of each experiment
+def _cull_bounds(D, Dstd, Deq, starts, ends, cull_sig):
+	'''
+	Finds the first index of each experiment, stored in rows
+	``starts[i]:ends[i]``, where ``abs(D - Deq) < cull_sig*Dstd``. Returns
+	the array of new end indices; experiments that never approach
+	equilibrium keep their original end index.
+	'''
+
+	#indices of all points within the cutoff region, with a sentinel
+	i = np.flatnonzero(abs(D - Deq) < cull_sig*Dstd)
+	i = np.append(i, len(D))
+
+	#first such index at or after the start of each experiment
+	i0 = i[np.searchsorted(i, starts)]
+
+	return np.minimum(i0, ends)
+
 # def _cull_data(calibration, clumps, dex, dex_std, ref_frame, T, tex):
 def _cull_data(dex, T, tex, file_attrs, cull_sig = 1):
 	'''
@@ -281,35 +316,92 @@ def _cull_data(dex, T, tex, file_attrs, cull_sig = 1):
 		D = dex[:,0]
 		Dstd = file_attrs['dex_std'][:,0]
 
-		cal = file_attrs['calibration']
-		rf = file_attrs['ref_frame']
-
 		#calcualte equilibrium D47 (including if calibration is lambda func)
-		try:
-			Deq = caleqs[cal][rf](T)
+		Deq = _calc_Deq(T, file_attrs['calibration'], file_attrs['ref_frame'])
 
-		except KeyError:
-			if isinstance(cal, LambdaType):
-				Deq = cal(T)
+		#determine first index where abs(D - Deq) < cull_sig*D_std
+		i0 = _cull_bounds(D, Dstd, Deq, [0], [len(D)], cull_sig)[0]
 
-			else:
-				raise KeyError('unexpected calibration %s' % cal)
+		#only keep everything before i0
+		dex = dex[:i0,:]
+		T = T[:i0]
+		tex = tex[:i0]
+		file_attrs['dex_std'] = file_attrs['dex_std'][:i0,:]
 
-		#determine first index where abs(D - Deq) < cull_sig*D_std
-		ltdeq = abs(D - Deq) < cull_sig*Dstd
-		i = np.where(ltdeq)[0]
+	return dex, T, tex, file_attrs
 
-		#try to remove everything above index i, if it exists
-		if len(i) > 0:
-			i0 = i[0]
+#function for culling many experiments at once
+def _cull_groups(dex, T, starts, ends, file_attrs, cull_sig = 1):
+	'''
+	Vectorized version of ``_cull_data`` for tables containing many
+	experiments, each stored in rows ``starts[i]:ends[i]``. Equilibrium D is
+	calculated once for all rows (once per reference frame), such that no
+	python work is done per row.
 
-			#only keep everything before i0
-			dex = dex[:i0,:]
-			T = T[:i0]
-			tex = tex[:i0]
-			file_attrs['dex_std'] = file_attrs['dex_std'][:i0,:]
+	Parameters
+	----------
 
-	return dex, T, tex, file_attrs
+	dex : np.array
+		Array containing the isotope data for all experiments.
+
+	T : np.array
+		Array containing the experimental temperature for all experiments.
+
+	starts : np.array
+		The first row of each experiment.
+
+	ends : np.array
+		One past the last row of each experiment.
+
+	file_attrs : dict
+		Dictionary containing all the extracted attributes, with
+		``'ref_frame'`` containing one entry per experiment.
+
+	cull_sig : int or float
+		The number of standard deviations deemed to be the cutoff threshold.
+		For example, if ``cull_sig = 1``, then drops everything within 1 sigma
+		of Deq.
+
+	Returns
+	-------
+
+	ends : np.array
+		One past the last row of each experiment after culling.
+
+	Raises
+	------
+
+	KeyError
+		If the inputted calibration is not an acceptable string or a lambda
+		function.
+
+	Notes
+	-----
+	As in ``_cull_data``, all data points after the first point that is deemed
+	to be within the threshold cutoff region are dropped for each experiment.
+	'''
+
+	#check which clumped isotope system
+	if file_attrs['clumps'] != 'CO47':
+		return ends
+
+	#extract the clumped isotope values and std devs
+	D = dex[:,0]
+	Dstd = file_attrs['dex_std'][:,0]
+
+	cal = file_attrs['calibration']
+
+	#reference frame of each row
+	rfs = np.repeat(file_attrs['ref_frame'], ends - starts)
+
+	#calculate equilibrium D47 for all rows using each reference frame
+	Deq = np.zeros(len(D))
+
+	for rf in set(rfs):
+		m = rfs == rf
+		Deq[m] = _calc_Deq(T[m], cal, rf)
+
+	return _cull_bounds(D, Dstd, Deq, starts, ends, cull_sig)
 
 #function for forward modeling Hea14 model
 def _forward_model(he, kd, t, z = 6, **kwargs):
@@ -357,85 +449,32 @@ def _forward_model(he, kd, t, z = 6, **kwargs):
 	p = kd.params 
 	pcov = kd.params_cov
 
-	#check which model and run it forward
-	if kd.model == 'Hea14':
-
-		#calculate G
-		G = _fHea14(t, *p, logG = False)
-		
-		#calculate Jacobian
-		J = _Jacobian(_fHea14, t, p, **kwargs)
-
-	elif kd.model == 'HH20':
-
-		#make lambda function since HH20 has more args than fit params
-		l = [np.max(kd.nu), np.min(kd.nu), len(kd.nu)] #additional inputs
-		lamfunc = lambda t, mu_nu, sig_nu: _fHH20(t, mu_nu, sig_nu, *l) 
+	#get the model kernel and any additional non-fit inputs
+	kern = get_kernel(kd.model)
+	kw = kern.iso_kwargs(he, kd, t, z = z)
 
-		#calculate G
-		G = lamfunc(t, *p)
+	#calculate G (or D, for models that return D directly) and Jacobian
+	Y = kern.isothermal(t, p, **kw)
+	J = kern.isothermal_jacobian(t, p, **kw, **kwargs)
 
-		#calculate Jacobian
-		J = _Jacobian(lamfunc, t, p, **kwargs)
+	#calculate covariance matrix and extract std. dev.
+	Ycov = np.dot(J, np.dot(pcov, J.T))
+	Y_std = np.sqrt(np.diag(Ycov))
 
-	elif kd.model == 'PH12':
-
-		#calculate G
-		G = _fPH12(t, *p, logG = False)
-		
-		#calculate Jacobian
-		J = _Jacobian(_fPH12, t, p, **kwargs)
-
-	#start another if statement since SE15 requires some model-specific steps
-	if kd.model == 'SE15':
-
-		#make lambda function since SE15 has more args than fit params
-		#calculate d0 and T arrays
-		d13C = np.mean(he.dex[:,1]) #use average of all experimental points
-		d18O = np.mean(he.dex[:,2]) #use average of all experimental points
-		
-		d0 = np.array([he.dex[0,0], d13C, d18O])
-		T = np.ones(len(t))*he.T
-
-		#fit model to lambda function with all 3 unknowns
-		lamfunc = lambda t, lnk1, lnkds, mpfit : _fSE15(
-			t,
-			lnk1,
-			lnkds,
-			mpfit,
-			d0,
-			T,
-			calibration = he.calibration,
-			iso_params = he.iso_params,
-			ref_frame = he.ref_frame,
-			z = z,
-			)[0]
-
-		#calculate D (note: this model returns D, not G!)
-		D = lamfunc(t, *p)
-
-		#calculate Jacobian
-		J = _Jacobian(lamfunc, t, p, **kwargs)
-
-		#calculate D covariance matrix and extract D_std
-		Dcov = np.dot(J, np.dot(pcov, J.T))
-		D_std = np.sqrt(np.diag(Dcov))
+	if kern.returns_D:
+		D, D_std = Y, Y_std
 
 	else:
 
-		#calcualte G covariance matrix and extract G_std
-		Gcov = np.dot(J, np.dot(pcov, J.T))
-		G_std = np.sqrt(np.diag(Gcov))
-
-		#finally, convert G and G_std to D and D_std
+		#convert G and G_std to D and D_std
 		D, D_std = _calc_D_from_G(
 			he.dex[0,0], 
-			G, 
+			Y, 
 			he.T, 
 			# calibration = he.calibration,
 			he.caleq,
 			clumps = he.clumps,
-			G_std = G_std,
+			G_std = Y_std,
 			ref_frame = he.ref_frame
 			)
 
@@ -495,6 +534,84 @@ def _read_csv(file):
 	are assumed to be zero.
 	'''
 
+	#read as a table containing a single experiment
+	_, _, _, dex, T, tex, file_attrs = _read_table(file)
+
+	for attr in ['iso_params', 'ref_frame']:
+		file_attrs[attr] = file_attrs[attr][0]
+
+	return dex, T, tex, file_attrs
+
+#function for reading a table containing many experiments
+def _read_table(file, id_col = None):
+	'''
+	Reads a csv file or pandas DataFrame containing one or many experiments
+	and extracts all columns at once. Rows are grouped by `id_col` (stably,
+	such that the row order within each experiment is retained), and each
+	experiment is stored in rows ``starts[i]:ends[i]`` of the returned arrays.
+
+	Parameters
+	----------
+
+	file : str or pd.DataFrame
+		Either a string pointing to the csv file or a pd.DataFrame object
+		containing the data to import.
+
+	id_col : str or None
+		The column identifying which experiment each row belongs to. If
+		``None``, all rows are treated as a single experiment. Defaults to
+		``None``.
+
+	Returns
+	-------
+
+	ids : np.array
+		The id of each experiment, in order of first appearance. Length
+		``nexp``.
+
+	starts : np.array
+		The first row of each experiment. Length ``nexp``.
+
+	ends : np.array
+		One past the last row of each experiment. Length ``nexp``.
+
+	dex : np.array
+		Array containing the isotope data for all rows.
+
+	T : np.array
+		Array containing the experimental temperature for all rows.
+
+	tex : np.array
+		Array containing the experimental time for all rows.
+
+	file_attrs : dict
+		Dictionary containing all the extracted attributes. ``'dex_std'`` has
+		one row per data row, whereas ``'iso_params'`` and ``'ref_frame'``
+		have one entry per experiment (taken from its first row).
+
+	Raises
+	------
+
+	KeyError
+		If the inputted csv file does not contain any of the necessary columns.
+
+	TypeError
+		If the file parameter is not a path string or pandas DataFrame.
+
+	ValueError
+		If the inputted csv file doesn't contain appropriate data for CO47
+		clumps, or if any row is missing an experiment id.
+
+	Notes
+	-----
+
+	If d13C, d18O, or any isotope uncertainty columns are not provided, they
+	are assumed to be zero.
+	'''
+
+	#import pandas only when needed
+	import pandas as pd
+
 	#check data format and raise appropriate errors
 	if isinstance(file, str):
 		
@@ -508,77 +625,81 @@ def _read_csv(file):
 
 		raise TypeError(
 			'unexpected file of type %s. Must be a string containing path to'
-			' csv file or a pandas DataFrame object.' %s )
-
-	#pre-allocate dictionary for storing everything
-	file_attrs = {}
+			' csv file or a pandas DataFrame object.' % ftn)
 
 	#do some clump-specific data extraction
-	if 'D47' in file.columns:
-
-		#extract parameters and raise exceptions if columns do not exist
-		file_attrs['clumps'] = 'CO47'
-
-		#getting iso_params and ref_frame
-		for attr in ['iso_params', 'ref_frame']:
-			try:
-				file_attrs[attr] = list(set(file[attr]))[0]
+	if 'D47' not in file.columns:
+		raise ValueError(
+			'unexpected file data; must contain column named "D47" signifying'
+			' CO47 clumps.')
 
-			except KeyError:
-				raise KeyError(
-					'csv file for import must contain a %s column' % attr)
+	#group rows by experiment, in order of first appearance
+	if id_col is None:
+		ids = np.array([None])
+		order = np.arange(len(file))
+		counts = np.array([len(file)])
 
-		#getting T_C
+	else:
 		try:
-			T = file['T_C'].values + 273.15
+			codes, ids = pd.factorize(file[id_col])
 
 		except KeyError:
 			raise KeyError(
-				'csv file for import must contain a T_C column.')
+				'csv file for import must contain a %s column' % id_col)
 
-		#getting time (note that time can have any units; just begins with "t")
-		try:
-			#get column that starts with 't' since it could have different units
-			tc = [c for c in file if c.startswith('t')][0]
-			tex = file[tc].values
-		
-		except IndexError:
-			raise KeyError(
-				'csv file must contain a time column starting with "t"')
+		if (codes < 0).any():
+			raise ValueError(
+				'unexpected missing values in %s column. All rows must belong'
+				' to an experiment.' % id_col)
 
-		#getting isotope data, if it exists
-		isos = ['D47','d13C_vpdb','d18O_vpdb']
-		iso_dict = {}
+		ids = np.asarray(ids)
+		order = np.argsort(codes, kind = 'stable')
+		counts = np.bincount(codes, minlength = len(ids))
 
-		for iso in isos:
-			try:
-				iso_dict[iso] = file[iso].values
+	ends = np.cumsum(counts)
+	starts = ends - counts
+
+	#pre-allocate dictionary for storing everything
+	file_attrs = {'clumps' : 'CO47'}
+
+	#getting iso_params and ref_frame from the first row of each experiment
+	for attr in ['iso_params', 'ref_frame']:
+		try:
+			file_attrs[attr] = file[attr].to_numpy()[order][starts]
 
-			except KeyError:
-				iso_dict[iso] = 0
+		except KeyError:
+			raise KeyError(
+				'csv file for import must contain a %s column' % attr)
 
-		dex = pd.DataFrame(iso_dict).values
+	#getting T_C
+	try:
+		T = file['T_C'].to_numpy(dtype = float)[order] + 273.15
 
+	except KeyError:
+		raise KeyError(
+			'csv file for import must contain a T_C column.')
 
-		#getting isotope uncertainty, if it exists
-		iso_stds = ['D47_std','d13C_std','d18O_std']
-		iso_std_dict = {}
+	#getting time (note that time can have any units; just begins with "t")
+	tc = next((c for c in file.columns
+		if c.startswith('t') and c != id_col), None)
 
-		for iso in iso_stds:
-			try:
-				iso_std_dict[iso] = file[iso].values
+	if tc is None:
+		raise KeyError(
+			'csv file must contain a time column starting with "t"')
 
-			except KeyError:
-				iso_std_dict[iso] = 0
+	tex = file[tc].to_numpy()[order]
 
-		file_attrs['dex_std'] = pd.DataFrame(iso_std_dict).values
+	#getting isotope data and uncertainty, filling missing columns with 0
+	isos = ['D47','d13C_vpdb','d18O_vpdb']
+	iso_stds = ['D47_std','d13C_std','d18O_std']
 
-	else:
-		raise ValueError(
-			'unexpected file data; must contain column named "D47" signifying'
-			' CO47 clumps.')
+	dex = file.reindex(columns = isos, fill_value = 0).to_numpy(
+		dtype = float)[order]
 
-	return dex, T, tex, file_attrs
+	file_attrs['dex_std'] = file.reindex(columns = iso_stds,
+		fill_value = 0).to_numpy(dtype = float)[order]
+
+	return ids, starts, ends, dex, T, tex, file_attrs
 
 
 if __name__ == '__main__':